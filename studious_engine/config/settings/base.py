@@ -99,6 +99,7 @@ LOCAL_APPS = [
     "powers.apps.PowersConfig",         # Powers (ideas, skills, technologies)
     "innovations.apps.InnovationsConfig",    # Innovation system and Vitruvian Loop
     "physics.apps.PhysicsConfig",      # Physics simulations
+    "economic.apps.EconomicConfig",    # Resources, inventories and transactions
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -147,6 +148,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.QueryCountMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -157,8 +159,28 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
+    "core.middleware.PresenceMiddleware",
 ]
 
+# QUERY COUNTING
+# ------------------------------------------------------------------------------
+# Per-request query counts, DB time and duplicate queries (core.middleware)
+QUERY_COUNT_ENABLED = env.bool("DJANGO_QUERY_COUNT_ENABLED", DEBUG)
+QUERY_COUNT_HEADERS = env.bool("DJANGO_QUERY_COUNT_HEADERS", DEBUG)
+# Raise instead of logging when a request exceeds its endpoint's query budget
+QUERY_BUDGET_RAISE = False
+# Query budgets by URL name, overriding budgets declared on views
+QUERY_BUDGETS = {}
+
+# ACTIVITY HEARTBEATS
+# ------------------------------------------------------------------------------
+# PlayerProfile.last_active is written at most once per interval (seconds) per
+# user, in batches of up to HEARTBEAT_BATCH_SIZE (core.services.heartbeat)
+HEARTBEAT_INTERVAL = env.int("DJANGO_HEARTBEAT_INTERVAL", 300)
+HEARTBEAT_BATCH_SIZE = 500
+# Requests record presence at most once per interval (seconds) per user
+PRESENCE_TOUCH_INTERVAL = 60
+
 # STATIC
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#static-root
@@ -34,5 +34,11 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "http://media.testserver/"
+# QUERY COUNTING
+# ------------------------------------------------------------------------------
+QUERY_COUNT_ENABLED = True
+QUERY_COUNT_HEADERS = True
+QUERY_BUDGET_RAISE = True
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -6,8 +6,13 @@ from django.db.models import Count, Q
 from django.http import Http404
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 import json
 
+from core.api.mixins import EagerLoadingViewSetMixin
+from core.api.pagination import KeysetPagination
 from core.models import (
     Art, 
     ArtParts, 
@@ -16,8 +21,7 @@ from core.models import (
     TechTree,
     ArtMastery,
     UserArtStageProgress,
-    UserTechTreeProgress,
-    PlayerProfile
+    UserTechTreeProgress
 )
 
 from core.serializers.art.art_serializers import (
@@ -38,9 +42,14 @@ from core.serializers.art.progress_serializers import (
 )
 
 from core.services.art.art_service import ArtService
+from core.services.art.catalog_service import DEFAULT_PAGE_SIZE, CatalogService
 from core.services.art.mastery_service import MasteryService
 from core.services.art.practice_service import PracticeService
 from core.services.art.tech_tree_service import TechTreeService
+from core.services.art.tech_tree_graph import get_tech_tree_graph
+from core.services.art.taxonomy_tree import get_taxonomy_forest
+from core.services.art.tech_tree_layout import get_tech_tree_layout
+from core.services.profile_cache import get_request_profile
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:virtue_metrics_calculation]
@@ -52,11 +61,21 @@ from core.services.art.tech_tree_service import TechTreeService
 User = get_user_model()
 
 
-class ArtViewSet(viewsets.ReadOnlyModelViewSet):
+def _tech_tree_layout_etag(request, *args, **kwargs):
+    """The shared layout only changes with the graph version."""
+    return get_tech_tree_graph().version
+
+
+def _tech_tree_levels_etag(request, *args, **kwargs):
+    return TechTreeService.get_tech_tree_etag(request.user)
+
+
+class ArtViewSet(EagerLoadingViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint for Arts collection (Pokédex)."""
     queryset = Art.objects.all()
     serializer_class = ArtSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {'list': 4, 'catalog': 6, 'by_virtue': 5, 'featured': 4}
     
     def get_queryset(self):
         """Filter arts based on query parameters."""
@@ -71,10 +90,17 @@ class ArtViewSet(viewsets.ReadOnlyModelViewSet):
             except ValueError:
                 pass
         
-        # Filter by taxonomy
+        # Filter by taxonomy, optionally including its whole subtree
         taxonomy_id = self.request.query_params.get('taxonomy')
         if taxonomy_id:
-            queryset = queryset.filter(taxonomy_id=taxonomy_id)
+            if self.request.query_params.get('include_descendants', 'false').lower() == 'true':
+                taxonomy = ArtTaxonomy.objects.filter(id=taxonomy_id).only('id', 'path').first()
+                if taxonomy is None:
+                    queryset = queryset.none()
+                else:
+                    queryset = queryset.filter(taxonomy__in=taxonomy.get_descendants())
+            else:
+                queryset = queryset.filter(taxonomy_id=taxonomy_id)
         
         # Filter by economic layer
         economic_layer = self.request.query_params.get('economic_layer')
@@ -93,17 +119,9 @@ class ArtViewSet(viewsets.ReadOnlyModelViewSet):
         # Check if we should only include available arts for the user
         available_only = self.request.query_params.get('available_only', 'false').lower() == 'true'
         if available_only:
-            try:
-                profile = PlayerProfile.objects.get(user=self.request.user)
-                available_arts = ArtService.get_available_arts(
-                    self.request.user,
-                    include_unlocked=True,
-                    economic_filter=True,
-                    rank_filter=True
-                )
-                queryset = queryset.filter(id__in=[art.id for art in available_arts])
-            except PlayerProfile.DoesNotExist:
-                pass
+            profile = get_request_profile(self.request)
+            if profile is not None:
+                queryset = queryset.filter(CatalogService.visibility_filter(profile.economic_layer, profile.rank))
         
         return queryset
     
@@ -122,10 +140,41 @@ class ArtViewSet(viewsets.ReadOnlyModelViewSet):
         except ValueError:
             count = 6
         
-        featured_arts = ArtService.get_featured_arts(limit=count)
+        featured_arts = self.eager_load(ArtService.get_featured_arts(limit=count))
         serializer = self.get_serializer(featured_arts, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'])
+    def catalog(self, request):
+        """Get the arts visible to the user, a page at a time, ordered by name."""
+        profile = get_request_profile(request)
+        if profile is None:
+            return Response(
+                {"error": "Player profile not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            limit = DEFAULT_PAGE_SIZE
+        
+        try:
+            page = CatalogService.get_catalog_page(
+                profile,
+                cursor=request.query_params.get('cursor'),
+                limit=limit,
+                queryset=self.eager_load(self.get_queryset())
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        serializer = self.get_serializer(page['results'], many=True)
+        return Response({
+            'results': serializer.data,
+            'next_cursor': page['next_cursor']
+        })
+    
     @action(detail=False, methods=['get'])
     def by_virtue(self, request):
         """Get arts that improve a specific virtue."""
@@ -142,7 +191,7 @@ class ArtViewSet(viewsets.ReadOnlyModelViewSet):
         except ValueError:
             count = 10
         
-        arts = ArtService.get_arts_by_virtue(virtue, limit=count)
+        arts = self.eager_load(ArtService.get_arts_by_virtue(virtue, limit=count))
         serializer = self.get_serializer(arts, many=True)
         return Response(serializer.data)
     
@@ -163,11 +212,13 @@ class ArtViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class ArtTaxonomyViewSet(viewsets.ReadOnlyModelViewSet):
+class ArtTaxonomyViewSet(EagerLoadingViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint for Art Taxonomy."""
     queryset = ArtTaxonomy.objects.all()
     serializer_class = ArtTaxonomySerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = 'name'
+    query_budget = {'list': 4, 'tree': 4}
     
     def get_queryset(self):
         """Filter taxonomies based on query parameters."""
@@ -192,24 +243,33 @@ class ArtTaxonomyViewSet(viewsets.ReadOnlyModelViewSet):
         
         return queryset
     
-    @action(detail=True, methods=['get'])
+    @action(detail=False, methods=['get'])
+    def tree(self, request):
+        """Get the whole taxonomy forest, or one subtree, as nested nodes."""
+        forest = get_taxonomy_forest()
+        root_id = request.query_params.get('root')
+        if root_id:
+            root = get_object_or_404(ArtTaxonomy.objects.only('id'), id=root_id)
+            return Response(forest.as_tree(root.id))
+        return Response(forest.as_tree())
+    
+    @action(detail=True, methods=['get'], pagination_class=KeysetPagination)
     def arts(self, request, pk=None):
         """Get arts in this taxonomy category."""
         taxonomy = self.get_object()
-        arts = Art.objects.filter(taxonomy=taxonomy)
+        if request.query_params.get('include_descendants', 'false').lower() == 'true':
+            arts = Art.objects.filter(taxonomy__in=taxonomy.get_descendants())
+        else:
+            arts = Art.objects.filter(taxonomy=taxonomy)
         
         # Optional filtering
         available_only = request.query_params.get('available_only', 'false').lower() == 'true'
         if available_only:
-            try:
-                profile = PlayerProfile.objects.get(user=request.user)
-                arts = arts.filter(
-                    rank_required__lte=profile.rank,
-                    economic_layer_required=profile.economic_layer
-                )
-            except PlayerProfile.DoesNotExist:
-                pass
+            profile = get_request_profile(request)
+            if profile is not None:
+                arts = arts.filter(CatalogService.visibility_filter(profile.economic_layer, profile.rank))
         
+        arts = self.eager_load(arts, ArtSerializer)
         page = self.paginate_queryset(arts)
         if page is not None:
             serializer = ArtSerializer(page, many=True)
@@ -219,10 +279,13 @@ class ArtTaxonomyViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class ArtMasteryViewSet(viewsets.ModelViewSet):
+class ArtMasteryViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for user's art mastery."""
     serializer_class = ArtMasterySerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = '-mastery_level'
+    query_budget = {'list': 4}
     
     def get_queryset(self):
         """Get masteries for the current user."""
@@ -331,11 +394,12 @@ class ArtMasteryViewSet(viewsets.ModelViewSet):
         return Response(summary)
 
 
-class TechTreeViewSet(viewsets.ReadOnlyModelViewSet):
+class TechTreeViewSet(EagerLoadingViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint for Tech Trees."""
     queryset = TechTree.objects.all()
     serializer_class = TechTreeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {'list': 4, 'layout': 5, 'levels': 5}
     
     def get_queryset(self):
         """Filter tech trees based on query parameters."""
@@ -370,6 +434,20 @@ class TechTreeViewSet(viewsets.ReadOnlyModelViewSet):
         recommended = TechTreeService.get_recommended_tech_trees(request.user, count=count)
         return Response(recommended)
     
+    @action(detail=False, methods=['get'])
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=_tech_tree_layout_etag))
+    def layout(self, request):
+        """Get the shared tech tree level layout for the current graph version."""
+        return Response(get_tech_tree_layout())
+    
+    @action(detail=False, methods=['get'])
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=_tech_tree_levels_etag))
+    def levels(self, request):
+        """Get the tech tree levels with the user's status overlaid."""
+        return Response(TechTreeService.get_tech_tree_by_levels(request.user))
+    
     @action(detail=True, methods=['get'])
     def progress(self, request, pk=None):
         """Get the user's progress for this tech tree."""
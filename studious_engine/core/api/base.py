@@ -8,6 +8,8 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 import json
 
+from core.api.mixins import EagerLoadingViewSetMixin
+from core.api.pagination import KeysetPagination
 from core.models import (
     PlayerProfile, PlayerHappiness, UserPreferences, 
     UserLocation, MarketItem, Wishlist
@@ -31,7 +33,7 @@ from core.services.user_service import UserService
 User = get_user_model()
 
 
-class PlayerProfileViewSet(viewsets.ModelViewSet):
+class PlayerProfileViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for player profiles."""
     queryset = PlayerProfile.objects.all()
     serializer_class = PlayerProfileSerializer
@@ -167,11 +169,13 @@ class PlayerProfileViewSet(viewsets.ModelViewSet):
         return Response(recommendations)
 
 
-class MarketItemViewSet(viewsets.ModelViewSet):
+class MarketItemViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for market items."""
     queryset = MarketItem.objects.all()
     serializer_class = MarketItemSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = '-created_at'
     
     def get_queryset(self):
         """Filter market items based on query parameters and user's rank/economic layer."""
@@ -262,7 +266,7 @@ class MarketItemViewSet(viewsets.ModelViewSet):
         )
 
 
-class WishlistViewSet(viewsets.ReadOnlyModelViewSet):
+class WishlistViewSet(EagerLoadingViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint for user's wishlist."""
     serializer_class = WishlistSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -0,0 +1,37 @@
+from core.serializers.eager_loading import EagerLoadingMixin
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class EagerLoadingViewSetMixin:
+    """
+    Applies the data needs declared by the viewset's serializer to every
+    queryset it lists or fetches objects from, so list endpoints run the
+    same number of queries whatever the page size.
+
+    Custom actions that serialize objects from elsewhere should pass them
+    through eager_load() first.
+    """
+
+    def filter_queryset(self, queryset):
+        return self.eager_load(super().filter_queryset(queryset))
+
+    def eager_load(self, objects, serializer_class=None):
+        """
+        Load the data a serializer reads for a queryset or list of objects.
+
+        Args:
+            objects: A queryset or list of model instances
+            serializer_class: The serializer, the viewset's by default
+
+        Returns:
+            The queryset with data needs applied, or the same list
+        """
+        serializer_class = serializer_class or self.get_serializer_class()
+        if issubclass(serializer_class, EagerLoadingMixin):
+            return serializer_class.eager_load(objects)
+        return objects
@@ -0,0 +1,216 @@
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+def estimate_count(queryset):
+    """
+    Estimate the number of rows a queryset returns from the planner's row
+    estimate, without running it.
+
+    Args:
+        queryset: The queryset to estimate
+
+    Returns:
+        int: Estimated row count
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on a (sort key, primary key) tuple.
+
+    Each page is a range scan starting after the last row of the previous
+    page, so deep pages cost the same as the first and no COUNT(*) is run
+    unless asked for. The cursor is opaque to clients.
+
+    Viewsets choose the sort key with a `keyset_ordering` attribute such as
+    'name' or '-created_at'; otherwise the model's first Meta ordering field
+    is used when it is a plain column, falling back to the primary key. The
+    sort key should be non-null and indexed together with the primary key.
+    Viewsets opt in with `pagination_class = KeysetPagination`; an action
+    can take it alone through `@action(pagination_class=...)`.
+
+    Clients may add `count=exact` or `count=approximate` (planner estimate)
+    to get a total with the page; viewsets may set `keyset_count` to either
+    to include it by default.
+    """
+    page_size = api_settings.PAGE_SIZE or 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.sort_field, self.descending = self.get_ordering(queryset, view)
+        self.count = self.get_count(queryset, request, view)
+
+        order = [f"-{self.sort_field}", '-pk'] if self.descending else [self.sort_field, 'pk']
+        if self.sort_field == 'pk':
+            order = order[:1]
+        queryset = queryset.order_by(*order)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            try:
+                queryset = queryset.filter(self.after(*self.decode_cursor(cursor)))
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message) from None
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset, view):
+        """
+        Get the field pages are keyed on and whether it runs descending.
+
+        Returns:
+            Tuple[str, bool]: The field name and descending flag
+        """
+        ordering = getattr(view, 'keyset_ordering', None)
+        if ordering is None:
+            ordering = next(iter(queryset.model._meta.ordering or ()), 'pk')
+            if not isinstance(ordering, str) or not self.is_plain_field(queryset.model, ordering.lstrip('-')):
+                ordering = 'pk'
+        return ordering.lstrip('-'), ordering.startswith('-')
+
+    @staticmethod
+    def is_plain_field(model, field_name):
+        """Check if a field is a local, non-relational column that can key pages."""
+        if field_name == 'pk':
+            return True
+        return any(
+            field.concrete and not field.is_relation and field.name == field_name
+            for field in model._meta.get_fields()
+        )
+
+    def get_count(self, queryset, request, view):
+        mode = request.query_params.get(self.count_query_param, getattr(view, 'keyset_count', None))
+        if mode == 'exact':
+            return queryset.count()
+        if mode == 'approximate':
+            return estimate_count(queryset)
+        return None
+
+    def after(self, value, pk):
+        """Build the filter selecting rows after the (value, pk) position."""
+        op = 'lt' if self.descending else 'gt'
+        if self.sort_field == 'pk':
+            return Q(**{f'pk__{op}': pk})
+        return Q(**{f'{self.sort_field}__{op}': value}) | Q(**{self.sort_field: value, f'pk__{op}': pk})
+
+    def encode_cursor(self, obj):
+        value = None if self.sort_field == 'pk' else getattr(obj, self.sort_field)
+        if hasattr(value, 'pk'):
+            value = value.pk
+        elif isinstance(value, (datetime.datetime, datetime.time)):
+            # DjangoJSONEncoder cuts these to milliseconds, which would skip
+            # or repeat rows sharing the last row's millisecond
+            value = value.isoformat()
+        raw = json.dumps([value, obj.pk], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if value is not None and self.sort_field != 'pk':
+            value = self.model._meta.get_field(self.sort_field).to_python(value)
+        return value, pk
+
+    def get_next_cursor(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_next_link(self):
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['next_cursor'] = self.get_next_cursor()
+        response['results'] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'example': 123},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'next_cursor': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "Include a total: 'exact' or 'approximate'.",
+                'schema': {'type': 'string', 'enum': ['exact', 'approximate']},
+            },
+        ]
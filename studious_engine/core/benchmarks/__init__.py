@@ -0,0 +1,20 @@
+# Benchmark fixtures and scenarios for the bench management command
+from .fixtures import SCALES, BenchFixtureBuilder, bench_fixtures_exist, flush_bench_fixtures
+from .scenarios import SCENARIOS, BenchData, Scenario, run_scenario
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+__all__ = [
+    'SCALES',
+    'SCENARIOS',
+    'BenchData',
+    'BenchFixtureBuilder',
+    'Scenario',
+    'bench_fixtures_exist',
+    'flush_bench_fixtures',
+    'run_scenario',
+]
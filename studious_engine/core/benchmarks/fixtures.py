@@ -0,0 +1,521 @@
+import random
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from core.models import MarketItem, PlayerProfile
+from core.models.art.art import Art, ArtParts, ArtStage, ArtTaxonomy, ArtVirtue
+from core.models.art.tech_tree import TechTree
+from core.models.art.user_progress import ArtMastery, PracticeSession, UserTechTreeProgress
+from core.services.art.practice_service import PracticeService
+from core.services.art.taxonomy_tree import invalidate_taxonomy_forest
+from core.services.art.tech_tree_graph import invalidate_tech_tree_graph
+from economic.models import EconomicTransaction, InventoryLine, Ledger, ResourceInventory
+from economic.services import LedgerService
+from experiences.models import Experience
+from zones.models import Sector, Zone
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+# Row counts for each preset; 'large' is the production-sized data set
+SCALES = {
+    'tiny': {
+        'users': 20, 'arts': 12, 'sessions': 200, 'tech_trees': 6,
+        'market_items': 50, 'zones_per_sector': 3, 'experiences': 20,
+    },
+    'small': {
+        'users': 1_000, 'arts': 200, 'sessions': 50_000, 'tech_trees': 20,
+        'market_items': 1_000, 'zones_per_sector': 20, 'experiences': 500,
+    },
+    'medium': {
+        'users': 10_000, 'arts': 2_000, 'sessions': 500_000, 'tech_trees': 100,
+        'market_items': 10_000, 'zones_per_sector': 100, 'experiences': 5_000,
+    },
+    'large': {
+        'users': 100_000, 'arts': 10_000, 'sessions': 2_000_000, 'tech_trees': 500,
+        'market_items': 50_000, 'zones_per_sector': 420, 'experiences': 20_000,
+    },
+}
+
+# Every benchmark row is named with one of these so it can be found and flushed
+USERNAME_PREFIX = 'bench_user_'
+NAME_PREFIX = 'Bench'
+
+# Map fixtures are spread over a 2 x 2 degree square around this point
+MAP_CENTER = (40.0, -75.0)
+MAP_SPREAD = 1.0
+
+MASTERIES_PER_USER = 5
+TREE_PROGRESS_PER_USER = 3
+PARTS_PER_ART = 4
+STAGE_THRESHOLDS = (0, 25, 50, 75)
+SESSION_WINDOW_DAYS = 365
+VIRTUES = ['wisdom', 'courage', 'temperance', 'justice', 'creativity', 'curiosity']
+
+# Every benchmark player holds an inventory of these, large enough that
+# transfers never run it dry
+INVENTORY_RESOURCES = ('coin', 'wood', 'stone')
+INVENTORY_QUANTITY = 1_000_000
+INVENTORY_CAPACITY = 10_000_000
+
+# Inventory owner IDs are UUIDs, so player inventories are owned by a UUID
+# derived from the profile's integer primary key
+INVENTORY_OWNER_NAMESPACE = uuid.UUID('6f1c2b1e-3d4a-4c5b-9e8f-0a1b2c3d4e5f')
+
+# Fixed epoch so timestamps are the same on every run
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def inventory_owner_id(profile_id):
+    """Get the owner ID of a benchmark player's inventory."""
+    return uuid.uuid5(INVENTORY_OWNER_NAMESPACE, str(profile_id))
+
+
+def bench_inventories(profile_ids):
+    """
+    Get the inventories of benchmark players.
+
+    Args:
+        profile_ids: The PlayerProfile IDs
+
+    Returns:
+        QuerySet: ResourceInventory objects
+    """
+    return ResourceInventory.objects.filter(
+        content_type=ContentType.objects.get_for_model(PlayerProfile),
+        object_id__in=[inventory_owner_id(profile_id) for profile_id in profile_ids],
+    )
+
+
+def bench_fixtures_exist():
+    """Check if benchmark fixtures have already been seeded."""
+    return User.objects.filter(username__startswith=USERNAME_PREFIX).exists()
+
+
+def flush_bench_fixtures():
+    """
+    Delete every benchmark row, leaving other data alone.
+
+    Returns:
+        Dict: Number of rows deleted per model label
+    """
+    deleted = {}
+    inventories = bench_inventories(
+        PlayerProfile.objects.filter(user__username__startswith=USERNAME_PREFIX).values_list('id', flat=True)
+    )
+    ledger_names = [
+        LedgerService.inventory_ledger(inventory_id) for inventory_id in inventories.values_list('id', flat=True)
+    ]
+    querysets = [
+        # Inventories are owned generically, so deleting users leaves them behind
+        EconomicTransaction.objects.filter(source_inventory__in=inventories),
+        EconomicTransaction.objects.filter(destination_inventory__in=inventories),
+        Ledger.objects.filter(name__in=ledger_names),
+        inventories,
+        Experience.objects.filter(name__startswith=NAME_PREFIX),
+        MarketItem.objects.filter(name__startswith=NAME_PREFIX),
+        Zone.objects.filter(zone_type__startswith=NAME_PREFIX),
+        TechTree.objects.filter(name__startswith=NAME_PREFIX),
+        User.objects.filter(username__startswith=USERNAME_PREFIX),
+        Art.objects.filter(name__startswith=NAME_PREFIX),
+        ArtTaxonomy.objects.filter(name__startswith=NAME_PREFIX),
+    ]
+    with transaction.atomic():
+        for queryset in querysets:
+            _count, per_model = queryset.delete()
+            for label, count in per_model.items():
+                deleted[label] = deleted.get(label, 0) + count
+        _invalidate_caches()
+    return deleted
+
+
+def _invalidate_caches():
+    invalidate_tech_tree_graph()
+    invalidate_taxonomy_forest()
+
+
+class BenchFixtureBuilder:
+    """
+    Seeds deterministic, scaled fixtures for the benchmark scenarios.
+
+    All rows are written with bulk_create in batches, so model save()
+    methods and post_save signals do not run; derived rows they would
+    normally maintain (virtue index, daily rollups) are written directly
+    and the shared caches are invalidated at the end. The same seed and
+    sizes always produce the same data.
+    """
+
+    def __init__(self, sizes, seed=0, batch_size=5000, log=None):
+        """
+        Args:
+            sizes: Dict of row counts, as in SCALES
+            seed: Random seed
+            batch_size: Rows written per INSERT
+            log: Optional callable taking a progress message
+        """
+        self.sizes = sizes
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.log = log or (lambda message: None)
+
+    def _uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _point(self):
+        return (
+            MAP_CENTER[0] + self.rng.uniform(-MAP_SPREAD, MAP_SPREAD),
+            MAP_CENTER[1] + self.rng.uniform(-MAP_SPREAD, MAP_SPREAD),
+        )
+
+    def _bulk(self, model, rows):
+        """Write an iterable of unsaved objects in batches, returning how many were written."""
+        written = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                model.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+            written += len(batch)
+        return written
+
+    def build(self):
+        """
+        Seed all fixtures in one transaction.
+
+        Returns:
+            Dict: Number of rows written per fixture type
+        """
+        counts = {}
+        with transaction.atomic():
+            taxonomy_ids = self.build_taxonomies()
+            counts['taxonomies'] = len(taxonomy_ids)
+            arts = self.build_arts(taxonomy_ids)
+            counts['arts'] = len(arts)
+            part_ids = self.build_parts_and_stages(arts)
+            counts['tech_trees'] = self.build_tech_trees(arts)
+            user_ids = self.build_users()
+            counts['users'] = len(user_ids)
+            counts['inventories'] = self.build_inventories()
+            masteries = self.build_masteries(user_ids, arts)
+            counts['masteries'] = len(masteries)
+            counts['sessions'] = self.build_sessions(masteries, part_ids)
+            counts['tech_tree_progress'] = self.build_tech_tree_progress(user_ids)
+            counts['market_items'] = self.build_market_items()
+            counts['zones'] = self.build_zones()
+            counts['experiences'] = self.build_experiences()
+            self.log('Rebuilding daily practice rollups...')
+            counts['daily_rollups'], _deleted = PracticeService.rebuild_daily_rollups(batch_size=self.batch_size)
+            _invalidate_caches()
+        return counts
+
+    def build_taxonomies(self):
+        """Create six categories with five subcategories each, returning the subcategory IDs."""
+        self.log('Seeding taxonomies...')
+        subcategory_ids = []
+        for category_index in range(6):
+            category = ArtTaxonomy(id=self._uuid(), name=f'{NAME_PREFIX} Category {category_index}', level=1)
+            category.save()
+            for subcategory_index in range(5):
+                subcategory = ArtTaxonomy(
+                    id=self._uuid(),
+                    name=f'{NAME_PREFIX} Category {category_index}.{subcategory_index}',
+                    parent=category,
+                    level=2
+                )
+                subcategory.save()
+                subcategory_ids.append(subcategory.id)
+        return subcategory_ids
+
+    def build_arts(self, taxonomy_ids):
+        """Create arts with their virtue index rows, returning (id, tech tree level) pairs."""
+        self.log(f"Seeding {self.sizes['arts']} arts...")
+        layers = [layer for layer, _label in Art.ECONOMIC_LAYERS]
+        arts = []
+        for index in range(self.sizes['arts']):
+            virtues = self.rng.sample(VIRTUES, 2)
+            arts.append(Art(
+                id=self._uuid(),
+                name=f'{NAME_PREFIX} Art {index:05d}',
+                description=f'Benchmark art {index}',
+                difficulty_level=self.rng.randint(1, 5),
+                taxonomy_id=self.rng.choice(taxonomy_ids),
+                improved_virtues={virtue: self.rng.randint(1, 10) for virtue in virtues},
+                tech_tree_level=self.rng.randint(1, 5),
+                rank_required=self.rng.choices([1, 2, 3, 4], weights=[6, 3, 2, 1])[0],
+                economic_layer_required=self.rng.choices(layers, weights=[6, 3, 1])[0],
+            ))
+        self._bulk(Art, arts)
+        self._bulk(ArtVirtue, (row for art in arts for row in ArtVirtue.rows_for(art)))
+        return [(art.id, art.tech_tree_level) for art in arts]
+
+    def build_parts_and_stages(self, arts):
+        """Create parts and stages for every art, returning part IDs keyed by art ID."""
+        self.log('Seeding art parts and stages...')
+        part_ids = {}
+        parts = []
+        for art_id, _level in arts:
+            for index in range(PARTS_PER_ART):
+                part = ArtParts(
+                    id=self._uuid(),
+                    art_id=art_id,
+                    name=f'Part {index + 1}',
+                    description='Benchmark part',
+                    order_index=index,
+                    practice_description='Practice it',
+                )
+                parts.append(part)
+                part_ids.setdefault(art_id, []).append(part.id)
+        self._bulk(ArtParts, parts)
+        self._bulk(ArtStage, (
+            ArtStage(
+                id=self._uuid(),
+                art_id=art_id,
+                name=f'Stage {index + 1}',
+                description='Benchmark stage',
+                order_index=index,
+                mastery_threshold=threshold,
+            )
+            for art_id, _level in arts
+            for index, threshold in enumerate(STAGE_THRESHOLDS)
+        ))
+        return part_ids
+
+    def build_tech_trees(self, arts):
+        """Create tech trees in five levels, each linked to one or two parents a level down."""
+        self.log(f"Seeding {self.sizes['tech_trees']} tech trees...")
+        art_ids_by_level = {}
+        for art_id, level in arts:
+            art_ids_by_level.setdefault(level, []).append(art_id)
+
+        trees = []
+        for index in range(self.sizes['tech_trees']):
+            level = index * 5 // self.sizes['tech_trees'] + 1
+            candidates = art_ids_by_level.get(level) or [art_id for art_id, _level in arts]
+            trees.append(TechTree(
+                id=self._uuid(),
+                name=f'{NAME_PREFIX} Tree {index:04d}',
+                description=f'Benchmark tech tree {index}',
+                level=level,
+                required_arts=self.rng.sample(candidates, min(3, len(candidates))),
+                position_x=index,
+                position_y=level,
+            ))
+        self._bulk(TechTree, trees)
+
+        trees_by_level = {}
+        for tree in trees:
+            trees_by_level.setdefault(tree.level, []).append(tree.id)
+        edge_model = TechTree.parent_nodes.through
+        edges = []
+        for tree in trees:
+            parents = trees_by_level.get(tree.level - 1)
+            if parents:
+                for parent_id in self.rng.sample(parents, min(len(parents), self.rng.randint(1, 2))):
+                    edges.append(edge_model(from_techtree_id=tree.id, to_techtree_id=parent_id))
+        self._bulk(edge_model, edges)
+        self.tree_ids = [tree.id for tree in trees]
+        return len(trees)
+
+    def build_users(self):
+        """Create users and their player profiles, returning the user IDs."""
+        self.log(f"Seeding {self.sizes['users']} users...")
+        users = [
+            User(
+                username=f'{USERNAME_PREFIX}{index:06d}',
+                email=f'{USERNAME_PREFIX}{index:06d}@example.com',
+                password='!',
+            )
+            for index in range(self.sizes['users'])
+        ]
+        for start in range(0, len(users), self.batch_size):
+            User.objects.bulk_create(users[start:start + self.batch_size])
+
+        layers = [layer for layer, _label in PlayerProfile.ECONOMIC_LAYER_CHOICES]
+
+        def profiles():
+            for user in users:
+                latitude, longitude = self._point()
+                yield PlayerProfile(
+                    user_id=user.id,
+                    rank=self.rng.choices([1, 2, 3, 4], weights=[6, 3, 2, 1])[0],
+                    economic_layer=self.rng.choices(layers, weights=[6, 3, 1])[0],
+                    experience_points=self.rng.randint(0, 50_000),
+                    latitude=latitude,
+                    longitude=longitude,
+                )
+        self._bulk(PlayerProfile, profiles())
+        return [user.id for user in users]
+
+    def build_inventories(self):
+        """Give every benchmark player a stocked inventory and its own ledger."""
+        self.log('Seeding player inventories...')
+        content_type = ContentType.objects.get_for_model(PlayerProfile)
+        profile_ids = PlayerProfile.objects.filter(
+            user__username__startswith=USERNAME_PREFIX
+        ).order_by('id').values_list('id', flat=True)
+        inventories = [
+            ResourceInventory(
+                id=self._uuid(),
+                content_type=content_type,
+                object_id=inventory_owner_id(profile_id),
+                total_quantity=INVENTORY_QUANTITY * len(INVENTORY_RESOURCES),
+                max_capacity=INVENTORY_CAPACITY,
+            )
+            for profile_id in profile_ids
+        ]
+        self._bulk(ResourceInventory, inventories)
+        self._bulk(InventoryLine, (
+            InventoryLine(inventory_id=inventory.id, resource_code=resource_code, quantity=INVENTORY_QUANTITY)
+            for inventory in inventories
+            for resource_code in INVENTORY_RESOURCES
+        ))
+        self._bulk(Ledger, (Ledger(name=LedgerService.inventory_ledger(inventory.id)) for inventory in inventories))
+        return len(inventories)
+
+    def build_masteries(self, user_ids, arts):
+        """Give each user masteries in a few arts, returning (user ID, art ID) pairs."""
+        self.log('Seeding art masteries...')
+        art_ids = [art_id for art_id, _level in arts]
+        per_user = min(MASTERIES_PER_USER, len(art_ids))
+        pairs = [(user_id, art_id) for user_id in user_ids for art_id in self.rng.sample(art_ids, per_user)]
+        self._bulk(ArtMastery, (
+            ArtMastery(
+                id=self._uuid(),
+                user_id=user_id,
+                art_id=art_id,
+                discovery_date=EPOCH,
+                mastery_level=self.rng.randint(0, 100),
+                last_practiced=EPOCH + timedelta(days=self.rng.randint(0, SESSION_WINDOW_DAYS)),
+            )
+            for user_id, art_id in pairs
+        ))
+        return pairs
+
+    def build_sessions(self, masteries, part_ids):
+        """Spread practice sessions over the masteries and the last year."""
+        self.log(f"Seeding {self.sizes['sessions']} practice sessions...")
+
+        def sessions():
+            for _index in range(self.sizes['sessions']):
+                user_id, art_id = self.rng.choice(masteries)
+                completed = self.rng.random() < 0.3
+                yield PracticeSession(
+                    id=self._uuid(),
+                    user_id=user_id,
+                    art_id=art_id,
+                    part_id=self.rng.choice(part_ids[art_id]),
+                    started_at=EPOCH + timedelta(minutes=self.rng.randint(0, SESSION_WINDOW_DAYS * 24 * 60)),
+                    duration_minutes=self.rng.randint(5, 120),
+                    validated=completed,
+                    completed=completed,
+                )
+        return self._bulk(PracticeSession, sessions())
+
+    def build_tech_tree_progress(self, user_ids):
+        """Give each user progress in a few tech trees, some of them complete."""
+        self.log('Seeding tech tree progress...')
+        per_user = min(TREE_PROGRESS_PER_USER, len(self.tree_ids))
+
+        def progress():
+            for user_id in user_ids:
+                for tree_id in self.rng.sample(self.tree_ids, per_user):
+                    percentage = self.rng.choice([0, 25, 50, 100])
+                    yield UserTechTreeProgress(
+                        id=self._uuid(),
+                        user_id=user_id,
+                        tech_tree_id=tree_id,
+                        progress_percentage=percentage,
+                        is_unlocked=percentage == 100,
+                    )
+        return self._bulk(UserTechTreeProgress, progress())
+
+    def build_market_items(self):
+        """Create market items across every category, layer and rank."""
+        self.log(f"Seeding {self.sizes['market_items']} market items...")
+        categories = [category for category, _label in MarketItem.CATEGORY_CHOICES]
+        layers = [layer for layer, _label in MarketItem.LAYER_CHOICES]
+        price_types = ['credits', 'merit', 'contribution']
+        return self._bulk(MarketItem, (
+            MarketItem(
+                name=f'{NAME_PREFIX} Item {index:05d}',
+                description=f'Benchmark market item {index}',
+                economic_layer=self.rng.choice(layers),
+                category=self.rng.choice(categories),
+                price=str(self.rng.randint(1, 1000)),
+                price_type=self.rng.choice(price_types),
+                min_rank_required=self.rng.randint(1, 4),
+                available_until=(
+                    EPOCH + timedelta(days=self.rng.randint(0, 3 * SESSION_WINDOW_DAYS))
+                    if self.rng.random() < 0.3 else None
+                ),
+                is_featured=self.rng.random() < 0.05,
+                recommendation_score=self.rng.random(),
+            )
+            for index in range(self.sizes['market_items'])
+        ))
+
+    def build_zones(self):
+        """Create zones in each of the twelve sectors."""
+        self.log('Seeding zones...')
+        sectors = []
+        for number, name in Sector.SECTOR_CHOICES:
+            sector, _created = Sector.objects.get_or_create(number=number, defaults={'name': name})
+            sectors.append(sector)
+
+        areas = [area for area, _label in Zone.ZONE_AREA_CHOICES]
+        zones = []
+        for sector in sectors:
+            for number in range(1, self.sizes['zones_per_sector'] + 1):
+                city = self._point()
+                country = self._point()
+                zones.append(Zone(
+                    sector=sector,
+                    zone_number=number,
+                    zone_type=f'{NAME_PREFIX} {sector.name}',
+                    area=self.rng.choice(areas),
+                    rank=self.rng.randint(1, 4),
+                    city_latitude=city[0],
+                    city_longitude=city[1],
+                    country_latitude=country[0],
+                    country_longitude=country[1],
+                ))
+        for start in range(0, len(zones), self.batch_size):
+            Zone.objects.bulk_create(zones[start:start + self.batch_size], ignore_conflicts=True)
+        return Zone.objects.filter(zone_type__startswith=NAME_PREFIX).count()
+
+    def build_experiences(self):
+        """Create active experiences spread over the map."""
+        self.log(f"Seeding {self.sizes['experiences']} experiences...")
+
+        def experiences():
+            for index in range(self.sizes['experiences']):
+                latitude, longitude = self._point()
+                yield Experience(
+                    name=f'{NAME_PREFIX} Experience {index:05d}',
+                    description='Benchmark experience',
+                    experience_type=self.rng.choice(Experience.TYPE_CHOICES)[0],
+                    matrix_position=self.rng.choice(Experience.MATRIX_CHOICES)[0],
+                    art_type=self.rng.choice(Experience.ART_TYPE_CHOICES)[0],
+                    good_type=self.rng.choice(Experience.GOOD_TYPE_CHOICES)[0],
+                    latitude=latitude,
+                    longitude=longitude,
+                    difficulty=self.rng.randint(1, 10),
+                    duration_minutes=self.rng.randint(10, 240),
+                    happiness_reward=self.rng.randint(0, 50),
+                    experience_reward=self.rng.randint(0, 500),
+                    definition='-', end='-', parts='-', matter='-', instrument='-',
+                )
+        return self._bulk(Experience, experiences())
@@ -0,0 +1,288 @@
+import math
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.utils import timezone
+
+from core.benchmarks.fixtures import (
+    INVENTORY_RESOURCES,
+    MAP_CENTER,
+    MAP_SPREAD,
+    USERNAME_PREFIX,
+    bench_inventories,
+)
+from core.models import MarketItem, PlayerProfile
+from core.models.art.art import Art, ArtParts
+from core.models.art.user_progress import ArtMastery
+from core.query_budget import QueryRecorder
+from core.services.art.practice_service import PracticeService
+from core.services.art.tech_tree_service import TechTreeService
+from core.views.core import StoreView
+from economic.models import EconomicTransaction, ResourceInventory
+from economic.services import LedgerService, SettlementService
+from zones.views.zones import map_elements_api
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+SCENARIOS = {}
+
+# Number of benchmark users the scenarios draw their targets from
+SAMPLE_USERS = 500
+
+# Pending transactions settled together in one settlement run
+SETTLEMENT_BATCH = 20
+
+
+def scenario(cls):
+    """Register a Scenario subclass under its name."""
+    SCENARIOS[cls.name] = cls
+    return cls
+
+
+def percentile(values, fraction):
+    """
+    Get a percentile of a list of numbers by the nearest-rank method.
+
+    Args:
+        values: The numbers
+        fraction: The percentile as a fraction, e.g. 0.95
+
+    Returns:
+        float: The percentile, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BenchData:
+    """
+    Deterministic samples of benchmark fixture IDs shared by the scenarios.
+
+    Loaded once, before timing starts, so picking targets is not measured.
+    """
+
+    def __init__(self):
+        self.user_ids = list(
+            User.objects.filter(username__startswith=USERNAME_PREFIX)
+            .order_by('username')
+            .values_list('id', flat=True)[:SAMPLE_USERS]
+        )
+        if not self.user_ids:
+            raise ValueError('No benchmark fixtures found; seed them first')
+        self.masteries = list(
+            ArtMastery.objects.filter(user_id__in=self.user_ids)
+            .order_by('user_id', 'art_id')
+            .values_list('user_id', 'art_id')
+        )
+        self.part_ids = {}
+        for art_id, part_id in ArtParts.objects.filter(
+            art_id__in={art_id for _user_id, art_id in self.masteries}
+        ).order_by('art_id', 'order_index').values_list('art_id', 'id'):
+            self.part_ids.setdefault(art_id, []).append(part_id)
+
+        self.inventory_ids = list(
+            bench_inventories(
+                PlayerProfile.objects.filter(user_id__in=self.user_ids).values_list('id', flat=True)
+            ).order_by('pk').values_list('id', flat=True)
+        )
+
+
+class Scenario:
+    """
+    A timed operation on a hot path.
+
+    prepare() picks the targets for one iteration and is not timed; run()
+    performs the operation and is timed along with its queries.
+    """
+    name = None
+    description = ''
+
+    def __init__(self, data):
+        self.data = data
+
+    def prepare(self, rng):
+        return ()
+
+    def run(self, *args):
+        raise NotImplementedError
+
+
+@scenario
+class PracticeLoggingScenario(Scenario):
+    name = 'practice_logging'
+    description = 'PracticeService.log_practice, including its on-commit effects'
+
+    def prepare(self, rng):
+        user_id, art_id = rng.choice(self.data.masteries)
+        return (
+            User.objects.get(pk=user_id),
+            Art.objects.get(pk=art_id),
+            ArtParts.objects.get(pk=rng.choice(self.data.part_ids[art_id])),
+            rng.randint(5, 90),
+        )
+
+    def run(self, user, art, part, duration):
+        PracticeService.log_practice(user, art, part, duration)
+
+
+@scenario
+class TechTreeAvailabilityScenario(Scenario):
+    name = 'tech_tree_availability'
+    description = 'TechTreeService.get_available_tech_trees for one user'
+
+    def prepare(self, rng):
+        return (User.objects.get(pk=rng.choice(self.data.user_ids)),)
+
+    def run(self, user):
+        TechTreeService.get_available_tech_trees(user)
+
+
+@scenario
+class StoreFilteringScenario(Scenario):
+    name = 'store_filtering'
+    description = 'StoreView filters: the first page of items and the filtered count'
+
+    def prepare(self, rng):
+        params = {
+            'category': rng.choice(['', *[value for value, _label in MarketItem.CATEGORY_CHOICES]]),
+            'layer': rng.choice(['', *[value for value, _label in MarketItem.LAYER_CHOICES]]),
+            'rank': rng.choice(['', '1', '2', '3', '4']),
+            'availability': rng.choice(['', 'available', 'limited']),
+            'sort': rng.choice(['recommended', 'newest', 'name']),
+        }
+        if rng.random() < 0.25:
+            params['q'] = f'Item {rng.randint(0, 99):02d}'
+        request = RequestFactory().get('/store/', {key: value for key, value in params.items() if value})
+        request.user = User.objects.get(pk=rng.choice(self.data.user_ids))
+        return (request,)
+
+    def run(self, request):
+        view = StoreView()
+        view.setup(request)
+        items = view.get_filtered_items(MarketItem.objects.all())
+        list(items[:48])
+        items.count()
+
+
+@scenario
+class MapLookupScenario(Scenario):
+    name = 'map_lookup'
+    description = 'map_elements_api: zones and experiences around a point'
+
+    def prepare(self, rng):
+        latitude = MAP_CENTER[0] + rng.uniform(-MAP_SPREAD, MAP_SPREAD)
+        longitude = MAP_CENTER[1] + rng.uniform(-MAP_SPREAD, MAP_SPREAD)
+        return (RequestFactory().get('/zones/api/map-elements/', {'lat': latitude, 'lng': longitude}),)
+
+    def run(self, request):
+        map_elements_api(request)
+
+
+@scenario
+class EconomicTransferScenario(Scenario):
+    name = 'economic_transfer'
+    description = 'LedgerService.transfer between two player inventories'
+
+    def prepare(self, rng):
+        if len(self.data.inventory_ids) < 2:
+            raise ValueError('No player inventories to transfer between')
+        source_id, destination_id = rng.sample(self.data.inventory_ids, 2)
+        return (
+            ResourceInventory.objects.get(pk=source_id),
+            ResourceInventory.objects.get(pk=destination_id),
+            {rng.choice(INVENTORY_RESOURCES): rng.randint(1, 100)},
+        )
+
+    def run(self, source, destination, resources):
+        LedgerService.transfer(source, destination, resources)
+
+
+@scenario
+class EconomicSettlementScenario(Scenario):
+    name = 'economic_settlement'
+    description = f'SettlementService.settle for {SETTLEMENT_BATCH} pending transfers between player inventories'
+
+    def prepare(self, rng):
+        if len(self.data.inventory_ids) < 2:
+            raise ValueError('No player inventories to settle between')
+        inventories = ResourceInventory.objects.in_bulk(self.data.inventory_ids)
+        now = timezone.now()
+        pending = []
+        for _index in range(SETTLEMENT_BATCH):
+            source, destination = (inventories[pk] for pk in rng.sample(self.data.inventory_ids, 2))
+            pending.append(EconomicTransaction(
+                transaction_type='transfer',
+                resources={rng.choice(INVENTORY_RESOURCES): rng.randint(1, 100)},
+                value=0,
+                source_content_type_id=source.content_type_id,
+                source_object_id=source.object_id,
+                destination_content_type_id=destination.content_type_id,
+                destination_object_id=destination.object_id,
+                source_inventory_id=source.pk,
+                destination_inventory_id=destination.pk,
+                initiated_at=now,
+            ))
+        EconomicTransaction.objects.bulk_create(pending)
+        return ([economic_transaction.pk for economic_transaction in pending],)
+
+    def run(self, transaction_ids):
+        SettlementService.settle(transaction_ids)
+
+
+def run_scenario(name, data, iterations=50, warmup=5, seed=0):
+    """
+    Time a scenario over a number of iterations.
+
+    Warm-up iterations run first with the same targets generator and are
+    not included in the results.
+
+    Args:
+        name: The scenario name, a key of SCENARIOS
+        data: The BenchData to draw targets from
+        iterations: Number of timed iterations
+        warmup: Number of untimed iterations to run first
+        seed: Random seed for picking targets
+
+    Returns:
+        Dict: Latency percentiles in milliseconds and query counts
+    """
+    if name not in SCENARIOS:
+        raise ValueError(f"Unknown scenario {name}")
+    bench = SCENARIOS[name](data)
+    rng = random.Random(f'{seed}:{name}')
+
+    latencies = []
+    query_counts = []
+    for index in range(warmup + iterations):
+        args = bench.prepare(rng)
+        with QueryRecorder() as recorder:
+            start = time.perf_counter()
+            bench.run(*args)
+            elapsed = (time.perf_counter() - start) * 1000
+        if index >= warmup:
+            latencies.append(elapsed)
+            query_counts.append(recorder.count)
+
+    return {
+        'description': bench.description,
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'max_ms': round(max(latencies), 3),
+        'queries_p50': percentile(query_counts, 0.5),
+        'queries_p95': percentile(query_counts, 0.95),
+        'queries_max': max(query_counts),
+    }
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+
+from core.services.art.practice_service import PracticeService
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:experience_progression]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+class Command(BaseCommand):
+    help = 'Rebuilds daily practice rollups from practice sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Only rebuild rollups for the user with this username')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rollups to write per query')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            User = get_user_model()
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} does not exist") from None
+
+        self.stdout.write(self.style.SUCCESS('Rebuilding daily practice rollups...'))
+        written, deleted = PracticeService.rebuild_daily_rollups(user=user, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {written} daily practice rollups and removed {deleted} stale rollups'
+        ))
@@ -0,0 +1,141 @@
+import json
+import subprocess
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from core.benchmarks import (
+    SCALES,
+    SCENARIOS,
+    BenchData,
+    BenchFixtureBuilder,
+    bench_fixtures_exist,
+    flush_bench_fixtures,
+    run_scenario,
+)
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class Command(BaseCommand):
+    help = 'Seeds scaled benchmark fixtures, times the hot paths and reports p50/p95 latency and query counts as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(SCALES), default='small', help='Fixture size preset')
+        for size in ('users', 'arts', 'sessions'):
+            parser.add_argument(f'--{size}', type=int, help=f'Override the number of {size} in the preset')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for fixtures and scenario targets')
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=sorted(SCENARIOS),
+            help='Scenario to run; may be repeated. Runs all by default',
+        )
+        parser.add_argument('--iterations', type=int, default=50, help='Timed iterations per scenario')
+        parser.add_argument('--warmup', type=int, default=5, help='Untimed iterations run before timing')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Fixture rows to write per query')
+        parser.add_argument('--output', help='Write the JSON results to this file instead of stdout')
+        parser.add_argument('--compare', help='Earlier JSON results to compare against')
+        parser.add_argument('--flush', action='store_true', help='Delete existing benchmark fixtures and reseed')
+        parser.add_argument('--clean', action='store_true', help='Delete benchmark fixtures and exit')
+
+    def log(self, message):
+        self.stderr.write(message)
+
+    def handle(self, *args, **options):
+        if options['clean']:
+            deleted = flush_bench_fixtures()
+            self.log(self.style.SUCCESS(f'Deleted {sum(deleted.values())} benchmark rows'))
+            return
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        sizes = dict(SCALES[options['scale']])
+        for size in ('users', 'arts', 'sessions'):
+            if options[size] is not None:
+                sizes[size] = options[size]
+
+        if options['flush'] and bench_fixtures_exist():
+            self.log(self.style.WARNING('Flushing existing benchmark fixtures...'))
+            flush_bench_fixtures()
+
+        fixtures = None
+        if bench_fixtures_exist():
+            self.log(self.style.NOTICE('Reusing existing benchmark fixtures; pass --flush to reseed'))
+        else:
+            start = time.perf_counter()
+            builder = BenchFixtureBuilder(sizes, seed=options['seed'], batch_size=options['batch_size'], log=self.log)
+            fixtures = {
+                'rows': builder.build(),
+                'seconds': round(time.perf_counter() - start, 3),
+            }
+            self.log(self.style.SUCCESS(f"Seeded benchmark fixtures in {fixtures['seconds']}s"))
+
+        data = BenchData()
+        results = {}
+        for name in options['scenario'] or sorted(SCENARIOS):
+            self.log(self.style.NOTICE(f'Running {name}...'))
+            results[name] = run_scenario(
+                name, data, iterations=options['iterations'], warmup=options['warmup'], seed=options['seed']
+            )
+
+        report = {
+            'meta': {
+                'commit': self._git_commit(),
+                'timestamp': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'scale': options['scale'],
+                'sizes': sizes,
+                'seed': options['seed'],
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+                'fixtures': fixtures,
+            },
+            'scenarios': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+            self.log(self.style.SUCCESS(f"Wrote results to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+        if options['compare']:
+            self._compare(options['compare'], results)
+
+    @staticmethod
+    def _git_commit():
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def _compare(self, path, results):
+        try:
+            with open(path) as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read {path}: {e}') from e
+
+        self.log(f"Compared with {baseline['meta'].get('commit') or path}:")
+        for name, result in results.items():
+            before = baseline['scenarios'].get(name)
+            if before is None:
+                self.log(f'  {name}: no baseline')
+                continue
+            changes = []
+            for key in ('p50_ms', 'p95_ms', 'queries_p50', 'queries_max'):
+                change = f'{key} {before[key]} -> {result[key]}'
+                if before[key]:
+                    change += f' ({(result[key] - before[key]) / before[key]:+.0%})'
+                changes.append(change)
+            self.log(f"  {name}: {', '.join(changes)}")
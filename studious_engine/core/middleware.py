@@ -0,0 +1,96 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.query_budget import (
+    QueryBudgetExceeded,
+    UNRESOLVED_VIEW_NAME,
+    QueryRecorder,
+    get_view_budget,
+    record_endpoint_stats,
+)
+from core.services.presence import record_presence
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCountMiddleware:
+    """
+    Counts the SQL queries, DB time and duplicate queries of each request.
+
+    Results are tagged with the URL name and kept in process-local stats;
+    with QUERY_COUNT_HEADERS they are also sent as X-Query-* response
+    headers. A request over its endpoint's declared budget is logged, or
+    raises QueryBudgetExceeded when QUERY_BUDGET_RAISE is set (as in tests).
+
+    Enabled with QUERY_COUNT_ENABLED, which defaults to DEBUG.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'QUERY_COUNT_ENABLED', settings.DEBUG)
+        self.headers = getattr(settings, 'QUERY_COUNT_HEADERS', settings.DEBUG)
+        self.raise_on_budget = getattr(settings, 'QUERY_BUDGET_RAISE', False)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+
+        summary = recorder.summary()
+        resolver_match = request.resolver_match
+        view_name = resolver_match.view_name if resolver_match else UNRESOLVED_VIEW_NAME
+        record_endpoint_stats(view_name, summary)
+        response.query_stats = dict(summary, view_name=view_name)
+
+        if self.headers:
+            response['X-Query-Count'] = str(summary['count'])
+            response['X-Query-Time-Ms'] = f"{summary['time_ms']:.1f}"
+            response['X-Query-Duplicates'] = str(sum(count - 1 for count in summary['duplicates'].values()))
+
+        budget = get_view_budget(resolver_match, request.method)
+        if budget is not None and summary['count'] > budget:
+            message = (
+                f"{view_name} ran {summary['count']} queries, over its budget of {budget}; "
+                f"repeated: {summary['duplicates']}"
+            )
+            if self.raise_on_budget:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
+
+
+PRESENCE_THROTTLE_CACHE_KEY = 'core:presence:throttle:{user_id}'
+
+
+class PresenceMiddleware:
+    """
+    Records a presence heartbeat for authenticated requests.
+
+    Runs after the response so REST framework's authentication has set the
+    user, and records at most once per PRESENCE_TOUCH_INTERVAL seconds per
+    user. Requests that report a location record it themselves.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.interval = getattr(settings, 'PRESENCE_TOUCH_INTERVAL', 60)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            if cache.add(PRESENCE_THROTTLE_CACHE_KEY.format(user_id=user.pk), 1, timeout=self.interval):
+                record_presence(user.pk)
+        return response
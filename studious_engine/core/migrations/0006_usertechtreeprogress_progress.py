@@ -0,0 +1,18 @@
+# Generated by Django 5.0.12 on 2026-10-17 20:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_remove_userlocation_current_zone_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usertechtreeprogress',
+            name='progress',
+            field=models.JSONField(blank=True, default=dict, help_text='Per-art progress breakdown and aggregate percent complete', verbose_name='Progress'),
+        ),
+    ]
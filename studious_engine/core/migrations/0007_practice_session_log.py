@@ -0,0 +1,148 @@
+# Generated by Django 5.0.12 on 2026-10-17 20:55
+
+import datetime
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+
+RECENT_SESSIONS_LIMIT = 10
+BATCH_SIZE = 1000
+
+
+def _parse_timestamp(value):
+    """Parse an ISO timestamp from the JSON history, assuming UTC when naive."""
+    try:
+        timestamp = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp
+
+
+def _recent_entry(session, part_name):
+    return {
+        'id': str(session.id),
+        'part_id': str(session.part_id),
+        'part_name': part_name,
+        'timestamp': session.started_at.isoformat(),
+        'duration_minutes': session.duration_minutes,
+        'notes': session.notes,
+        'validated': session.validated,
+    }
+
+
+def move_practice_history_to_sessions(apps, schema_editor):
+    """
+    Copy ArtMastery.practice_history entries into PracticeSession rows.
+
+    Entries written by ArtMastery.log_practice_session ('timestamp' key) only
+    ever existed in the JSON, so they become new rows. Entries written by
+    PracticeService.log_practice ('date' key) already have a PracticeSession
+    row created alongside them and are skipped, as are entries matching an
+    existing row. Entries whose part no longer exists cannot be represented
+    and are dropped.
+    """
+    ArtMastery = apps.get_model('core', 'ArtMastery')
+    ArtParts = apps.get_model('core', 'ArtParts')
+    PracticeSession = apps.get_model('core', 'PracticeSession')
+
+    part_names = dict(ArtParts.objects.values_list('id', 'name'))
+    sessions = []
+
+    masteries = ArtMastery.objects.exclude(practice_history=[]).exclude(practice_history__isnull=True)
+    for mastery in masteries.iterator(chunk_size=BATCH_SIZE):
+        # Sessions already in the table (e.g. after a reverse migration) are not copied twice
+        existing = set(
+            PracticeSession.objects.filter(
+                user_id=mastery.user_id, art_id=mastery.art_id
+            ).values_list('part_id', 'started_at')
+        )
+        recent = []
+        for entry in mastery.practice_history:
+            if not isinstance(entry, dict) or 'timestamp' not in entry:
+                continue
+            try:
+                part_id = uuid.UUID(str(entry.get('part_id')))
+            except ValueError:
+                continue
+            started_at = _parse_timestamp(entry['timestamp'])
+            if part_id not in part_names or started_at is None or (part_id, started_at) in existing:
+                continue
+
+            session = PracticeSession(
+                user_id=mastery.user_id,
+                art_id=mastery.art_id,
+                part_id=part_id,
+                started_at=started_at,
+                duration_minutes=max(0, int(entry.get('duration_minutes') or 0)),
+                notes=entry.get('notes') or '',
+                validated=bool(entry.get('validated')),
+                completed=bool(entry.get('validated')),
+            )
+            sessions.append(session)
+            recent.append(_recent_entry(session, part_names[part_id]))
+
+        if recent:
+            mastery.recent_sessions = recent[-RECENT_SESSIONS_LIMIT:]
+            mastery.save(update_fields=['recent_sessions'])
+
+        if len(sessions) >= BATCH_SIZE:
+            PracticeSession.objects.bulk_create(sessions)
+            sessions = []
+
+    PracticeSession.objects.bulk_create(sessions)
+
+
+def move_sessions_to_practice_history(apps, schema_editor):
+    """Rebuild the JSON history from PracticeSession rows."""
+    ArtMastery = apps.get_model('core', 'ArtMastery')
+    PracticeSession = apps.get_model('core', 'PracticeSession')
+
+    for mastery in ArtMastery.objects.iterator(chunk_size=BATCH_SIZE):
+        sessions = PracticeSession.objects.filter(
+            user_id=mastery.user_id, art_id=mastery.art_id
+        ).select_related('part').order_by('started_at')
+        mastery.practice_history = [
+            {
+                'part_id': str(session.part_id),
+                'part_name': session.part.name,
+                'timestamp': session.started_at.isoformat(),
+                'duration_minutes': session.duration_minutes,
+                'notes': session.notes,
+                'validated': session.validated,
+            }
+            for session in sessions
+        ]
+        if mastery.practice_history:
+            mastery.save(update_fields=['practice_history'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_usertechtreeprogress_progress'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artmastery',
+            name='recent_sessions',
+            field=models.JSONField(blank=True, default=list, help_text='The most recent practice sessions, for display; the full log is in PracticeSession', verbose_name='Recent Sessions'),
+        ),
+        migrations.AddIndex(
+            model_name='practicesession',
+            index=models.Index(fields=['user', 'art', '-started_at'], name='practice_user_art_started_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='practicesession',
+            index=models.Index(fields=['user', '-started_at'], name='practice_user_started_idx'),
+        ),
+        migrations.RunPython(move_practice_history_to_sessions, move_sessions_to_practice_history),
+        migrations.RemoveField(
+            model_name='artmastery',
+            name='practice_history',
+        ),
+    ]
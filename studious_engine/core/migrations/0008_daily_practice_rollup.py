@@ -0,0 +1,38 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:01
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_practice_session_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPracticeRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('day', models.DateField(verbose_name='Day')),
+                ('session_count', models.PositiveIntegerField(default=0, verbose_name='Session Count')),
+                ('completed_count', models.PositiveIntegerField(default=0, verbose_name='Completed Sessions')),
+                ('total_minutes', models.PositiveIntegerField(default=0, verbose_name='Total Minutes')),
+                ('longest_session', models.PositiveIntegerField(default=0, verbose_name='Longest Session (Minutes)')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('art', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_practice_rollups', to='core.art', verbose_name='Art')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_practice_rollups', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Daily Practice Rollup',
+                'verbose_name_plural': 'Daily Practice Rollups',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['user', '-day'], name='practice_rollup_user_day_idx')],
+                'unique_together': {('user', 'art', 'day')},
+            },
+        ),
+    ]
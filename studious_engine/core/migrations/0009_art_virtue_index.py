@@ -0,0 +1,52 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:07
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def index_existing_virtues(apps, schema_editor):
+    """Create ArtVirtue rows for the improved virtues of existing arts."""
+    Art = apps.get_model('core', 'Art')
+    ArtVirtue = apps.get_model('core', 'ArtVirtue')
+
+    rows = []
+    for art_id, improved_virtues in Art.objects.values_list('id', 'improved_virtues').iterator(chunk_size=BATCH_SIZE):
+        impacts = {}
+        for virtue, impact in (improved_virtues or {}).items():
+            try:
+                impact = float(impact)
+            except (TypeError, ValueError):
+                impact = 0
+            key = str(virtue).lower()[:50]
+            impacts[key] = max(impact, impacts.get(key, impact))
+        rows.extend(ArtVirtue(art_id=art_id, virtue=virtue, impact=impact) for virtue, impact in impacts.items())
+
+    ArtVirtue.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_daily_practice_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArtVirtue',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('virtue', models.CharField(help_text='Lower-cased virtue name', max_length=50, verbose_name='Virtue')),
+                ('impact', models.FloatField(default=0, verbose_name='Impact')),
+                ('art', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='virtue_index', to='core.art', verbose_name='Art')),
+            ],
+            options={
+                'verbose_name': 'Art Virtue',
+                'verbose_name_plural': 'Art Virtues',
+                'indexes': [models.Index(fields=['virtue', '-impact'], name='art_virtue_impact_idx')],
+                'unique_together': {('art', 'virtue')},
+            },
+        ),
+        migrations.RunPython(index_existing_virtues, migrations.RunPython.noop),
+    ]
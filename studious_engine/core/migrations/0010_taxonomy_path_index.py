@@ -0,0 +1,39 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:09
+
+from django.db import migrations, models
+
+
+def rebuild_taxonomy_paths(apps, schema_editor):
+    """Recompute every materialised path from the parent links, roots first."""
+    ArtTaxonomy = apps.get_model('core', 'ArtTaxonomy')
+
+    nodes = list(ArtTaxonomy.objects.only('id', 'parent_id', 'path'))
+    children = {}
+    for node in nodes:
+        children.setdefault(node.parent_id, []).append(node)
+
+    changed = []
+    stack = [(node, str(node.id)) for node in children.get(None, [])]
+    while stack:
+        node, path = stack.pop()
+        if node.path != path:
+            node.path = path
+            changed.append(node)
+        stack.extend((child, f"{path}/{child.id}") for child in children.get(node.id, []))
+
+    ArtTaxonomy.objects.bulk_update(changed, ['path'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_art_virtue_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='arttaxonomy',
+            index=models.Index(fields=['path'], name='taxonomy_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(rebuild_taxonomy_paths, migrations.RunPython.noop),
+    ]
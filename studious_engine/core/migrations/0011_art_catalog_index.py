@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_taxonomy_path_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='art',
+            index=models.Index(fields=['name', 'id'], name='art_catalog_name_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_art_catalog_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artmastery',
+            index=models.Index(fields=['user', '-mastery_level', 'id'], name='mastery_user_level_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='marketitem',
+            index=models.Index(fields=['-created_at', 'id'], name='market_item_created_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import copy
+
 from django.conf import settings
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -5,9 +7,9 @@ from django.utils import timezone
 import uuid
 
 # Import the Art System models
-from .art import Art, ArtParts, ArtStage, ArtTaxonomy
+from .art import Art, ArtParts, ArtStage, ArtTaxonomy, ArtVirtue
 from .art.tech_tree import TechTree
-from .art.user_progress import ArtMastery, UserArtStageProgress, UserTechTreeProgress, PracticeSession
+from .art.user_progress import ArtMastery, UserArtStageProgress, UserTechTreeProgress, PracticeSession, DailyPracticeRollup
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:virtue_metrics_calculation]
@@ -58,6 +60,11 @@ class HappinessMetrics(models.Model):
         super().save(*args, **kwargs)
 
 
+def _stored_copy(value):
+    """Copy JSON containers so in-place edits still show up as changes."""
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
 class PlayerProfile(models.Model):
     """Extended profile for game users."""
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile")
@@ -91,15 +98,58 @@ class PlayerProfile(models.Model):
     # New Atlantis Go fields
     tutorial_progress = models.JSONField(default=dict, blank=True)
     device_settings = models.JSONField(default=dict, blank=True)
-    last_active = models.DateTimeField(auto_now=True)
+    # Written in batches from presence heartbeats (core.services.heartbeat)
+    last_active = models.DateTimeField(default=timezone.now)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Kept current by the heartbeat writer and auto_now; they never make a profile dirty
+    DIRTY_IGNORED_FIELDS = ('last_active', 'updated_at')
+    
     def __str__(self):
         return f"{self.user.username}'s Profile"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored field values so saves can write only what changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._stored_values = {
+            attname: _stored_copy(value) for attname, value in zip(field_names, values)
+        }
+        return instance
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        stored = getattr(self, '_stored_values', {})
+        for field in self._meta.concrete_fields:
+            if update_fields is not None and field.name not in update_fields and field.attname not in update_fields:
+                continue
+            if field.attname in self.__dict__:
+                stored[field.attname] = _stored_copy(getattr(self, field.attname))
+        self._stored_values = stored
+    
+    def get_dirty_fields(self):
+        """
+        Get the fields changed since the profile was loaded or last saved.
+        
+        Fields that were never loaded, such as deferred ones, are not
+        compared.
+        
+        Returns:
+            List[str]: Names of the changed fields
+        """
+        stored = getattr(self, '_stored_values', {})
+        dirty = []
+        for field in self._meta.concrete_fields:
+            if field.name in self.DIRTY_IGNORED_FIELDS or field.attname not in stored:
+                continue
+            if field.attname in self.__dict__ and getattr(self, field.attname) != stored[field.attname]:
+                dirty.append(field.name)
+        return dirty
+    
     @property
     def level(self):
         """Calculate player level based on experience points."""
@@ -308,6 +358,11 @@ class MarketItem(models.Model):
     seller_type = models.CharField(max_length=10, choices=SELLER_TYPE_CHOICES, default='system')
     reference_id = models.UUIDField(null=True, blank=True)  # ID of the referenced entity (item, resource, art, etc.)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='market_item_created_idx'),
+        ]
+    
     def __str__(self):
         return self.name
     
@@ -1,7 +1,7 @@
 # Art system models package
-from .art import Art, ArtParts, ArtStage, ArtTaxonomy
+from .art import Art, ArtParts, ArtStage, ArtTaxonomy, ArtVirtue
 from .tech_tree import TechTree
-from .user_progress import ArtMastery, UserArtStageProgress, UserTechTreeProgress
+from .user_progress import ArtMastery, DailyPracticeRollup, UserArtStageProgress, UserTechTreeProgress
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:OPTIMIZATION_LAYER:START]
@@ -14,8 +14,10 @@ __all__ = [
     'ArtParts', 
     'ArtStage', 
     'ArtTaxonomy',
+    'ArtVirtue',
     'TechTree',
     'ArtMastery', 
+    'DailyPracticeRollup',
     'UserArtStageProgress', 
     'UserTechTreeProgress'
 ] 
\ No newline at end of file
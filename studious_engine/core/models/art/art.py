@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
-from django.db.models import JSONField
+from django.db.models import F, Func, JSONField, Q, Value
+from django.db.models.functions import Concat, Substr
 import uuid
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -41,20 +42,90 @@ class ArtTaxonomy(models.Model):
         verbose_name = _('Art Taxonomy')
         verbose_name_plural = _('Art Taxonomies')
         ordering = ['level', 'name']
+        indexes = [
+            models.Index(fields=['path'], name='taxonomy_path_idx', opclasses=['varchar_pattern_ops']),
+        ]
     
     def __str__(self):
         return self.name
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored path so saves can move the subtree with the node."""
+        instance = super().from_db(db, field_names, values)
+        if 'path' in field_names:
+            instance._stored_path = values[field_names.index('path')]
+        return instance
+    
     def save(self, *args, **kwargs):
-        """Update path when saving"""
+        """Update path when saving, rewriting the paths of the whole subtree if it moved"""
         if self.parent:
+            if f"/{self.id}/" in f"/{self.parent.path}/":
+                raise ValueError(f"Taxonomy {self.name} cannot be moved under its own subtree")
             self.path = f"{self.parent.path}/{self.id}"
         else:
             self.path = f"{self.id}"
-        super().save(*args, **kwargs)
+        
+        stored_path = getattr(self, '_stored_path', None)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and stored_path != self.path:
+            kwargs['update_fields'] = set(update_fields) | {'path'}
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if stored_path and stored_path != self.path:
+                ArtTaxonomy.rewrite_path_prefix(stored_path, self.path)
+        self._stored_path = self.path
+    
+    @staticmethod
+    def rewrite_path_prefix(old_prefix, new_prefix):
+        """
+        Move every taxonomy below old_prefix to below new_prefix in one update.
+        
+        Args:
+            old_prefix: Path of the subtree root before the move
+            new_prefix: Path of the subtree root after the move, or '' to make
+                its children roots
+            
+        Returns:
+            int: Number of taxonomies rewritten
+        """
+        rest = Substr('path', len(old_prefix) + 2)
+        return ArtTaxonomy.objects.filter(path__startswith=f"{old_prefix}/").update(
+            path=Concat(Value(f"{new_prefix}/"), rest) if new_prefix else rest
+        )
+    
+    @staticmethod
+    def remove_from_paths(taxonomy_id):
+        """
+        Drop a deleted taxonomy and its ancestors from the paths below it.
+        
+        Its children become roots, as the parent foreign key is set to null.
+        
+        Args:
+            taxonomy_id: ID of the deleted taxonomy
+            
+        Returns:
+            int: Number of taxonomies rewritten
+        """
+        return ArtTaxonomy.objects.filter(path__contains=f"{taxonomy_id}/").update(
+            path=Func(F('path'), Value(f"^.*{taxonomy_id}/"), Value(''), function='REGEXP_REPLACE')
+        )
+    
+    def get_descendants(self, include_self=True):
+        """Return the taxonomy's whole subtree, found by path prefix in one query"""
+        subtree = Q(path__startswith=f"{self.path}/")
+        if include_self:
+            subtree |= Q(pk=self.pk)
+        return ArtTaxonomy.objects.filter(subtree)
     
     def get_full_path_display(self):
         """Return human-readable taxonomy path"""
+        from core.services.art.taxonomy_tree import get_taxonomy_forest
+        
+        forest = get_taxonomy_forest()
+        if self.pk in forest:
+            return forest.full_path_display(self.pk)
         if self.parent:
             return f"{self.parent.get_full_path_display()} > {self.name}"
         return self.name
@@ -129,6 +200,9 @@ class Art(models.Model):
         verbose_name = _('Art')
         verbose_name_plural = _('Arts')
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name', 'id'], name='art_catalog_name_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -148,6 +222,67 @@ class Art(models.Model):
     def get_prerequisites(self):
         """Return all prerequisite arts"""
         return self.parent_arts.all()
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored improved virtues so saves can skip reindexing."""
+        instance = super().from_db(db, field_names, values)
+        if 'improved_virtues' in field_names:
+            instance._stored_improved_virtues = values[field_names.index('improved_virtues')]
+        return instance
+
+
+class ArtVirtue(models.Model):
+    """
+    Index of the virtues an art improves, mirroring Art.improved_virtues.
+    
+    One row per art and virtue, so arts can be looked up by virtue and
+    ranked by impact without scanning the JSON of every art.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    art = models.ForeignKey(
+        Art,
+        verbose_name=_('Art'),
+        on_delete=models.CASCADE,
+        related_name='virtue_index'
+    )
+    virtue = models.CharField(_('Virtue'), max_length=50, help_text=_('Lower-cased virtue name'))
+    impact = models.FloatField(_('Impact'), default=0)
+    
+    class Meta:
+        verbose_name = _('Art Virtue')
+        verbose_name_plural = _('Art Virtues')
+        unique_together = [['art', 'virtue']]
+        indexes = [
+            models.Index(fields=['virtue', '-impact'], name='art_virtue_impact_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.art.name} - {self.virtue} ({self.impact})"
+    
+    @staticmethod
+    def rows_for(art):
+        """
+        Build the index rows for an art's improved virtues.
+        
+        Keys are lower-cased; when two keys differ only by case the larger
+        impact is kept. Non-numeric impacts are indexed as 0.
+        
+        Args:
+            art: The Art object
+            
+        Returns:
+            list: Unsaved ArtVirtue objects
+        """
+        impacts = {}
+        for virtue, impact in (art.improved_virtues or {}).items():
+            try:
+                impact = float(impact)
+            except (TypeError, ValueError):
+                impact = 0
+            key = str(virtue).lower()[:50]
+            impacts[key] = max(impact, impacts.get(key, impact))
+        return [ArtVirtue(art_id=art.pk, virtue=virtue, impact=impact) for virtue, impact in impacts.items()]
 
 
 class ArtParts(models.Model):
@@ -215,23 +350,26 @@ class ArtParts(models.Model):
     @property
     def is_last_part(self):
         """Check if this is the last part of the art"""
-        return self.order_index == self.art.parts.count() - 1
+        from core.services.art.art_structure import get_art_structure
+        return self.order_index == get_art_structure(self.art_id).part_count - 1
     
     def get_next_part(self):
         """Get the next part in sequence"""
-        try:
-            return self.art.parts.get(order_index=self.order_index + 1)
-        except ArtParts.DoesNotExist:
+        from core.services.art.art_structure import get_art_structure
+        next_part_id = get_art_structure(self.art_id).next_part_id(self.id)
+        if next_part_id is None:
             return None
+        return ArtParts.objects.filter(id=next_part_id).first()
     
     def get_previous_part(self):
         """Get the previous part in sequence"""
         if self.order_index == 0:
             return None
-        try:
-            return self.art.parts.get(order_index=self.order_index - 1)
-        except ArtParts.DoesNotExist:
+        from core.services.art.art_structure import get_art_structure
+        previous_part_id = get_art_structure(self.art_id).previous_part_id(self.id)
+        if previous_part_id is None:
             return None
+        return ArtParts.objects.filter(id=previous_part_id).first()
 
 
 class ArtStage(models.Model):
@@ -272,11 +410,13 @@ class ArtStage(models.Model):
     @property
     def is_last_stage(self):
         """Check if this is the final stage of the art"""
-        return self.order_index == self.art.stages.count() - 1
+        from core.services.art.art_structure import get_art_structure
+        return self.order_index == get_art_structure(self.art_id).stage_count - 1
     
     def get_next_stage(self):
         """Get the next stage in sequence"""
-        try:
-            return self.art.stages.get(order_index=self.order_index + 1)
-        except ArtStage.DoesNotExist:
-            return None 
\ No newline at end of file
+        from core.services.art.art_structure import get_art_structure
+        next_stage_id = get_art_structure(self.art_id).next_stage_id(self.id)
+        if next_stage_id is None:
+            return None
+        return ArtStage.objects.filter(id=next_stage_id).first() 
\ No newline at end of file
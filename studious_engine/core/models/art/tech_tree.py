@@ -75,37 +75,21 @@ class TechTree(models.Model):
     @property
     def is_root_node(self):
         """Check if this is a root node (no parents)"""
-        return self.parent_nodes.count() == 0
+        from core.services.art.tech_tree_graph import get_tech_tree_graph
+        return get_tech_tree_graph().is_root(self.id)
     
     @property
     def is_leaf_node(self):
         """Check if this is a leaf node (no children)"""
-        return self.child_nodes.count() == 0
+        from core.services.art.tech_tree_graph import get_tech_tree_graph
+        return get_tech_tree_graph().is_leaf(self.id)
     
     def get_all_prerequisites(self):
         """Get all prerequisite nodes (recursively including ancestors)"""
-        all_prereqs = set()
-        
-        def collect_parents(node):
-            parents = node.parent_nodes.all()
-            for parent in parents:
-                if parent.id not in all_prereqs:
-                    all_prereqs.add(parent.id)
-                    collect_parents(parent)
-        
-        collect_parents(self)
-        return TechTree.objects.filter(id__in=all_prereqs)
+        from core.services.art.tech_tree_graph import get_tech_tree_graph
+        return TechTree.objects.filter(id__in=get_tech_tree_graph().ancestor_ids(self.id))
     
     def get_all_unlocks(self):
         """Get all nodes this one unlocks (recursively including descendants)"""
-        all_unlocks = set()
-        
-        def collect_children(node):
-            children = node.child_nodes.all()
-            for child in children:
-                if child.id not in all_unlocks:
-                    all_unlocks.add(child.id)
-                    collect_children(child)
-        
-        collect_children(self)
-        return TechTree.objects.filter(id__in=all_unlocks) 
\ No newline at end of file
+        from core.services.art.tech_tree_graph import get_tech_tree_graph
+        return TechTree.objects.filter(id__in=get_tech_tree_graph().descendant_ids(self.id))
@@ -54,19 +54,76 @@ class PracticeSession(models.Model):
         verbose_name = _('Practice Session')
         verbose_name_plural = _('Practice Sessions')
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', 'art', '-started_at'], name='practice_user_art_started_idx'),
+            models.Index(fields=['user', '-started_at'], name='practice_user_started_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.art.name} - {self.part.name} ({self.duration_minutes} min)"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored rollup key so saves can refresh the day it moved from."""
+        instance = super().from_db(db, field_names, values)
+        if {'user_id', 'art_id', 'started_at'} <= set(field_names):
+            instance._stored_rollup_key = (
+                values[field_names.index('user_id')],
+                values[field_names.index('art_id')],
+                values[field_names.index('started_at')]
+            )
+        return instance
+    
     @property
     def is_recent(self):
         """Check if practice session is from within the last week"""
         return (timezone.now() - self.started_at).days <= 7
 
+class DailyPracticeRollup(models.Model):
+    """
+    Practice totals for one user, art and local calendar day.
+    
+    Rows are kept current from PracticeSession writes so stats, streaks and
+    calendars read one row per day instead of every session.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        User,
+        verbose_name=_('User'),
+        on_delete=models.CASCADE,
+        related_name='daily_practice_rollups'
+    )
+    art = models.ForeignKey(
+        Art,
+        verbose_name=_('Art'),
+        on_delete=models.CASCADE,
+        related_name='daily_practice_rollups'
+    )
+    day = models.DateField(_('Day'))
+    session_count = models.PositiveIntegerField(_('Session Count'), default=0)
+    completed_count = models.PositiveIntegerField(_('Completed Sessions'), default=0)
+    total_minutes = models.PositiveIntegerField(_('Total Minutes'), default=0)
+    longest_session = models.PositiveIntegerField(_('Longest Session (Minutes)'), default=0)
+    updated_at = models.DateTimeField(_('Updated At'), auto_now=True)
+    
+    class Meta:
+        verbose_name = _('Daily Practice Rollup')
+        verbose_name_plural = _('Daily Practice Rollups')
+        ordering = ['-day']
+        unique_together = [['user', 'art', 'day']]
+        indexes = [
+            models.Index(fields=['user', '-day'], name='practice_rollup_user_day_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.art.name} - {self.day} ({self.session_count} sessions)"
+
 class ArtMastery(models.Model):
     """
     Tracks a user's mastery of a specific art.
     """
+    RECENT_SESSIONS_LIMIT = 10
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
         User, 
@@ -85,7 +142,12 @@ class ArtMastery(models.Model):
     last_practiced = models.DateTimeField(_('Last Practiced'), null=True, blank=True)
     practice_streak = models.IntegerField(_('Practice Streak'), default=0)
     is_featured = models.BooleanField(_('Is Featured'), default=False)
-    practice_history = models.JSONField(_('Practice History'), default=list, blank=True)
+    recent_sessions = models.JSONField(
+        _('Recent Sessions'),
+        default=list,
+        blank=True,
+        help_text=_('The most recent practice sessions, for display; the full log is in PracticeSession')
+    )
     completed_parts = models.JSONField(_('Completed Parts'), default=list, blank=True)
     current_part = models.ForeignKey(
         ArtParts,
@@ -106,10 +168,21 @@ class ArtMastery(models.Model):
         verbose_name_plural = _('Art Masteries')
         ordering = ['-mastery_level', 'art__name']
         unique_together = [['user', 'art']]
+        indexes = [
+            models.Index(fields=['user', '-mastery_level', 'id'], name='mastery_user_level_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.art.name} ({self.mastery_level}%)"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored mastery level so saves can detect level changes."""
+        instance = super().from_db(db, field_names, values)
+        if 'mastery_level' in field_names:
+            instance._stored_mastery_level = values[field_names.index('mastery_level')]
+        return instance
+    
     @property
     def days_since_practiced(self):
         """Calculate days since last practice"""
@@ -128,64 +201,93 @@ class ArtMastery(models.Model):
     @property
     def total_practice_sessions(self):
         """Get total number of practice sessions"""
-        return len(self.practice_history)
+        return PracticeSession.objects.filter(user_id=self.user_id, art_id=self.art_id).count()
     
-    def log_practice_session(self, part, duration_minutes, notes=None, validated=False):
+    def add_recent_session(self, session):
         """
-        Log a new practice session
+        Record a practice session in the bounded recent sessions list
         
         Args:
-            part: The ArtPart that was practiced
-            duration_minutes: Duration of practice in minutes
-            notes: Optional notes about the practice
-            validated: Whether the practice has been validated
+            session: The PracticeSession that was logged
+            
+        Returns:
+            Dict: The entry added to recent_sessions
         """
-        session = {
-            'part_id': str(part.id),
-            'part_name': part.name, 
-            'timestamp': timezone.now().isoformat(),
-            'duration_minutes': duration_minutes,
-            'notes': notes or '',
-            'validated': validated
+        entry = {
+            'id': str(session.id),
+            'part_id': str(session.part_id),
+            'part_name': session.part.name,
+            'timestamp': session.started_at.isoformat(),
+            'duration_minutes': session.duration_minutes,
+            'notes': session.notes,
+            'validated': session.validated
         }
+        self.recent_sessions = ((self.recent_sessions or []) + [entry])[-self.RECENT_SESSIONS_LIMIT:]
+        return entry
+    
+    def apply_practice(self, session, structure):
+        """
+        Apply a logged practice session to this mastery in memory, without saving
         
-        # Update practice history
-        if self.practice_history is None:
-            self.practice_history = []
-        self.practice_history.append(session)
-        
-        # Update last practiced time
-        self.last_practiced = timezone.now()
+        Args:
+            session: The PracticeSession that was logged
+            structure: The art's ArtStructure
+            
+        Returns:
+            List[str]: Names of the fields that changed
+        """
+        previous_practice = self.last_practiced
+        self.add_recent_session(session)
+        self.last_practiced = session.started_at
         
-        # Update practice streak if practiced within last 48 hours
-        if self.last_practiced and (timezone.now() - self.last_practiced).days < 2:
+        # Continue the practice streak if practiced within 48 hours of the previous session
+        if previous_practice and (session.started_at - previous_practice).days < 2:
             self.practice_streak += 1
         else:
             self.practice_streak = 1
         
+        changed_fields = ['recent_sessions', 'last_practiced', 'practice_streak']
+        
         # If validated, add to completed parts if not already there
-        if validated and str(part.id) not in self.completed_parts:
-            if self.completed_parts is None:
-                self.completed_parts = []
-            self.completed_parts.append(str(part.id))
+        if session.validated and str(session.part_id) not in (self.completed_parts or []):
+            self.completed_parts = (self.completed_parts or []) + [str(session.part_id)]
+            changed_fields.append('completed_parts')
             
             # Update current part to next part if available
-            next_part = part.get_next_part()
-            if next_part:
-                self.current_part = next_part
+            next_part_id = structure.next_part_id(session.part_id)
+            if next_part_id:
+                self.current_part_id = next_part_id
+                changed_fields.append('current_part')
         
-        self.save()
+        if structure.part_count:
+            mastery_level = min(100, int((len(self.completed_parts or []) / structure.part_count) * 100))
+            if mastery_level != self.mastery_level:
+                self.mastery_level = mastery_level
+                changed_fields.append('mastery_level')
         
-        # Call method to recalculate mastery level
-        self.recalculate_mastery_level()
+        return changed_fields
+    
+    def log_practice_session(self, part, duration_minutes, notes=None, validated=False):
+        """
+        Log a new practice session
         
-        return session
+        Args:
+            part: The ArtPart that was practiced
+            duration_minutes: Duration of practice in minutes
+            notes: Optional notes about the practice
+            validated: Whether the practice has been validated
+        """
+        from core.services.art.practice_service import PracticeService
+        
+        PracticeService.ingest_practice(self, part, duration_minutes, notes=notes, validated=validated)
+        return self.recent_sessions[-1]
     
     def recalculate_mastery_level(self):
         """
         Recalculate the mastery level based on completed parts
         """
-        total_parts = self.art.parts.count()
+        from core.services.art.art_structure import get_art_structure
+        total_parts = get_art_structure(self.art_id).part_count
         if total_parts == 0:
             return
         
@@ -265,6 +367,12 @@ class UserTechTreeProgress(models.Model):
     )
     unlocked_date = models.DateTimeField(_('Unlocked Date'), null=True, blank=True)
     progress_percentage = models.IntegerField(_('Progress Percentage'), default=0)
+    progress = models.JSONField(
+        _('Progress'),
+        default=dict,
+        blank=True,
+        help_text=_('Per-art progress breakdown and aggregate percent complete')
+    )
     missing_requirements = models.JSONField(_('Missing Requirements'), default=dict, blank=True)
     is_unlocked = models.BooleanField(_('Is Unlocked'), default=False)
     created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
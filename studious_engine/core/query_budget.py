@@ -0,0 +1,191 @@
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_WHITESPACE = re.compile(r'\s+')
+
+# Stats key for requests that matched no URL pattern, so probing random
+# paths cannot grow the stats without bound
+UNRESOLVED_VIEW_NAME = '<unresolved>'
+
+_stats_lock = threading.Lock()
+_endpoint_stats = {}
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a request runs more queries than its endpoint's budget."""
+
+
+def fingerprint(sql):
+    """
+    Normalise a SQL statement so repeats of the same query with different
+    parameters share a fingerprint.
+
+    Args:
+        sql: The SQL, with parameter placeholders
+
+    Returns:
+        str: The fingerprint
+    """
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _NUMBER.sub('N', sql)
+
+
+class QueryRecorder:
+    """
+    Records every query run on the given connections while active.
+
+    Uses execute wrappers, so it works with DEBUG off and adds no cost once
+    the block exits.
+    """
+
+    def __init__(self, using=None):
+        """
+        Args:
+            using: Optional list of database aliases; all of them by default
+        """
+        self.using = using or list(connections)
+        self.queries = []
+        self._stack = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    def __enter__(self):
+        for alias in self.using:
+            wrapper = connections[alias].execute_wrapper(self)
+            wrapper.__enter__()
+            self._stack.append(wrapper)
+        return self
+
+    def __exit__(self, *exc_info):
+        while self._stack:
+            self._stack.pop().__exit__(*exc_info)
+
+    @property
+    def count(self):
+        """Number of queries run."""
+        return len(self.queries)
+
+    @property
+    def time_ms(self):
+        """Total time spent in the database, in milliseconds."""
+        return sum(duration for _sql, duration in self.queries) * 1000
+
+    @property
+    def duplicates(self):
+        """Fingerprints run more than once, with how many times each ran."""
+        counts = Counter(fingerprint(sql) for sql, _duration in self.queries)
+        return {sql: count for sql, count in counts.most_common() if count > 1}
+
+    def summary(self):
+        """
+        Summarise the recorded queries.
+
+        Returns:
+            Dict: 'count', 'time_ms' and 'duplicates'
+        """
+        return {'count': self.count, 'time_ms': round(self.time_ms, 3), 'duplicates': self.duplicates}
+
+
+def get_view_budget(resolver_match, method='get'):
+    """
+    Get the query budget declared for the view a request resolved to.
+
+    The QUERY_BUDGETS setting, keyed by URL name, takes precedence over a
+    `query_budget` attribute on the view function or class. Viewsets may
+    declare a dict of budgets keyed by action name.
+
+    Args:
+        resolver_match: The request's ResolverMatch
+        method: The request's HTTP method
+
+    Returns:
+        int: The budget, or None if none is declared
+    """
+    if resolver_match is None:
+        return None
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    if resolver_match.view_name in budgets:
+        return budgets[resolver_match.view_name]
+    func = resolver_match.func
+    for owner in (func, getattr(func, 'cls', None), getattr(func, 'view_class', None)):
+        budget = getattr(owner, 'query_budget', None)
+        if isinstance(budget, dict):
+            action = (getattr(func, 'actions', None) or {}).get(method.lower())
+            budget = budget.get(action)
+        if budget is not None:
+            return budget
+    return None
+
+
+def query_budget(max_queries):
+    """
+    Declare the most queries a view may run per request.
+
+    Works on view functions and on view classes (including DRF viewsets).
+
+    Args:
+        max_queries: The budget, or for viewsets a dict of budgets by action
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+def record_endpoint_stats(view_name, summary):
+    """Add one request's query summary to the process-local endpoint stats."""
+    with _stats_lock:
+        stats = _endpoint_stats.setdefault(view_name, {
+            'requests': 0,
+            'queries': 0,
+            'max_queries': 0,
+            'time_ms': 0.0,
+            'duplicate_requests': 0,
+        })
+        stats['requests'] += 1
+        stats['queries'] += summary['count']
+        stats['max_queries'] = max(stats['max_queries'], summary['count'])
+        stats['time_ms'] += summary['time_ms']
+        if summary['duplicates']:
+            stats['duplicate_requests'] += 1
+            stats['last_duplicates'] = summary['duplicates']
+
+
+def get_endpoint_stats():
+    """
+    Get the query stats gathered in this process, keyed by URL name.
+
+    Returns:
+        Dict: Per endpoint request count, total and max queries, DB time
+        and duplicate counts, with the average queries per request
+    """
+    with _stats_lock:
+        return {
+            view_name: dict(stats, avg_queries=stats['queries'] / stats['requests'])
+            for view_name, stats in _endpoint_stats.items()
+        }
+
+
+def reset_endpoint_stats():
+    """Clear the query stats gathered in this process."""
+    with _stats_lock:
+        _endpoint_stats.clear()
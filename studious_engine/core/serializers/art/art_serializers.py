@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from core.models import Art, ArtParts, ArtStage, ArtTaxonomy
+from core.serializers.eager_loading import EagerLoadingMixin
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:virtue_metrics_calculation]
@@ -28,7 +29,7 @@ class ArtPartSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'art', 'name', 'description', 'practice_method', 'practice_method_display',
             'validation_method', 'validation_method_display', 'estimated_hours',
-            'difficulty_level', 'order_index', 'created_at', 'updated_at'
+            'order_index', 'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
 
@@ -45,7 +46,7 @@ class ArtStageSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class ArtSerializer(serializers.ModelSerializer):
+class ArtSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the Art model."""
     
     taxonomy = ArtTaxonomySerializer(read_only=True)
@@ -56,6 +57,8 @@ class ArtSerializer(serializers.ModelSerializer):
         required=False,
         allow_null=True
     )
+    virtue_benefits = serializers.JSONField(source='improved_virtues', required=False)
+    created_at = serializers.DateTimeField(source='creation_date', read_only=True)
     
     class Meta:
         model = Art
@@ -69,8 +72,8 @@ class ArtSerializer(serializers.ModelSerializer):
 class ArtDetailSerializer(ArtSerializer):
     """Detailed serializer for the Art model including related parts and stages."""
     
-    parts = ArtPartSerializer(many=True, read_only=True, source='artparts_set')
-    stages = ArtStageSerializer(many=True, read_only=True, source='artstage_set')
+    parts = ArtPartSerializer(many=True, read_only=True)
+    stages = ArtStageSerializer(many=True, read_only=True)
     
     class Meta(ArtSerializer.Meta):
         fields = ArtSerializer.Meta.fields + ['parts', 'stages'] 
\ No newline at end of file
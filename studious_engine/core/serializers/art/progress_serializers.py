@@ -1,10 +1,14 @@
+from django.db.models import OuterRef
 from rest_framework import serializers
 from core.models import (
     ArtMastery, 
+    ArtParts,
+    PracticeSession,
     UserArtStageProgress, 
     UserTechTreeProgress,
     TechTree
 )
+from core.serializers.eager_loading import EagerLoadingMixin, count_subquery
 from .art_serializers import ArtSerializer, ArtPartSerializer, ArtStageSerializer
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -13,20 +17,35 @@ from .art_serializers import ArtSerializer, ArtPartSerializer, ArtStageSerialize
 # See .claude/README.md for more information
 # [CLAUDE:OPTIMIZATION_LAYER:END]
 
-class ArtMasterySerializer(serializers.ModelSerializer):
+class ArtMasterySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the ArtMastery model."""
     
     art = ArtSerializer(read_only=True)
     current_part = ArtPartSerializer(read_only=True)
+    last_practice_date = serializers.DateTimeField(source='last_practiced', read_only=True)
+    practice_count = serializers.SerializerMethodField()
+    
+    annotations = {
+        'practice_count': count_subquery(
+            PracticeSession.objects.filter(user=OuterRef('user'), art=OuterRef('art'))
+        ),
+        'total_parts': count_subquery(ArtParts.objects.filter(art=OuterRef('art'))),
+    }
     
     class Meta:
         model = ArtMastery
         fields = [
             'id', 'user', 'art', 'mastery_level', 'discovery_date',
             'last_practice_date', 'practice_streak', 'practice_count',
-            'current_part', 'completed_parts', 'practice_history'
+            'current_part', 'completed_parts', 'recent_sessions'
         ]
-        read_only_fields = ['id', 'user', 'art', 'discovery_date']
+        read_only_fields = ['id', 'user', 'art', 'discovery_date', 'recent_sessions']
+    
+    def get_practice_count(self, obj):
+        """Get the number of practice sessions, annotated by the list query when available."""
+        if hasattr(obj, 'practice_count'):
+            return obj.practice_count
+        return obj.total_practice_sessions
     
     def to_representation(self, instance):
         """Custom representation to include additional data."""
@@ -34,7 +53,10 @@ class ArtMasterySerializer(serializers.ModelSerializer):
         
         # Include total parts count
         if instance.art:
-            ret['total_parts'] = instance.art.artparts_set.count()
+            if hasattr(instance, 'total_parts'):
+                ret['total_parts'] = instance.total_parts
+            else:
+                ret['total_parts'] = instance.art.parts.count()
             ret['completed_parts_count'] = len(instance.completed_parts or [])
             
             # Calculate percentage complete
@@ -68,17 +90,17 @@ class TechTreeSerializer(serializers.ModelSerializer):
     class Meta:
         model = TechTree
         fields = [
-            'id', 'name', 'description', 'achievement_bonus',
+            'id', 'name', 'description', 'level',
             'created_at', 'updated_at', 'arts_count'
         ]
         read_only_fields = ['created_at', 'updated_at']
     
     def get_arts_count(self, obj):
-        """Get the number of arts in this tech tree."""
-        return obj.arts.count()
+        """Get the number of arts required by this tech tree."""
+        return len(obj.required_arts or [])
 
 
-class UserTechTreeProgressSerializer(serializers.ModelSerializer):
+class UserTechTreeProgressSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the UserTechTreeProgress model."""
     
     tech_tree = TechTreeSerializer(read_only=True)
@@ -86,9 +108,9 @@ class UserTechTreeProgressSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserTechTreeProgress
         fields = [
-            'id', 'user', 'tech_tree', 'progress_percentage', 'is_unlocked', 'unlocked_date'
+            'id', 'user', 'tech_tree', 'progress_percentage', 'progress', 'is_unlocked', 'unlocked_date'
         ]
-        read_only_fields = ['id', 'user', 'tech_tree', 'unlocked_date']
+        read_only_fields = ['id', 'user', 'tech_tree', 'progress', 'unlocked_date']
 
 
 class PracticeSessionSerializer(serializers.Serializer):
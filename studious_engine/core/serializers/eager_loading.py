@@ -0,0 +1,190 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Func, IntegerField, Prefetch, QuerySet, Subquery, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+def count_subquery(queryset):
+    """
+    Build a scalar subquery counting the rows of a correlated queryset.
+
+    Unlike Count() it adds no joins or GROUP BY to the outer query, so
+    several counts can be annotated side by side.
+
+    Args:
+        queryset: A queryset filtered with OuterRef()s
+
+    Returns:
+        Expression: The count, 0 when there are no rows
+    """
+    counted = queryset.order_by().annotate(_count=Func(F('pk'), function='COUNT')).values('_count')
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
+def _relation_path(model, attrs):
+    """
+    Find the relations a dotted source traverses.
+
+    Returns:
+        Tuple[List[str], bool, Model]: The relation names, whether the last
+        one is multi-valued, and the model it leads to
+    """
+    path = []
+    for attr in attrs:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation:
+            break
+        path.append(attr)
+        model = field.related_model
+        if field.many_to_many or field.one_to_many:
+            return path, True, model
+    return path, False, model
+
+
+def _prefetch_key(lookup):
+    return lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+
+
+def _prefixed(prefix, lookup):
+    if isinstance(lookup, Prefetch):
+        return Prefetch(f'{prefix}__{lookup.prefetch_through}', queryset=lookup.queryset, to_attr=lookup.to_attr)
+    return f'{prefix}__{lookup}'
+
+
+@lru_cache(maxsize=None)
+def _data_needs(serializer_class):
+    """Collect the select_related, prefetch_related and annotations a serializer class needs."""
+    model = serializer_class.Meta.model
+    select = list(serializer_class.select_related_fields)
+    prefetch = list(serializer_class.prefetch_related_fields)
+    annotations = dict(serializer_class.annotations)
+    declared = serializer_class._declared_fields
+
+    for name, field in declared.items():
+        if field.write_only or field.source == '*':
+            continue
+        many = isinstance(field, serializers.ListSerializer)
+        nested = field.child if many else field
+        path, multi_valued, _related = _relation_path(model, (field.source or name).split('.'))
+        if not path:
+            continue
+        lookup = '__'.join(path)
+
+        if isinstance(nested, serializers.BaseSerializer) and isinstance(nested, EagerLoadingMixin):
+            if many or multi_valued:
+                prefetch.append(Prefetch(lookup, queryset=nested.setup_eager_loading(nested.Meta.model.objects.all())))
+            else:
+                nested_select, nested_prefetch, _annotations = _data_needs(type(nested))
+                select.append(lookup)
+                select.extend(_prefixed(lookup, related) for related in nested_select)
+                prefetch.extend(_prefixed(lookup, related) for related in nested_prefetch)
+        elif multi_valued:
+            prefetch.append(lookup)
+        elif isinstance(nested, serializers.BaseSerializer) or len(path) < len((field.source or name).split('.')):
+            # Nested serializers and dotted sources such as 'host.user.username' read the related rows
+            select.append(lookup)
+
+    # Relations listed in Meta.fields without a declared field render as lists of primary keys
+    for name in getattr(serializer_class.Meta, 'fields', ()):
+        if name in declared or name in annotations:
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.many_to_many or field.one_to_many:
+            prefetch.append(name)
+
+    # A relation can back several fields; the first lookup for it wins
+    unique_prefetch = {}
+    for lookup in prefetch:
+        unique_prefetch.setdefault(_prefetch_key(lookup), lookup)
+    return tuple(dict.fromkeys(select)), tuple(unique_prefetch.values()), annotations
+
+
+class EagerLoadingMixin:
+    """
+    Lets a model serializer declare the data it reads, so views can load it
+    up front instead of querying once per object.
+
+    Nested serializers, dotted sources and many-to-many fields are found
+    automatically and become select_related or prefetch_related lookups;
+    the needs of nested serializers using this mixin are included too.
+    Serializers add anything else with:
+
+        select_related_fields: Extra relations to join
+        prefetch_related_fields: Extra lookups or Prefetch objects
+        annotations: Dict of name to expression, e.g. count_subquery(...)
+
+    Fields backed by an annotation should fall back to computing the value
+    when it is missing, as objects may come from elsewhere.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    annotations = {}
+
+    @classmethod
+    def get_data_needs(cls):
+        """
+        Get the data this serializer reads.
+
+        Returns:
+            Tuple: select_related lookups, prefetch_related lookups and annotations
+        """
+        return _data_needs(cls)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Apply this serializer's data needs to a queryset.
+
+        Args:
+            queryset: A queryset of the serializer's model
+
+        Returns:
+            QuerySet: The queryset with joins, prefetches and annotations added
+        """
+        select, prefetch, annotations = cls.get_data_needs()
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        missing = {name: expression for name, expression in annotations.items() if name not in queryset.query.annotations}
+        if missing:
+            queryset = queryset.annotate(**missing)
+        return queryset
+
+    @classmethod
+    def eager_load(cls, objects):
+        """
+        Load this serializer's data needs for a queryset or a list of objects.
+
+        Lists, such as those returned by services, get their relations
+        prefetched in bulk; annotations cannot be added to them.
+
+        Args:
+            objects: A queryset or a list of model instances
+
+        Returns:
+            The queryset with data needs applied, or the same list
+        """
+        if isinstance(objects, QuerySet):
+            if objects.query.is_sliced:
+                objects = list(objects)
+            else:
+                return cls.setup_eager_loading(objects)
+        select, prefetch, _annotations = cls.get_data_needs()
+        if objects and (select or prefetch):
+            prefetch_related_objects(objects, *select, *prefetch)
+        return objects
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from experiences.models import Experience, PlayerExperience, Power, PlayerPower
+from .eager_loading import EagerLoadingMixin
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:matrix_flow]
@@ -22,7 +23,7 @@ class PowerSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-class PlayerPowerSerializer(serializers.ModelSerializer):
+class PlayerPowerSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the PlayerPower model."""
     power_details = PowerSerializer(source='power', read_only=True)
     
@@ -58,7 +59,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-class PlayerExperienceSerializer(serializers.ModelSerializer):
+class PlayerExperienceSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the PlayerExperience model."""
     experience_details = ExperienceSerializer(source='experience', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from innovations.models import Innovation, InnovationContribution, TechTreeNode
+from .eager_loading import EagerLoadingMixin
 from .zone_serializers import SectorSerializer, ZoneSerializer
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -9,11 +10,13 @@ from .zone_serializers import SectorSerializer, ZoneSerializer
 # See .claude/README.md for more information
 # [CLAUDE:OPTIMIZATION_LAYER:END]
 
-class TechTreeNodeSerializer(serializers.ModelSerializer):
+class TechTreeNodeSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the TechTreeNode model."""
     sector_details = SectorSerializer(source='sector', read_only=True)
     unlocked_by_innovation_details = serializers.SerializerMethodField(read_only=True)
     
+    select_related_fields = ('unlocked_by_innovation',)
+    
     class Meta:
         model = TechTreeNode
         fields = [
@@ -37,7 +40,7 @@ class TechTreeNodeSerializer(serializers.ModelSerializer):
             }
         return None
 
-class InnovationSerializer(serializers.ModelSerializer):
+class InnovationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the Innovation model."""
     sector_details = SectorSerializer(source='sector', read_only=True)
     zones_details = ZoneSerializer(source='zones', many=True, read_only=True)
@@ -63,7 +66,7 @@ class InnovationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-class InnovationContributionSerializer(serializers.ModelSerializer):
+class InnovationContributionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the InnovationContribution model."""
     innovation_details = InnovationSerializer(source='innovation', read_only=True)
     stage_display = serializers.CharField(source='get_stage_display', read_only=True)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from core.models import MarketItem, Wishlist
+from .eager_loading import EagerLoadingMixin
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:OPTIMIZATION_LAYER:START]
@@ -33,7 +34,7 @@ class MarketItemSerializer(serializers.ModelSerializer):
             'category_display', 'seller_type_display'
         ]
 
-class WishlistSerializer(serializers.ModelSerializer):
+class WishlistSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the Wishlist model."""
     item_details = MarketItemSerializer(source='item', read_only=True)
     
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from core.models import PlayerProfile, PlayerHappiness, UserPreferences, UserLocation
+from .eager_loading import EagerLoadingMixin
 from studious_engine.users.api.serializers import UserSerializer
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -23,7 +24,7 @@ class PlayerHappinessSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'profile', 'created_at', 'updated_at']
 
 
-class PlayerProfileSerializer(serializers.ModelSerializer):
+class PlayerProfileSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the PlayerProfile model."""
     
     user = UserSerializer(read_only=True)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from zones.models import Sector, Zone, ZoneHappiness, PlayerZoneContribution
+from .eager_loading import EagerLoadingMixin
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:zone_geographic_patterns]
@@ -33,7 +34,7 @@ class ZoneHappinessSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'last_calculated']
 
-class ZoneSerializer(serializers.ModelSerializer):
+class ZoneSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the Zone model."""
     sector_details = SectorSerializer(source='sector', read_only=True)
     area_display = serializers.CharField(source='get_area_display', read_only=True)
@@ -53,7 +54,7 @@ class ZoneSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-class PlayerZoneContributionSerializer(serializers.ModelSerializer):
+class PlayerZoneContributionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for the PlayerZoneContribution model."""
     zone_details = ZoneSerializer(source='zone', read_only=True)
     
@@ -3,6 +3,11 @@ from .art_service import ArtService
 from .mastery_service import MasteryService
 from .tech_tree_service import TechTreeService
 from .practice_service import PracticeService
+from .catalog_service import CatalogService
+from .tech_tree_graph import TechTreeGraph, get_tech_tree_graph
+from .tech_tree_layout import get_tech_tree_layout
+from .art_structure import ArtStructure, get_art_structure
+from .taxonomy_tree import TaxonomyForest, get_taxonomy_forest
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:OPTIMIZATION_LAYER:START]
@@ -14,5 +19,13 @@ __all__ = [
     'ArtService',
     'MasteryService',
     'TechTreeService',
-    'PracticeService'
+    'PracticeService',
+    'CatalogService',
+    'TechTreeGraph',
+    'get_tech_tree_graph',
+    'get_tech_tree_layout',
+    'ArtStructure',
+    'get_art_structure',
+    'TaxonomyForest',
+    'get_taxonomy_forest'
 ] 
\ No newline at end of file
@@ -17,11 +17,17 @@ from core.models import (
     ArtParts, 
     ArtTaxonomy, 
     ArtStage,
+    ArtVirtue,
     ArtMastery, 
     UserArtStageProgress,
     PlayerProfile
 )
 
+from core.services.profile_cache import get_profile_snapshot
+
+from .art_structure import get_art_structure
+from .catalog_service import ALLOWED_ECONOMIC_LAYERS
+
 User = get_user_model()
 
 class ArtService:
@@ -84,7 +90,7 @@ class ArtService:
                 raise ValueError(f"Art with ID {art} does not exist")
         
         # Get next order index
-        order_index = ArtParts.objects.filter(art=art).count()
+        order_index = get_art_structure(art).part_count
         
         part = ArtParts.objects.create(
             art=art,
@@ -120,7 +126,7 @@ class ArtService:
                 raise ValueError(f"Art with ID {art} does not exist")
         
         # Get next order index
-        order_index = ArtStage.objects.filter(art=art).count()
+        order_index = get_art_structure(art).stage_count
         
         stage = ArtStage.objects.create(
             art=art,
@@ -172,23 +178,21 @@ class ArtService:
                     except ArtParts.DoesNotExist:
                         initial_part = None
             
-            if not initial_part:
-                initial_part = ArtParts.objects.filter(art=art).order_by('order_index').first()
+            structure = get_art_structure(art)
             
             # Create the mastery record
             mastery = ArtMastery.objects.create(
                 user=user,
                 art=art,
                 discovery_date=timezone.now(),
-                current_part=initial_part
+                current_part_id=initial_part.id if initial_part else structure.first_part_id
             )
             
             # Initialize first stage progress if stages exist
-            first_stage = ArtStage.objects.filter(art=art).order_by('order_index').first()
-            if first_stage:
+            if structure.first_stage_id:
                 UserArtStageProgress.objects.create(
                     user=user,
-                    art_stage=first_stage,
+                    art_stage_id=structure.first_stage_id,
                     is_current=True
                 )
                 
@@ -231,23 +235,14 @@ class ArtService:
         
         # Apply economic layer and rank filters if requested
         if economic_filter or rank_filter:
-            try:
-                profile = PlayerProfile.objects.get(user=user)
-                
+            profile = get_profile_snapshot(user)
+            if profile is not None:
                 if economic_filter:
-                    economic_layers = {
-                        'port': ['PORT'],
-                        'laws': ['PORT', 'LAWS'],
-                        'republic': ['PORT', 'LAWS', 'REPUBLIC']
-                    }
-                    allowed_layers = economic_layers.get(profile.economic_layer, ['PORT'])
+                    allowed_layers = ALLOWED_ECONOMIC_LAYERS.get(profile.economic_layer, ALLOWED_ECONOMIC_LAYERS['port'])
                     available_arts = available_arts.filter(economic_layer_required__in=allowed_layers)
                 
                 if rank_filter:
                     available_arts = available_arts.filter(rank_required__lte=profile.rank)
-            
-            except PlayerProfile.DoesNotExist:
-                pass
         
         return available_arts
     
@@ -293,18 +288,34 @@ class ArtService:
         Returns:
             list: List of Art objects
         """
-        # Note: This is a simplistic implementation that assumes virtues are stored
-        # in a predictable format in the improved_virtues JSONField
-        results = []
+        return list(
+            Art.objects.filter(virtue_index__virtue=virtue_name.lower())
+            .order_by('-virtue_index__impact', 'name')[:limit]
+        )
+    
+    @staticmethod
+    def index_art_virtues(art):
+        """
+        Rebuild the virtue index rows for an art from its improved_virtues.
         
-        for art in Art.objects.all():
-            virtues = art.improved_virtues or {}
-            if virtue_name.lower() in [k.lower() for k in virtues.keys()]:
-                results.append(art)
-                if len(results) >= limit:
-                    break
-                    
-        return results
+        Args:
+            art: The Art object
+            
+        Returns:
+            list: The art's ArtVirtue rows
+        """
+        rows = ArtVirtue.rows_for(art)
+        with transaction.atomic():
+            ArtVirtue.objects.filter(art_id=art.pk).exclude(virtue__in=[row.virtue for row in rows]).delete()
+            if rows:
+                ArtVirtue.objects.bulk_create(
+                    rows,
+                    update_conflicts=True,
+                    unique_fields=['art', 'virtue'],
+                    update_fields=['impact']
+                )
+        art._stored_improved_virtues = art.improved_virtues
+        return rows
     
     @staticmethod
     def get_related_arts(art, limit=3):
@@ -325,7 +336,7 @@ class ArtService:
         if related_arts.count() < limit:
             primary_virtue = art.primary_virtue
             if primary_virtue:
-                virtue_arts = Art.objects.filter(improved_virtues__has_key=primary_virtue)
+                virtue_arts = Art.objects.filter(virtue_index__virtue=primary_virtue.lower())
                 virtue_arts = virtue_arts.exclude(id=art.id).exclude(id__in=[a.id for a in related_arts])
                 related_arts = list(related_arts) + list(virtue_arts)
         
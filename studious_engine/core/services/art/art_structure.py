@@ -0,0 +1,253 @@
+import bisect
+import threading
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+from core.models import Art, ArtParts, ArtStage
+from core.services.on_commit import get_transaction_snapshot, queue_on_commit
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+STRUCTURE_VERSION_CACHE_KEY = 'core:art_structure:{art_id}:version'
+STRUCTURE_CACHE_KEY = 'core:art_structure:{art_id}:{version}'
+STRUCTURE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Structures kept in the process, least recently used first
+STRUCTURE_LOCAL_CACHE_SIZE = 512
+
+_structures = OrderedDict()
+_structures_lock = threading.Lock()
+
+
+class ArtStructure:
+    """
+    Immutable snapshot of an art's parts and stages.
+
+    Parts and stages are kept in order_index order, so counts, neighbours and
+    stage thresholds are answered without touching the database.
+    """
+
+    def __init__(self, art_id, parts, stages, version=None):
+        """
+        Build the structure from ordered part and stage rows.
+
+        Args:
+            art_id: The Art ID
+            parts: Iterable of (part_id, order_index) tuples
+            stages: Iterable of (stage_id, order_index, mastery_threshold) tuples
+            version: The structure version this snapshot was built for
+        """
+        self.art_id = art_id
+        self.version = version
+
+        parts = sorted(parts, key=lambda part: part[1])
+        self.part_ids = tuple(part_id for part_id, _ in parts)
+        self.part_order_indexes = tuple(order_index for _, order_index in parts)
+        self._part_positions = {part_id: i for i, part_id in enumerate(self.part_ids)}
+
+        stages = sorted(stages, key=lambda stage: stage[1])
+        self.stage_ids = tuple(stage_id for stage_id, _, _ in stages)
+        self.stage_order_indexes = tuple(order_index for _, order_index, _ in stages)
+        self.stage_thresholds = tuple(threshold for _, _, threshold in stages)
+        self._stage_positions = {stage_id: i for i, stage_id in enumerate(self.stage_ids)}
+
+        # Level needed to reach each stage walking the stages in order: the
+        # running maximum of the thresholds after the first (always reached)
+        # stage. Non-decreasing, so it can be bisected.
+        reach = []
+        for i, threshold in enumerate(self.stage_thresholds):
+            reach.append(float('-inf') if i == 0 else max(reach[-1], threshold))
+        self._stage_reach = tuple(reach)
+
+    @classmethod
+    def load(cls, art_id, version=None):
+        """
+        Build the structure from the database in two queries.
+
+        Args:
+            art_id: The Art ID
+            version: The structure version to tag the snapshot with
+
+        Returns:
+            ArtStructure: The structure
+        """
+        parts = ArtParts.objects.filter(art_id=art_id).order_by().values_list('id', 'order_index')
+        stages = ArtStage.objects.filter(art_id=art_id).order_by().values_list(
+            'id', 'order_index', 'mastery_threshold'
+        )
+        return cls(art_id, list(parts), list(stages), version=version)
+
+    def to_blob(self):
+        """Serialise the structure for the shared cache."""
+        return {
+            'parts': [[str(part_id), order_index] for part_id, order_index in zip(self.part_ids, self.part_order_indexes)],
+            'stages': [
+                [str(stage_id), order_index, threshold]
+                for stage_id, order_index, threshold in zip(
+                    self.stage_ids, self.stage_order_indexes, self.stage_thresholds
+                )
+            ],
+        }
+
+    @classmethod
+    def from_blob(cls, art_id, blob, version=None):
+        """Rebuild a structure serialised with to_blob()."""
+        return cls(
+            art_id,
+            [(uuid.UUID(part_id), order_index) for part_id, order_index in blob['parts']],
+            [(uuid.UUID(stage_id), order_index, threshold) for stage_id, order_index, threshold in blob['stages']],
+            version=version
+        )
+
+    @property
+    def part_count(self):
+        """Number of parts the art has."""
+        return len(self.part_ids)
+
+    @property
+    def stage_count(self):
+        """Number of stages the art has."""
+        return len(self.stage_ids)
+
+    @property
+    def first_part_id(self):
+        """ID of the first part, or None if the art has no parts."""
+        return self.part_ids[0] if self.part_ids else None
+
+    @property
+    def first_stage_id(self):
+        """ID of the first stage, or None if the art has no stages."""
+        return self.stage_ids[0] if self.stage_ids else None
+
+    def _neighbour(self, ids, order_indexes, positions, node_id, offset):
+        i = positions.get(node_id)
+        if i is None or not 0 <= i + offset < len(ids):
+            return None
+        # Only direct neighbours in order_index, as the per-row lookups were
+        if order_indexes[i + offset] != order_indexes[i] + offset:
+            return None
+        return ids[i + offset]
+
+    def next_part_id(self, part_id):
+        """Get the ID of the part following part_id, or None if it is the last."""
+        return self._neighbour(self.part_ids, self.part_order_indexes, self._part_positions, part_id, 1)
+
+    def previous_part_id(self, part_id):
+        """Get the ID of the part preceding part_id, or None if it is the first."""
+        return self._neighbour(self.part_ids, self.part_order_indexes, self._part_positions, part_id, -1)
+
+    def next_stage_id(self, stage_id):
+        """Get the ID of the stage following stage_id, or None if it is the last."""
+        return self._neighbour(self.stage_ids, self.stage_order_indexes, self._stage_positions, stage_id, 1)
+
+    def stage_position(self, stage_id):
+        """Get the position of a stage in order, or None if it is not one of this art's stages."""
+        return self._stage_positions.get(stage_id)
+
+    def stage_position_for_level(self, mastery_level):
+        """
+        Get the position of the furthest stage a mastery level reaches.
+
+        Args:
+            mastery_level: The mastery level
+
+        Returns:
+            int: Stage position, or -1 if the art has no stages
+        """
+        return bisect.bisect_right(self._stage_reach, mastery_level) - 1
+
+
+def _art_id(art):
+    art_id = art.pk if isinstance(art, Art) else art
+    return art_id if isinstance(art_id, uuid.UUID) else uuid.UUID(str(art_id))
+
+
+class _ArtStructureInvalidation:
+    """On-commit callback bumping one art's structure version."""
+
+    def __init__(self, art_id):
+        self.art_id = art_id
+
+    def __call__(self):
+        cache.set(STRUCTURE_VERSION_CACHE_KEY.format(art_id=self.art_id), uuid.uuid4().hex, timeout=None)
+        with _structures_lock:
+            _structures.pop(self.art_id, None)
+
+
+def _get_local(art_id, version):
+    """Get a structure kept in the process if it is at the given version."""
+    with _structures_lock:
+        structure = _structures.get(art_id)
+        if structure is None or structure.version != version:
+            return None
+        _structures.move_to_end(art_id)
+        return structure
+
+
+def _set_local(art_id, structure):
+    """Keep a structure in the process, evicting the least recently used past the limit."""
+    with _structures_lock:
+        _structures[art_id] = structure
+        _structures.move_to_end(art_id)
+        while len(_structures) > STRUCTURE_LOCAL_CACHE_SIZE:
+            _structures.popitem(last=False)
+
+
+def invalidate_art_structure(art):
+    """
+    Bump an art's structure version so every process rebuilds it on next access.
+
+    A new version published before commit would let another process cache
+    the art's old parts and stages under it, so the bump waits for commit.
+    Until then, structure reads in this transaction are built from its own
+    uncommitted rows.
+
+    Args:
+        art: The Art object or ID
+    """
+    art_id = _art_id(art)
+    queue_on_commit(STRUCTURE_VERSION_CACHE_KEY.format(art_id=art_id), _ArtStructureInvalidation(art_id))
+
+
+def get_art_structure(art):
+    """
+    Get an art's structure from the process-local cache, then the shared cache,
+    building it from the database only if neither is current.
+
+    Args:
+        art: The Art object or ID
+
+    Returns:
+        ArtStructure: The art's structure
+    """
+    art_id = _art_id(art)
+    version_key = STRUCTURE_VERSION_CACHE_KEY.format(art_id=art_id)
+    structure = get_transaction_snapshot(version_key, lambda: ArtStructure.load(art_id))
+    if structure is not None:
+        return structure
+
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(version_key)
+
+    structure = _get_local(art_id, version)
+    if structure is not None:
+        return structure
+
+    key = STRUCTURE_CACHE_KEY.format(art_id=art_id, version=version)
+    blob = cache.get(key)
+    if blob is not None:
+        structure = ArtStructure.from_blob(art_id, blob, version=version)
+    else:
+        structure = ArtStructure.load(art_id, version=version)
+        cache.set(key, structure.to_blob(), STRUCTURE_CACHE_TIMEOUT)
+
+    _set_local(art_id, structure)
+    return structure
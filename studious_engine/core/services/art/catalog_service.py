@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+import uuid
+
+from django.db.models import Q
+
+from core.models import Art
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+# Art economic layers open to each player economic layer
+ALLOWED_ECONOMIC_LAYERS = {
+    'port': ('PORT',),
+    'laws': ('PORT', 'LAWS'),
+    'republic': ('PORT', 'LAWS', 'REPUBLIC'),
+}
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class CatalogService:
+    """
+    Service for browsing the art catalog as seen by a player.
+
+    Which arts a player can see depends only on their economic layer and
+    rank, and is applied as a filter in the same query that pages the arts.
+    """
+
+    @staticmethod
+    def visibility_filter(economic_layer, rank):
+        """
+        Get the filter selecting the arts visible to an economic layer and rank.
+
+        Args:
+            economic_layer: Player economic layer ('port', 'laws' or 'republic')
+            rank: Player rank
+
+        Returns:
+            Q: Filter on Art
+        """
+        allowed_layers = ALLOWED_ECONOMIC_LAYERS.get(economic_layer, ALLOWED_ECONOMIC_LAYERS['port'])
+        return Q(economic_layer_required__in=allowed_layers, rank_required__lte=rank)
+
+    @staticmethod
+    def encode_cursor(art):
+        """Encode the keyset position after an art as an opaque cursor."""
+        raw = json.dumps([art.name, str(art.id)]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        Decode a cursor made by encode_cursor.
+
+        Args:
+            cursor: The cursor string
+
+        Returns:
+            Tuple[str, uuid.UUID]: The (name, id) position
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            name, art_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return str(name), uuid.UUID(art_id)
+        except (binascii.Error, TypeError, ValueError, UnicodeDecodeError):
+            raise ValueError(f"Invalid catalog cursor {cursor}") from None
+
+    @staticmethod
+    def get_catalog_page(profile, cursor=None, limit=DEFAULT_PAGE_SIZE, queryset=None):
+        """
+        Get one page of the arts visible to a player, ordered by name.
+
+        Pages are found by keyset on (name, id), so every page costs one
+        indexed range scan however deep it is.
+
+        Args:
+            profile: The PlayerProfile object
+            cursor: Optional cursor returned with the previous page
+            limit: Maximum number of arts to return
+            queryset: Optional Art queryset with further filters applied
+
+        Returns:
+            Dict: 'results' (list of Art objects) and 'next_cursor' (str or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        arts = queryset if queryset is not None else Art.objects.all()
+        arts = arts.filter(CatalogService.visibility_filter(profile.economic_layer, profile.rank))
+
+        if cursor:
+            name, art_id = CatalogService.decode_cursor(cursor)
+            arts = arts.filter(Q(name__gt=name) | Q(name=name, id__gt=art_id))
+
+        results = list(arts.order_by('name', 'id')[:limit + 1])
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = CatalogService.encode_cursor(results[-1])
+
+        return {'results': results, 'next_cursor': next_cursor}
@@ -4,7 +4,8 @@ from django.contrib.auth import get_user_model
 from typing import Dict, List, Union
 import uuid
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Avg, Count, Sum, Q
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Q, Subquery, Sum
 
 from core.models import (
 
@@ -17,14 +18,32 @@ from core.models import (
 # [CLAUDE:OPTIMIZATION_LAYER:END]
     Art, 
     ArtParts,
-    ArtStage,
+    ArtVirtue,
     ArtMastery,
     UserArtStageProgress,
     PlayerProfile
 )
 
+from core.services.on_commit import queue_on_commit
+
+from .art_structure import get_art_structure
+from .taxonomy_tree import get_taxonomy_forest
+
 User = get_user_model()
 
+MASTERY_SUMMARY_CACHE_KEY = 'core:mastery_summary:{user_id}'
+MASTERY_SUMMARY_CACHE_TIMEOUT = 60 * 60
+
+
+class _MasterySummaryInvalidation:
+    """Callback dropping one user's cached mastery summary."""
+    
+    def __init__(self, user_id):
+        self.user_id = user_id
+    
+    def __call__(self):
+        cache.delete(MASTERY_SUMMARY_CACHE_KEY.format(user_id=self.user_id))
+
 class MasteryService:
     """
     Service for managing user art mastery and progression.
@@ -105,61 +124,104 @@ class MasteryService:
         Returns:
             UserArtStageProgress: The current stage progress
         """
-        # Get all stages for this art
-        stages = ArtStage.objects.filter(art=mastery.art).order_by('order_index')
-        if not stages.exists():
-            return None
-        
-        # Get the user's current stage progress
-        current_progress = UserArtStageProgress.objects.filter(
-            user=mastery.user,
-            art_stage__art=mastery.art,
-            is_current=True
-        ).first()
-        
-        # If no current progress, initialize with the first stage
-        if not current_progress:
-            first_stage = stages.first()
-            current_progress = UserArtStageProgress.objects.create(
-                user=mastery.user,
-                art_stage=first_stage,
-                is_current=True
-            )
-            return current_progress
-        
-        # Check if the mastery level qualifies for the next stage
-        current_stage = current_progress.art_stage
-        next_stage = ArtStage.objects.filter(
-            art=mastery.art,
-            order_index__gt=current_stage.order_index
-        ).order_by('order_index').first()
-        
-        if next_stage and mastery.mastery_level >= next_stage.mastery_threshold:
-            # Complete current stage
-            current_progress.is_current = False
-            current_progress.completion_percentage = 100
-            current_progress.save()
+        current_progress = MasteryService.advance_stages(mastery)[0]
+        return current_progress
+    
+    @staticmethod
+    def advance_stages(mastery):
+        """
+        Move a user straight to the furthest stage their mastery level reaches.
+        
+        The target stage is found by bisecting the art's cached stage
+        thresholds. Every stage passed on the way is recorded as completed,
+        with missing progress rows created in one bulk_create.
+        
+        Args:
+            mastery: The ArtMastery object
             
-            # Create new stage progress
-            new_progress = UserArtStageProgress.objects.create(
-                user=mastery.user,
-                art_stage=next_stage,
-                is_current=True
+        Returns:
+            Tuple[UserArtStageProgress, List[Dict]]: The current stage progress and the
+            stage transitions made, in order, each with 'from_stage_id', 'to_stage_id'
+            and 'progress'
+        """
+        structure = get_art_structure(mastery.art_id)
+        if not structure.stage_count:
+            return None, []
+        
+        rows = {
+            progress.art_stage_id: progress
+            for progress in UserArtStageProgress.objects.filter(
+                user_id=mastery.user_id,
+                art_stage_id__in=structure.stage_ids
             )
-            return new_progress
+        }
+        current_progress = next((progress for progress in rows.values() if progress.is_current), None)
+        current_position = -1
+        if current_progress is not None:
+            current_position = structure.stage_position(current_progress.art_stage_id)
+        
+        # Never move backwards; the first stage is always reached
+        target_position = max(current_position, structure.stage_position_for_level(mastery.mastery_level), 0)
+        
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        transitions = []
+        
+        if target_position > current_position:
+            if current_progress is not None:
+                current_progress.is_current = False
+                current_progress.completion_percentage = 100
+                to_update.append(current_progress)
+            
+            for position in range(current_position + 1, target_position + 1):
+                stage_id = structure.stage_ids[position]
+                reached = position == target_position
+                progress = rows.get(stage_id)
+                if progress is None:
+                    progress = UserArtStageProgress(
+                        user_id=mastery.user_id,
+                        art_stage_id=stage_id,
+                        reached_date=now
+                    )
+                    to_create.append(progress)
+                else:
+                    to_update.append(progress)
+                progress.is_current = reached
+                progress.completion_percentage = 0 if reached else 100
+                
+                transitions.append({
+                    'from_stage_id': structure.stage_ids[position - 1] if position > 0 else None,
+                    'to_stage_id': stage_id,
+                    'progress': progress
+                })
+            
+            current_progress = progress
         
         # Update completion percentage within the current stage
-        if current_stage.order_index < len(stages) - 1:
-            next_threshold = next_stage.mastery_threshold
-            prev_threshold = current_stage.mastery_threshold
-            stage_range = next_threshold - prev_threshold
+        if target_position < structure.stage_count - 1:
+            prev_threshold = structure.stage_thresholds[target_position]
+            stage_range = structure.stage_thresholds[target_position + 1] - prev_threshold
             if stage_range > 0:
                 relative_progress = mastery.mastery_level - prev_threshold
-                percentage = min(100, int((relative_progress / stage_range) * 100))
-                current_progress.completion_percentage = percentage
-                current_progress.save()
+                percentage = max(0, min(100, int((relative_progress / stage_range) * 100)))
+                if percentage != current_progress.completion_percentage:
+                    current_progress.completion_percentage = percentage
+                    if current_progress not in to_create and current_progress not in to_update:
+                        to_update.append(current_progress)
         
-        return current_progress
+        if to_create or to_update:
+            with transaction.atomic():
+                if to_update:
+                    for progress in to_update:
+                        progress.updated_at = now
+                    UserArtStageProgress.objects.bulk_update(
+                        to_update, ['is_current', 'completion_percentage', 'updated_at']
+                    )
+                if to_create:
+                    UserArtStageProgress.objects.bulk_create(to_create)
+        
+        return current_progress, transitions
     
     @staticmethod
     def apply_mastery_benefits(mastery):
@@ -225,13 +287,14 @@ class MasteryService:
                 except:
                     pass
             
-            profile.save()
+            if benefits['xp_awarded'] > 0:
+                profile.save(update_fields=['experience_points', 'updated_at'])
         except PlayerProfile.DoesNotExist:
             pass
         
         # Save mastery achievements
         if benefits['xp_awarded'] > 0:
-            mastery.save()
+            mastery.save(update_fields=['mastery_achievements', 'updated_at'])
             
         return benefits
     
@@ -271,9 +334,12 @@ class MasteryService:
         """
         Get a summary of a user's mastery across all arts.
         
+        The summary is cached per user until their masteries or practice
+        sessions change, or the taxonomy forest it was rolled up with does.
+        
         Args:
             user: The User object or ID
-            
+        
         Returns:
             Dict: Dictionary with mastery statistics
         """
@@ -283,72 +349,127 @@ class MasteryService:
             except User.DoesNotExist:
                 raise ValueError(f"User with ID {user} does not exist")
         
-        masteries = ArtMastery.objects.filter(user=user)
+        forest = get_taxonomy_forest()
+        if forest.version is None:
+            # Uncommitted taxonomy changes; don't cache a summary built on them
+            return MasteryService._build_mastery_summary(user, forest)
         
-        # Calculate various statistics
-        total_arts = masteries.count()
-        completed_arts = masteries.filter(mastery_level=100).count()
-        in_progress = total_arts - completed_arts
+        key = MASTERY_SUMMARY_CACHE_KEY.format(user_id=user.id)
+        cached = cache.get(key)
+        if cached is not None and cached['forest_version'] == forest.version:
+            return cached['summary']
         
-        # Calculate average mastery level
-        if total_arts > 0:
-            avg_mastery = sum(m.mastery_level for m in masteries) / total_arts
-        else:
-            avg_mastery = 0
+        summary = MasteryService._build_mastery_summary(user, forest)
+        cache.set(key, {'forest_version': forest.version, 'summary': summary}, MASTERY_SUMMARY_CACHE_TIMEOUT)
+        return summary
+    
+    @staticmethod
+    def invalidate_mastery_summary(user_id):
+        """
+        Drop a user's cached mastery summary, now and again once the current
+        transaction commits.
         
-        # Find most practiced art
-        if total_arts > 0:
-            most_practiced = max(
-                masteries,
-                key=lambda m: len(m.practice_history) if m.practice_history else 0
-            )
-            most_practiced_name = most_practiced.art.name
-            most_practiced_sessions = len(most_practiced.practice_history) if most_practiced.practice_history else 0
-        else:
-            most_practiced_name = None
-            most_practiced_sessions = 0
-        
-        # Find highest level art
-        if total_arts > 0:
-            highest_level = max(masteries, key=lambda m: m.mastery_level)
-            highest_level_name = highest_level.art.name
-            highest_level_value = highest_level.mastery_level
-        else:
-            highest_level_name = None
-            highest_level_value = 0
+        Args:
+            user_id: The User ID
+        """
+        invalidation = _MasterySummaryInvalidation(user_id)
+        invalidation()
+        queue_on_commit(MASTERY_SUMMARY_CACHE_KEY.format(user_id=user_id), invalidation)
+    
+    @staticmethod
+    def _build_mastery_summary(user, forest):
+        """Compute the mastery summary with one grouped query and a virtue aggregate."""
+        masteries = ArtMastery.objects.filter(user=user)
+        
+        # The top arts are uncorrelated subqueries, evaluated once for the
+        # whole statement rather than per taxonomy group
+        highest = masteries.order_by('-mastery_level', 'art__name')
+        practiced = masteries.annotate(
+            session_count=Count('art__practice_sessions', filter=Q(art__practice_sessions__user=user))
+        ).order_by('-session_count', 'art__name')
+        
+        # Counts and levels per taxonomy; the overall figures are their sums
+        groups = list(
+            masteries.values('art__taxonomy_id', 'art__taxonomy__name', 'art__taxonomy__path').annotate(
+                count=Count('id'),
+                completed=Count('id', filter=Q(mastery_level__gte=100)),
+                avg_level=Avg('mastery_level'),
+                total_level=Sum('mastery_level'),
+                highest_name=Subquery(highest.values('art__name')[:1]),
+                highest_level=Subquery(highest.values('mastery_level')[:1]),
+                most_practiced_name=Subquery(practiced.values('art__name')[:1]),
+                most_practiced_sessions=Subquery(practiced.values('session_count')[:1]),
+            ).order_by()
+        )
+        total_arts = sum(group['count'] for group in groups)
+        completed_arts = sum(group['completed'] for group in groups)
+        total_level = sum(group['total_level'] for group in groups)
+        top = groups[0] if groups else {}
         
-        # Group masteries by taxonomy
         taxonomy_groups = {}
-        for mastery in masteries:
-            if mastery.art.taxonomy:
-                taxonomy = mastery.art.taxonomy.name
-                if taxonomy not in taxonomy_groups:
-                    taxonomy_groups[taxonomy] = {
-                        'count': 0,
-                        'avg_level': 0,
-                        'total_level': 0
-                    }
-                taxonomy_groups[taxonomy]['count'] += 1
-                taxonomy_groups[taxonomy]['total_level'] += mastery.mastery_level
-        
-        # Calculate average level for each taxonomy
-        for taxonomy, data in taxonomy_groups.items():
-            if data['count'] > 0:
-                data['avg_level'] = data['total_level'] / data['count']
-            del data['total_level']  # Remove the helper field
+        for group in groups:
+            if group['art__taxonomy_id'] is None:
+                continue
+            data = taxonomy_groups.get(group['art__taxonomy__name'])
+            if data is None:
+                taxonomy_groups[group['art__taxonomy__name']] = {
+                    'count': group['count'], 'avg_level': group['avg_level']
+                }
+            else:
+                # Distinct taxonomies sharing a name are reported together
+                count = data['count'] + group['count']
+                data['avg_level'] = (
+                    data['avg_level'] * data['count'] + group['avg_level'] * group['count']
+                ) / count
+                data['count'] = count
+        
+        # Roll the groups up to the top-level categories through their
+        # materialised paths, which list every ancestor of the taxonomy
+        category_totals = {str(taxonomy_id): [0, 0] for taxonomy_id in forest.ids_at_level(1)}
+        for group in groups:
+            for ancestor_id in (group['art__taxonomy__path'] or '').split('/'):
+                if ancestor_id in category_totals:
+                    category_totals[ancestor_id][0] += group['total_level']
+                    category_totals[ancestor_id][1] += group['count']
+        categories = []
+        for taxonomy_id in forest.ids_at_level(1):
+            category_total, category_count = category_totals[str(taxonomy_id)]
+            categories.append({
+                'id': str(taxonomy_id),
+                'name': forest.name(taxonomy_id),
+                'count': category_count,
+                'average_mastery': category_total / category_count if category_count else 0
+            })
+        
+        # An art has several virtues, so joining them into the rows above
+        # would repeat each mastery once per virtue
+        virtue_groups = {
+            row['virtue']: {
+                'count': row['count'],
+                'avg_level': row['avg_level'],
+                'weighted_impact': row['weighted_impact']
+            }
+            for row in ArtVirtue.objects.filter(art__masteries__user=user).values('virtue').annotate(
+                count=Count('art_id'),
+                avg_level=Avg('art__masteries__mastery_level'),
+                weighted_impact=Sum(F('impact') * F('art__masteries__mastery_level') / 100.0)
+            ).order_by('virtue')
+        }
         
         return {
             'total_arts': total_arts,
             'completed_arts': completed_arts,
-            'in_progress': in_progress,
-            'avg_mastery': avg_mastery,
+            'in_progress': total_arts - completed_arts,
+            'avg_mastery': total_level / total_arts if total_arts else 0,
             'most_practiced': {
-                'name': most_practiced_name,
-                'sessions': most_practiced_sessions
+                'name': top.get('most_practiced_name'),
+                'sessions': top.get('most_practiced_sessions', 0)
             },
             'highest_level': {
-                'name': highest_level_name,
-                'level': highest_level_value
+                'name': top.get('highest_name'),
+                'level': top.get('highest_level', 0)
             },
-            'taxonomy_groups': taxonomy_groups
-        } 
\ No newline at end of file
+            'taxonomy_groups': taxonomy_groups,
+            'categories': categories,
+            'virtue_groups': virtue_groups
+        }
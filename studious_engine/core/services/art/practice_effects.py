@@ -0,0 +1,97 @@
+from django.db import transaction
+from django.db.models import F
+
+from core.models import ArtMastery, PlayerProfile
+from core.services.on_commit import get_queued, queue_on_commit
+from core.services.profile_cache import invalidate_profile_snapshot
+
+from .mastery_service import MasteryService
+from .tech_tree_service import TechTreeService
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:experience_progression]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+PRACTICE_EFFECTS_KEY = 'core:practice_effects'
+
+
+class PracticeEffectBatch:
+    """
+    Side effects of logged practice, collected per transaction and applied
+    together once it commits.
+
+    Several practice logs in one transaction share a batch, so XP is awarded
+    with one update per user and every mastery is evaluated once.
+    """
+
+    def __init__(self):
+        self.xp_by_user = {}
+        self.mastery_ids = set()
+        self.mastery_levels = {}
+        self.stage_transitions = []
+
+    def add(self, mastery, xp=0, level_changed=False):
+        """
+        Queue the side effects of practice on a mastery.
+
+        Args:
+            mastery: The ArtMastery that was practiced
+            xp: Experience points to award the user
+            level_changed: Whether the practice changed the mastery level
+        """
+        if xp:
+            self.xp_by_user[mastery.user_id] = self.xp_by_user.get(mastery.user_id, 0) + xp
+        self.mastery_ids.add(mastery.id)
+        if level_changed:
+            self.mastery_levels.setdefault(mastery.user_id, {})[mastery.art_id] = mastery.mastery_level
+
+    def __call__(self):
+        self.flush()
+
+    def flush(self):
+        """
+        Apply the queued XP, stage, benefit and tech tree effects.
+
+        Stage transitions made are collected in stage_transitions.
+        """
+        with transaction.atomic():
+            for user_id, xp in self.xp_by_user.items():
+                PlayerProfile.objects.filter(user_id=user_id).update(
+                    experience_points=F('experience_points') + xp
+                )
+                # update() sends no signals
+                invalidate_profile_snapshot(user_id)
+
+            for mastery in ArtMastery.objects.filter(id__in=self.mastery_ids).select_related('art', 'user'):
+                _, transitions = MasteryService.advance_stages(mastery)
+                self.stage_transitions.extend(transitions)
+                # Benefits follow the mastery level, so only a new level can earn more
+                if mastery.art_id in self.mastery_levels.get(mastery.user_id, ()):
+                    MasteryService.apply_mastery_benefits(mastery)
+
+            for user_id, mastery_levels in self.mastery_levels.items():
+                TechTreeService.apply_mastery_changes(user_id, mastery_levels)
+
+
+def queue_practice_effects(mastery, xp=0, level_changed=False):
+    """
+    Queue practice side effects to run after the current transaction commits.
+
+    Outside a transaction the effects are applied immediately.
+
+    Args:
+        mastery: The ArtMastery that was practiced
+        xp: Experience points to award the user
+        level_changed: Whether the practice changed the mastery level
+    """
+    batch = get_queued(PRACTICE_EFFECTS_KEY)
+    if batch is not None:
+        batch.add(mastery, xp=xp, level_changed=level_changed)
+        return
+
+    batch = PracticeEffectBatch()
+    batch.add(mastery, xp=xp, level_changed=level_changed)
+    queue_on_commit(PRACTICE_EFFECTS_KEY, batch, robust=True)
@@ -2,18 +2,22 @@ from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from typing import Dict, Optional, List
-from django.db.models import Sum, Count, Avg, Min, Max, F
+from datetime import datetime, time, timedelta
+from django.db.models import Sum, Count, Max, F, Func, IntegerField, Q, Exists, OuterRef
+from django.db.models.functions import TruncDate
 
 from core.models import (
     Art,
     ArtParts,
     ArtMastery,
+    DailyPracticeRollup,
     PlayerProfile,
     PracticeSession,
     UserArtStageProgress
 )
 
-from .mastery_service import MasteryService
+from .art_structure import get_art_structure
+from .practice_effects import queue_practice_effects
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:experience_progression]
@@ -48,44 +52,57 @@ class PracticeService:
         # Ensure user has mastery for this art
         mastery, _ = ArtMastery.objects.get_or_create(user=user, art=art)
         
+        return PracticeService.ingest_practice(mastery, part, duration, notes=notes, validated=mark_completed)
+    
+    @staticmethod
+    def ingest_practice(mastery, part, duration, notes='', validated=False):
+        """
+        Record a practice session and apply it to the mastery with one write per table.
+        
+        The new mastery state is computed in memory and stored with a single
+        update(); XP (1 XP per minute), stage progression, mastery benefits
+        and tech tree progress are queued to run after the transaction commits.
+        
+        Args:
+            mastery: The ArtMastery being practiced
+            part: The ArtParts object being practiced
+            duration: Duration of practice in minutes
+            notes: Optional notes about the practice session
+            validated: Whether the part is completed by this practice
+            
+        Returns:
+            The created PracticeSession instance
+        """
+        structure = get_art_structure(mastery.art_id)
+        previous_level = mastery.mastery_level
+        
         with transaction.atomic():
-            # Create practice session
             session = PracticeSession.objects.create(
-                user=user,
-                art=art,
+                user_id=mastery.user_id,
+                art_id=mastery.art_id,
                 part=part,
-                duration=duration,
-                notes=notes
+                duration_minutes=duration,
+                notes=notes or '',
+                validated=validated,
+                completed=validated
             )
             
-            # Update mastery history
-            current_history = mastery.practice_history or []
-            current_history.append({
-                'date': timezone.now().isoformat(),
-                'duration': duration,
-                'part_id': str(part.id),
-                'part_name': part.name
-            })
-            
-            mastery.practice_history = current_history
-            
-            # If marking as completed and not already completed
-            if mark_completed:
-                completed_parts = mastery.completed_parts or []
-                if str(part.id) not in completed_parts:
-                    completed_parts.append(str(part.id))
-                    mastery.completed_parts = completed_parts
-            
-            # Award XP for practice (1 XP per minute)
-            mastery.experience_points = F('experience_points') + duration
-            
-            # Save changes
-            mastery.save()
-            
-            # Update mastery level based on new XP
-            MasteryService.update_mastery_level(mastery)
+            changed_fields = mastery.apply_practice(session, structure)
+            mastery.updated_at = timezone.now()
+            attnames = [ArtMastery._meta.get_field(field).attname for field in changed_fields]
+            ArtMastery.objects.filter(pk=mastery.pk).update(
+                updated_at=mastery.updated_at,
+                **{attname: getattr(mastery, attname) for attname in attnames}
+            )
+            mastery._stored_mastery_level = mastery.mastery_level
             
-            return session
+            queue_practice_effects(
+                mastery,
+                xp=duration,
+                level_changed=mastery.mastery_level != previous_level
+            )
+        
+        return session
     
     @staticmethod
     def get_practice_history(user, art=None, limit=None):
@@ -112,53 +129,6 @@ class PracticeService:
             
         return query
     
-    @staticmethod
-    def get_practice_stats(user, art=None):
-        """
-        Get practice statistics for a user, optionally filtered by art.
-        
-        Args:
-            user: The user to get stats for
-            art: Optional Art object to filter stats
-            
-        Returns:
-            Dictionary with practice statistics
-        """
-        query = PracticeSession.objects.filter(user=user)
-        
-        if art:
-            query = query.filter(art=art)
-            mastery = ArtMastery.objects.get(user=user, art=art)
-            total_parts = art.parts.count()
-            completed_parts = len(mastery.completed_parts or [])
-        else:
-            # For all arts
-            total_parts = ArtParts.objects.filter(art__in=Art.objects.filter(
-                id__in=PracticeSession.objects.filter(user=user).values_list('art', flat=True).distinct()
-            )).count()
-            
-            completed_parts = sum(
-                len(m.completed_parts or []) 
-                for m in ArtMastery.objects.filter(user=user)
-            )
-        
-        stats = query.aggregate(
-            total_sessions=Count('id'),
-            total_minutes=Sum('duration'),
-            avg_duration=Avg('duration'),
-            longest_session=Max('duration'),
-            shortest_session=Min('duration'),
-            last_practice=Max('created_at')
-        )
-        
-        stats.update({
-            'total_parts': total_parts,
-            'completed_parts': completed_parts,
-            'completion_percentage': (completed_parts / total_parts * 100) if total_parts > 0 else 0
-        })
-        
-        return stats
-    
     @staticmethod
     def get_overall_practice_stats(user):
         """
@@ -233,7 +203,7 @@ class PracticeService:
         
         # Check minimum duration
         if min_duration:
-            total_duration = sessions.aggregate(total=Sum('duration'))['total'] or 0
+            total_duration = sessions.aggregate(total=Sum('duration_minutes'))['total'] or 0
             if total_duration < min_duration:
                 return False
         
@@ -262,11 +232,16 @@ class PracticeService:
             except User.DoesNotExist:
                 raise ValueError(f"User with ID {user} does not exist")
         
-        # Define the period to analyze
-        cutoff_date = (timezone.now() - timezone.timedelta(days=days))
+        # Define the period to analyze: the last `days` local calendar days
+        today = timezone.localdate()
+        first_day = today - timezone.timedelta(days=days - 1)
         
-        # Get all masteries or filter by art
-        masteries_query = ArtMastery.objects.filter(user=user)
+        rollups = DailyPracticeRollup.objects.filter(user=user, day__gte=first_day)
+        sessions = PracticeSession.objects.filter(
+            user=user,
+            started_at__gte=PracticeService._local_day_bounds(first_day)[0]
+        )
+        masteries = ArtMastery.objects.filter(user=user)
         if art:
             if not isinstance(art, Art):
                 try:
@@ -274,11 +249,10 @@ class PracticeService:
                 except Art.DoesNotExist:
                     raise ValueError(f"Art with ID {art} does not exist")
             
-            masteries_query = masteries_query.filter(art=art)
-        
-        masteries = list(masteries_query)
+            rollups = rollups.filter(art=art)
+            sessions = sessions.filter(art=art)
+            masteries = masteries.filter(art=art)
         
-        # Initialize stats
         stats = {
             'total_sessions': 0,
             'total_minutes': 0,
@@ -286,77 +260,31 @@ class PracticeService:
             'minutes_by_art': {},
             'streak_days': 0,
             'longest_session': 0,
-            'validated_parts': 0,
+            'validated_parts': masteries.aggregate(
+                total=Sum(Func(F('completed_parts'), function='jsonb_array_length', output_field=IntegerField()))
+            )['total'] or 0,
             'practice_methods': {}
         }
         
         # Initialize days for the streak calendar
         for i in range(days):
-            day = (timezone.now() - timezone.timedelta(days=i)).date().isoformat()
+            day = (today - timezone.timedelta(days=i)).isoformat()
             stats['sessions_by_day'][day] = 0
         
-        # Process each mastery
-        for mastery in masteries:
-            if not mastery.practice_history:
-                continue
-                
-            art_minutes = 0
-            art_sessions = 0
-            art_name = mastery.art.name
-            
-            # Count completed parts
-            stats['validated_parts'] += len(mastery.completed_parts or [])
-            
-            # Analyze practice sessions
-            for session in mastery.practice_history:
-                session_time = session.get('timestamp', '')
-                if not session_time:
-                    continue
-                    
-                try:
-                    session_datetime = timezone.datetime.fromisoformat(session_time)
-                    if session_datetime.tzinfo is None:
-                        # Add UTC if no timezone specified
-                        session_datetime = session_datetime.replace(tzinfo=timezone.utc)
-                        
-                    # Skip if before cutoff date
-                    if session_datetime < cutoff_date:
-                        continue
-                        
-                    # Count this session
-                    stats['total_sessions'] += 1
-                    art_sessions += 1
-                    
-                    # Add minutes
-                    minutes = session.get('duration_minutes', 0)
-                    stats['total_minutes'] += minutes
-                    art_minutes += minutes
-                    
-                    # Track longest session
-                    stats['longest_session'] = max(stats['longest_session'], minutes)
-                    
-                    # Track by day for streak calculation
-                    day = session_datetime.date().isoformat()
-                    if day in stats['sessions_by_day']:
-                        stats['sessions_by_day'][day] += 1
-                    
-                    # Track practice method if available
-                    if 'part_id' in session:
-                        try:
-                            part = ArtParts.objects.get(id=session['part_id'])
-                            method = part.get_practice_method_display()
-                            if method not in stats['practice_methods']:
-                                stats['practice_methods'][method] = 0
-                            stats['practice_methods'][method] += 1
-                        except ArtParts.DoesNotExist:
-                            pass
-                            
-                except (ValueError, TypeError):
-                    continue
-            
-            # Add to art-specific stats
-            if art_sessions > 0:
-                stats['minutes_by_art'][art_name] = art_minutes
+        # One pre-aggregated row per art and day
+        for day, art_name, session_count, minutes, longest in rollups.order_by().values_list(
+            'day', 'art__name', 'session_count', 'total_minutes', 'longest_session'
+        ):
+            stats['total_sessions'] += session_count
+            stats['total_minutes'] += minutes
+            stats['longest_session'] = max(stats['longest_session'], longest)
+            if day.isoformat() in stats['sessions_by_day']:
+                stats['sessions_by_day'][day.isoformat()] += session_count
+            stats['minutes_by_art'][art_name] = stats['minutes_by_art'].get(art_name, 0) + minutes
+        
+        method_names = dict(ArtParts.PRACTICE_METHODS)
+        for method, count in sessions.order_by().values_list('part__practice_method').annotate(count=Count('id')):
+            stats['practice_methods'][str(method_names.get(method, method))] = count
         
         # Calculate streak
         stats['streak_days'] = PracticeService.calculate_streak(stats['sessions_by_day'])
@@ -369,31 +297,135 @@ class PracticeService:
         Calculate the current practice streak in days.
         
         Args:
-            sessions_by_day: Dictionary mapping days to session counts
+            sessions_by_day: Dictionary mapping ISO days to session counts
             
         Returns:
-            int: Current streak in days
+            int: Number of consecutive days with sessions, ending today
+        """
+        streak = 0
+        day = timezone.localdate()
+        while sessions_by_day.get(day.isoformat(), 0) > 0:
+            streak += 1
+            day -= timezone.timedelta(days=1)
+        return streak
+    
+    @staticmethod
+    def get_practice_days(user, completed_only=False):
         """
-        # Sort days in descending order (newest first)
-        sorted_days = sorted(sessions_by_day.keys(), reverse=True)
+        Get the number of practice sessions per day, for calendars and heatmaps.
         
-        # Check if practiced today
-        if not sorted_days or sessions_by_day[sorted_days[0]] == 0:
-            return 0
+        Args:
+            user: The User object or ID
+            completed_only: Whether to count only completed sessions
+            
+        Returns:
+            Dict: ISO day -> session count, for days with sessions
+        """
+        count_field = 'completed_count' if completed_only else 'session_count'
+        practice_days = {}
+        for day, count in DailyPracticeRollup.objects.filter(user=user).order_by().values_list(
+            'day'
+        ).annotate(count=Sum(count_field)):
+            if count:
+                practice_days[day.isoformat()] = count
+        return practice_days
+    
+    @staticmethod
+    def _local_day_bounds(day):
+        """Get the aware [start, end) datetimes of a local calendar day."""
+        start = timezone.make_aware(datetime.combine(day, time.min))
+        return start, timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+    
+    @staticmethod
+    def _rollup_totals():
+        return {
+            'session_count': Count('id'),
+            'completed_count': Count('id', filter=Q(completed=True)),
+            'total_minutes': Sum('duration_minutes'),
+            'longest_session': Max('duration_minutes'),
+        }
+    
+    @staticmethod
+    def _upsert_rollups(rollups):
+        DailyPracticeRollup.objects.bulk_create(
+            rollups,
+            update_conflicts=True,
+            unique_fields=['user', 'art', 'day'],
+            update_fields=['session_count', 'completed_count', 'total_minutes', 'longest_session', 'updated_at']
+        )
+    
+    @staticmethod
+    def refresh_daily_rollup(user_id, art_id, day):
+        """
+        Recompute one user/art/day rollup from its practice sessions.
         
-        # Count streak days
-        streak = 1  # Start with today
-        last_day = timezone.datetime.fromisoformat(sorted_days[0]).date()
+        Args:
+            user_id: The user's ID
+            art_id: The art's ID
+            day: The local calendar day
+            
+        Returns:
+            DailyPracticeRollup or None: The rollup, or None if the day has no sessions
+        """
+        start, end = PracticeService._local_day_bounds(day)
+        totals = PracticeSession.objects.filter(
+            user_id=user_id,
+            art_id=art_id,
+            started_at__gte=start,
+            started_at__lt=end
+        ).order_by().aggregate(**PracticeService._rollup_totals())
+        
+        if not totals['session_count']:
+            DailyPracticeRollup.objects.filter(user_id=user_id, art_id=art_id, day=day).delete()
+            return None
+        
+        rollup = DailyPracticeRollup(user_id=user_id, art_id=art_id, day=day, **totals)
+        PracticeService._upsert_rollups([rollup])
+        return rollup
+    
+    @staticmethod
+    def rebuild_daily_rollups(user=None, batch_size=1000):
+        """
+        Rebuild daily practice rollups from all practice sessions.
         
-        for i in range(1, len(sorted_days)):
-            day = timezone.datetime.fromisoformat(sorted_days[i]).date()
-            expected_day = last_day - timezone.timedelta(days=1)
+        Args:
+            user: Optional User object or ID to limit the rebuild to
+            batch_size: Number of rollups to write per query
             
-            # If this is the expected previous day and has sessions
-            if day == expected_day and sessions_by_day[sorted_days[i]] > 0:
-                streak += 1
-                last_day = day
-            else:
-                break
-                
-        return streak 
\ No newline at end of file
+        Returns:
+            Tuple[int, int]: Number of rollups written and stale rollups deleted
+        """
+        sessions = PracticeSession.objects.order_by()
+        rollups = DailyPracticeRollup.objects.all()
+        if user is not None:
+            sessions = sessions.filter(user=user)
+            rollups = rollups.filter(user=user)
+        
+        grouped = sessions.annotate(day=TruncDate('started_at')).values(
+            'user_id', 'art_id', 'day'
+        ).annotate(**PracticeService._rollup_totals())
+        
+        written = 0
+        batch = []
+        for row in grouped.iterator(chunk_size=batch_size):
+            batch.append(DailyPracticeRollup(**row))
+            if len(batch) >= batch_size:
+                PracticeService._upsert_rollups(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            PracticeService._upsert_rollups(batch)
+            written += len(batch)
+        
+        # Remove rollups for days that no longer have any sessions
+        deleted, _ = rollups.exclude(
+            Exists(
+                PracticeSession.objects.annotate(day=TruncDate('started_at')).filter(
+                    user_id=OuterRef('user_id'),
+                    art_id=OuterRef('art_id'),
+                    day=OuterRef('day')
+                )
+            )
+        ).delete()
+        
+        return written, deleted
@@ -0,0 +1,219 @@
+import threading
+import uuid
+
+from django.core.cache import cache
+
+from core.models import ArtTaxonomy
+from core.services.on_commit import get_transaction_snapshot, queue_on_commit
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+FOREST_VERSION_CACHE_KEY = 'core:taxonomy_forest:version'
+
+_forest_lock = threading.Lock()
+_taxonomy_forest = None
+
+
+class TaxonomyForest:
+    """
+    Immutable snapshot of the art taxonomy forest.
+
+    Holds every node's name, parent, level and materialised path so display
+    names, ancestors and subtrees are answered without touching the database.
+    """
+
+    def __init__(self, nodes, version=None):
+        """
+        Build the forest from taxonomy rows.
+
+        Args:
+            nodes: Iterable of (id, name, parent_id, level, path) tuples
+            version: The forest version this snapshot was built for
+        """
+        self.version = version
+        self._nodes = {}
+        self._children = {}
+        for node_id, name, parent_id, level, path in sorted(nodes, key=lambda node: (node[3], node[1])):
+            self._nodes[node_id] = (name, parent_id, level, path)
+            self._children.setdefault(parent_id, []).append(node_id)
+        self._children = {parent_id: tuple(ids) for parent_id, ids in self._children.items()}
+
+    @classmethod
+    def load(cls, version=None):
+        """
+        Build the forest from the database in one query.
+
+        Args:
+            version: The forest version to tag the snapshot with
+
+        Returns:
+            TaxonomyForest: The forest
+        """
+        nodes = ArtTaxonomy.objects.order_by().values_list('id', 'name', 'parent_id', 'level', 'path')
+        return cls(list(nodes), version=version)
+
+    def __contains__(self, node_id):
+        return node_id in self._nodes
+
+    @property
+    def root_ids(self):
+        """IDs of the taxonomies without a parent, ordered by level and name."""
+        return tuple(node_id for node_id in self._children.get(None, ()) if node_id in self._nodes)
+
+    def name(self, node_id):
+        """Get a taxonomy's name, or None if it does not exist."""
+        node = self._nodes.get(node_id)
+        return node[0] if node else None
+
+    def ids_at_level(self, level):
+        """Get the IDs of the taxonomies at a level, ordered by name."""
+        return tuple(node_id for node_id, node in self._nodes.items() if node[2] == level)
+
+    def children_ids(self, node_id):
+        """Get the IDs of a taxonomy's direct children, ordered by level and name."""
+        return self._children.get(node_id, ())
+
+    def ancestor_ids(self, node_id):
+        """
+        Get the IDs of a taxonomy's ancestors, root first.
+
+        Args:
+            node_id: The ArtTaxonomy ID
+
+        Returns:
+            list: Ancestor IDs, excluding node_id itself
+        """
+        ancestors = []
+        seen = {node_id}
+        node = self._nodes.get(node_id)
+        while node is not None and node[1] is not None and node[1] not in seen:
+            ancestors.append(node[1])
+            seen.add(node[1])
+            node = self._nodes.get(node[1])
+        ancestors.reverse()
+        return ancestors
+
+    def root_id(self, node_id):
+        """Get the ID of the root of a taxonomy's tree."""
+        ancestors = self.ancestor_ids(node_id)
+        return ancestors[0] if ancestors else node_id
+
+    def descendant_ids(self, node_id, include_self=True):
+        """
+        Get the IDs of a taxonomy's whole subtree, depth first.
+
+        Args:
+            node_id: The ArtTaxonomy ID
+            include_self: Whether to include node_id itself
+
+        Returns:
+            list: Subtree IDs
+        """
+        result = [node_id] if include_self else []
+        stack = list(reversed(self._children.get(node_id, ())))
+        seen = {node_id}
+        while stack:
+            child_id = stack.pop()
+            if child_id in seen:
+                continue
+            seen.add(child_id)
+            result.append(child_id)
+            stack.extend(reversed(self._children.get(child_id, ())))
+        return result
+
+    def full_path_display(self, node_id, separator=' > '):
+        """
+        Get the human-readable path of a taxonomy, e.g. "Arts > Music > Lyre".
+
+        Args:
+            node_id: The ArtTaxonomy ID
+            separator: String placed between names
+
+        Returns:
+            str: The path, or '' if the taxonomy does not exist
+        """
+        if node_id not in self._nodes:
+            return ''
+        return separator.join(self.name(i) for i in self.ancestor_ids(node_id) + [node_id])
+
+    def as_tree(self, node_id=None):
+        """
+        Get a subtree, or the whole forest, as nested dicts.
+
+        Args:
+            node_id: Optional ArtTaxonomy ID of the subtree root
+
+        Returns:
+            list: Dicts with 'id', 'name', 'level' and 'children'
+        """
+        def build(i, seen):
+            name, _parent_id, level, _path = self._nodes[i]
+            seen = seen | {i}
+            return {
+                'id': str(i),
+                'name': name,
+                'level': level,
+                'children': [build(c, seen) for c in self._children.get(i, ()) if c not in seen],
+            }
+
+        ids = [node_id] if node_id is not None else self.root_ids
+        return [build(i, frozenset()) for i in ids if i in self._nodes]
+
+
+def get_taxonomy_forest_version():
+    """
+    Get the current forest version from the shared cache.
+
+    Returns:
+        str: The version token, created on first use
+    """
+    version = cache.get(FOREST_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(FOREST_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(FOREST_VERSION_CACHE_KEY)
+    return version
+
+
+def _bump_version():
+    global _taxonomy_forest
+    cache.set(FOREST_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    _taxonomy_forest = None
+
+
+def invalidate_taxonomy_forest():
+    """
+    Bump the forest version so every process rebuilds it on next access.
+
+    Moving a node rewrites the paths of its whole subtree in the same
+    transaction, so the version only changes once all of those rows are
+    committed. Until then, this connection builds its own forest from its
+    uncommitted paths.
+    """
+    queue_on_commit(FOREST_VERSION_CACHE_KEY, _bump_version)
+
+
+def get_taxonomy_forest():
+    """
+    Get the taxonomy forest, rebuilding it if the version changed.
+
+    Returns:
+        TaxonomyForest: The process-wide forest
+    """
+    global _taxonomy_forest
+    forest = get_transaction_snapshot(FOREST_VERSION_CACHE_KEY, TaxonomyForest.load)
+    if forest is not None:
+        return forest
+
+    version = get_taxonomy_forest_version()
+    forest = _taxonomy_forest
+    if forest is None or forest.version != version:
+        with _forest_lock:
+            forest = _taxonomy_forest
+            if forest is None or forest.version != version:
+                forest = TaxonomyForest.load(version=version)
+                _taxonomy_forest = forest
+    return forest
@@ -0,0 +1,320 @@
+import threading
+import uuid
+
+from django.core.cache import cache
+
+from core.models import TechTree
+from core.services.on_commit import get_transaction_snapshot, queue_on_commit
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+GRAPH_VERSION_CACHE_KEY = 'core:tech_tree_graph:version'
+
+_graph_lock = threading.Lock()
+_compiled_graph = None
+
+
+def _iter_bits(mask):
+    """Yield the index of every set bit in an int bitset, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class TechTreeGraph:
+    """
+    Immutable, compiled snapshot of the tech tree prerequisite graph.
+
+    Every node gets a dense integer index; parent/child adjacency is kept as
+    tuples of indexes and the transitive ancestor/descendant closures are
+    precomputed as int bitsets, so closure lookups never touch the database.
+    """
+    COMPLETED = 'completed'
+    AVAILABLE = 'available'
+    LOCKED = 'locked'
+
+    def __init__(self, node_ids, edges, version=None, required_arts=None):
+        """
+        Build the graph from node IDs and (child_id, parent_id) edges.
+
+        Args:
+            node_ids: Iterable of TechTree IDs
+            edges: Iterable of (child_id, parent_id) tuples
+            version: The graph version this snapshot was compiled for
+            required_arts: Optional dict of TechTree ID -> required Art IDs
+        """
+        self.version = version
+        self.node_ids = tuple(node_ids)
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        # Forward and reverse art indexes for incremental progress updates
+        self._required_arts = {}
+        self._trees_by_art = {}
+        for node_id, art_ids in (required_arts or {}).items():
+            if node_id not in self.index:
+                continue
+            art_ids = tuple(dict.fromkeys(art_ids or ()))
+            self._required_arts[node_id] = art_ids
+            for art_id in art_ids:
+                self._trees_by_art.setdefault(art_id, []).append(node_id)
+
+        parents = [[] for _ in self.node_ids]
+        children = [[] for _ in self.node_ids]
+        for child_id, parent_id in edges:
+            child = self.index.get(child_id)
+            parent = self.index.get(parent_id)
+            if child is None or parent is None:
+                continue
+            parents[child].append(parent)
+            children[parent].append(child)
+
+        self._parents = tuple(tuple(p) for p in parents)
+        self._children = tuple(tuple(c) for c in children)
+        self._parent_masks = tuple(sum(1 << p for p in set(node_parents)) for node_parents in parents)
+        self.topological_order = self._topological_sort()
+        self._ancestors = self._closure(self._parents, self.topological_order)
+        self._descendants = self._closure(self._children, self.topological_order[::-1])
+
+    @classmethod
+    def load(cls, version=None):
+        """
+        Compile the graph from the database in two queries.
+
+        Args:
+            version: The graph version to tag the snapshot with
+
+        Returns:
+            TechTreeGraph: The compiled graph
+        """
+        nodes = list(TechTree.objects.order_by('level', 'name').values_list('id', 'required_arts'))
+        edges = TechTree.parent_nodes.through.objects.values_list('from_techtree_id', 'to_techtree_id')
+        return cls(
+            [node_id for node_id, _ in nodes],
+            list(edges),
+            version=version,
+            required_arts=dict(nodes)
+        )
+
+    def _topological_sort(self):
+        """Return node indexes with every parent before its children (Kahn's algorithm)."""
+        in_degree = [len(p) for p in self._parents]
+        order = [i for i, degree in enumerate(in_degree) if degree == 0]
+
+        position = 0
+        while position < len(order):
+            node = order[position]
+            position += 1
+            for child in self._children[node]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    order.append(child)
+
+        # Nodes on (or behind) a cycle never reach in-degree zero; append them
+        # so callers still see every node, and let _closure fall back to a walk.
+        if len(order) < len(self.node_ids):
+            seen = set(order)
+            order.extend(i for i in range(len(self.node_ids)) if i not in seen)
+
+        return tuple(order)
+
+    def _closure(self, adjacency, order):
+        """
+        Compute the transitive closure over an adjacency list as bitsets.
+
+        Args:
+            adjacency: Per-node tuples of neighbour indexes to follow
+            order: Node indexes ordered so neighbours are visited first
+
+        Returns:
+            tuple: One int bitset per node index
+        """
+        closure = [0] * len(self.node_ids)
+        done = [False] * len(self.node_ids)
+
+        for node in order:
+            if all(done[n] for n in adjacency[node]):
+                mask = 0
+                for neighbour in adjacency[node]:
+                    mask |= (1 << neighbour) | closure[neighbour]
+                closure[node] = mask
+            else:
+                # Cyclic region: walk the graph explicitly
+                mask = 0
+                stack = list(adjacency[node])
+                while stack:
+                    neighbour = stack.pop()
+                    if mask >> neighbour & 1:
+                        continue
+                    mask |= 1 << neighbour
+                    stack.extend(adjacency[neighbour])
+                closure[node] = mask
+            done[node] = True
+
+        return tuple(closure)
+
+    def __contains__(self, node_id):
+        return node_id in self.index
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def _ids(self, indexes):
+        return [self.node_ids[i] for i in indexes]
+
+    def parent_ids(self, node_id):
+        """Return the IDs of a node's direct prerequisites."""
+        i = self.index.get(node_id)
+        return [] if i is None else self._ids(self._parents[i])
+
+    def child_ids(self, node_id):
+        """Return the IDs of the nodes that directly require this one."""
+        i = self.index.get(node_id)
+        return [] if i is None else self._ids(self._children[i])
+
+    def ancestor_ids(self, node_id):
+        """Return the IDs of all prerequisite nodes, recursively."""
+        i = self.index.get(node_id)
+        return [] if i is None else self._ids(_iter_bits(self._ancestors[i]))
+
+    def descendant_ids(self, node_id):
+        """Return the IDs of all nodes this one unlocks, recursively."""
+        i = self.index.get(node_id)
+        return [] if i is None else self._ids(_iter_bits(self._descendants[i]))
+
+    def is_root(self, node_id):
+        """Check if a node has no prerequisites."""
+        i = self.index.get(node_id)
+        return i is None or not self._parents[i]
+
+    def is_leaf(self, node_id):
+        """Check if no other node requires this one."""
+        i = self.index.get(node_id)
+        return i is None or not self._children[i]
+
+    def required_art_ids(self, node_id):
+        """Return the IDs of the arts required to complete a node."""
+        return list(self._required_arts.get(node_id, ()))
+
+    def tree_ids_for_art(self, art_id):
+        """Return the IDs of every node that requires the given art."""
+        return list(self._trees_by_art.get(art_id, ()))
+
+    def is_ancestor(self, ancestor_id, node_id):
+        """Check if ancestor_id is a (transitive) prerequisite of node_id."""
+        i = self.index.get(node_id)
+        j = self.index.get(ancestor_id)
+        if i is None or j is None:
+            return False
+        return bool(self._ancestors[i] >> j & 1)
+
+    def completed_mask(self, completed_ids):
+        """Pack a collection of completed node IDs into a bitset, ignoring unknown IDs."""
+        mask = 0
+        for node_id in completed_ids:
+            i = self.index.get(node_id)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def evaluate(self, completed_ids):
+        """
+        Evaluate every node's status for one user in a single topological sweep.
+
+        A node is completed if it is in completed_ids, available if all of its
+        direct prerequisites are completed, and locked otherwise.
+
+        Args:
+            completed_ids: Collection of completed TechTree IDs
+
+        Returns:
+            Dict: Node ID -> COMPLETED, AVAILABLE or LOCKED, in topological order
+        """
+        completed = self.completed_mask(completed_ids)
+        statuses = {}
+        for i in self.topological_order:
+            if completed >> i & 1:
+                status = self.COMPLETED
+            elif self._parent_masks[i] & ~completed:
+                status = self.LOCKED
+            else:
+                status = self.AVAILABLE
+            statuses[self.node_ids[i]] = status
+        return statuses
+
+    def evaluate_many(self, completed_by_key):
+        """
+        Evaluate node statuses for many users against the same compiled graph.
+
+        Args:
+            completed_by_key: Dict mapping a key (e.g. user ID) to completed TechTree IDs
+
+        Returns:
+            Dict: Key -> result of evaluate() for that key
+        """
+        return {key: self.evaluate(completed_ids) for key, completed_ids in completed_by_key.items()}
+
+    def prerequisites_met(self, node_id, completed_ids):
+        """Check if every direct prerequisite of a node is in completed_ids."""
+        i = self.index.get(node_id)
+        if i is None:
+            return True
+        return not self._parent_masks[i] & ~self.completed_mask(completed_ids)
+
+
+def get_tech_tree_graph_version():
+    """
+    Get the current graph version from the shared cache.
+
+    Returns:
+        str: The version token, created on first use
+    """
+    version = cache.get(GRAPH_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(GRAPH_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(GRAPH_VERSION_CACHE_KEY)
+    return version
+
+
+def _bump_version():
+    global _compiled_graph
+    cache.set(GRAPH_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    _compiled_graph = None
+
+
+def invalidate_tech_tree_graph():
+    """
+    Bump the graph version so every process recompiles on next access.
+
+    The bump is deferred to commit so no process can cache a snapshot of
+    uncommitted rows; until then this connection uses an uncached graph
+    that sees its own writes. A rollback simply drops the pending bump.
+    """
+    queue_on_commit(GRAPH_VERSION_CACHE_KEY, _bump_version)
+
+
+def get_tech_tree_graph():
+    """
+    Get the compiled tech tree graph, recompiling it if the version changed.
+
+    Returns:
+        TechTreeGraph: The process-wide compiled graph
+    """
+    global _compiled_graph
+    graph = get_transaction_snapshot(GRAPH_VERSION_CACHE_KEY, TechTreeGraph.load)
+    if graph is not None:
+        return graph
+
+    version = get_tech_tree_graph_version()
+    graph = _compiled_graph
+    if graph is None or graph.version != version:
+        with _graph_lock:
+            graph = _compiled_graph
+            if graph is None or graph.version != version:
+                graph = TechTreeGraph.load(version=version)
+                _compiled_graph = graph
+    return graph
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+
+from core.models import TechTree
+
+from .tech_tree_graph import get_tech_tree_graph
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+LAYOUT_CACHE_KEY = 'core:tech_tree_layout:{version}'
+LAYOUT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def build_tech_tree_layout(graph):
+    """
+    Arrange the graph into display levels by a breadth-first walk from the roots.
+
+    The result is a compact, JSON-serialisable blob. Nodes are listed in
+    layout order and referenced everywhere else by their index in that list:
+
+        nodes:     [[id, name, description], ...]
+        levels:    [[node index, ...], ...]
+        positions: [[level index, slot within level], ...] per node
+        edges:     [[parent index, child index], ...]
+
+    Nodes that cannot be reached from a root (e.g. on a cycle) are left out,
+    as they were by the original per-request layering.
+
+    Args:
+        graph: The compiled TechTreeGraph
+
+    Returns:
+        Dict: The layout blob, tagged with the graph version
+    """
+    details = {
+        tree_id: (name, description)
+        for tree_id, name, description in TechTree.objects.order_by().values_list('id', 'name', 'description')
+    }
+
+    node_ids = [node_id for node_id in graph.node_ids if node_id in details]
+    current_level = [node_id for node_id in node_ids if graph.is_root(node_id)]
+    visited = set()
+    levels = []
+
+    while current_level:
+        level = []
+        next_level = []
+        for node_id in current_level:
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+            level.append(node_id)
+            next_level.extend(sorted(graph.child_ids(node_id), key=graph.index.get))
+        if level:
+            levels.append(level)
+        current_level = next_level
+
+    nodes = []
+    positions = []
+    layout_index = {}
+    for level_number, level in enumerate(levels):
+        for slot, node_id in enumerate(level):
+            layout_index[node_id] = len(nodes)
+            name, description = details[node_id]
+            nodes.append([str(node_id), name, description])
+            positions.append([level_number, slot])
+
+    edges = [
+        [layout_index[parent_id], layout_index[node_id]]
+        for node_id in layout_index
+        for parent_id in graph.parent_ids(node_id)
+        if parent_id in layout_index
+    ]
+
+    return {
+        'version': graph.version,
+        'nodes': nodes,
+        'levels': [[layout_index[node_id] for node_id in level] for level in levels],
+        'positions': positions,
+        'edges': edges,
+    }
+
+
+def get_tech_tree_layout():
+    """
+    Get the tech tree layout for the current graph version.
+
+    The layout only depends on the graph, so it is built once per graph
+    version and shared through the Django cache.
+
+    Returns:
+        Dict: The layout blob, see build_tech_tree_layout()
+    """
+    graph = get_tech_tree_graph()
+    if graph.version is None:
+        # The graph has uncommitted changes in this transaction; don't share it
+        return build_tech_tree_layout(graph)
+
+    key = LAYOUT_CACHE_KEY.format(version=graph.version)
+    layout = cache.get(key)
+    if layout is None:
+        layout = build_tech_tree_layout(graph)
+        cache.set(key, layout, LAYOUT_CACHE_TIMEOUT)
+    return layout
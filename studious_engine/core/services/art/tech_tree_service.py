@@ -1,10 +1,12 @@
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from typing import Dict, Optional, List, Tuple
+import hashlib
 import uuid
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Q
+from django.db.models import Count, Max, Q
 
 from core.models import (
 
@@ -22,6 +24,9 @@ from core.models import (
     PlayerProfile
 )
 
+from .tech_tree_graph import TechTreeGraph, get_tech_tree_graph, invalidate_tech_tree_graph
+from .tech_tree_layout import get_tech_tree_layout
+
 User = get_user_model()
 
 class TechTreeService:
@@ -65,6 +70,8 @@ class TechTreeService:
             if arts:
                 for art in arts:
                     TechTreeService.add_art_to_tree(tech_tree, art)
+            
+            invalidate_tech_tree_graph()
                     
             return tech_tree
     
@@ -104,6 +111,8 @@ class TechTreeService:
             through.order_index = order_index
         through.save()
         
+        invalidate_tech_tree_graph()
+        
         return tech_tree
     
     @staticmethod
@@ -167,9 +176,8 @@ class TechTreeService:
         # Get user progress
         progress = TechTreeService.get_user_progress(user, tech_tree)
         
-        # Get the arts in this tech tree
-        tree_arts = tech_tree.arts.through.objects.filter(techtree=tech_tree)
-        required_arts = [ta.art_id for ta in tree_arts if ta.required_for_completion]
+        # Get the arts required by this tech tree
+        required_arts = tech_tree.required_arts or []
         
         # Get user's masteries for these arts
         masteries = ArtMastery.objects.filter(user=user, art__in=required_arts)
@@ -184,23 +192,14 @@ class TechTreeService:
             total_progress = 0
             
             for mastery in masteries:
-                # Calculate percentage mastery (0-100)
-                if mastery.mastery_level >= 5:  # Max mastery level
-                    art_percent = 100
-                else:
-                    art_percent = (mastery.mastery_level / 5) * 100
-                
-                art_progress[str(mastery.art.id)] = {
-                    'mastery_level': mastery.mastery_level,
-                    'percent_complete': art_percent,
-                    'completed': mastery.mastery_level >= 5
-                }
-                
-                total_progress += art_percent
+                art_entry = TechTreeService._art_progress_entry(mastery.mastery_level)
+                art_progress[str(mastery.art_id)] = art_entry
+                total_progress += art_entry['percent_complete']
             
             percent_complete = total_progress / total_arts if total_arts > 0 else 0
             
             # Update progress record
+            was_completed = progress.progress_percentage >= 100
             progress.progress = {
                 'percent_complete': percent_complete,
                 'arts': art_progress,
@@ -212,37 +211,170 @@ class TechTreeService:
                 art_progress.get(str(art_id), {}).get('completed', False) 
                 for art_id in required_arts
             )
+            progress.progress_percentage = 100 if completed else min(99, int(percent_complete))
             
             # If newly completed, apply achievement bonus
-            if completed and not (progress and progress.progress_percentage >= 100):
-                progress.progress_percentage = 100
-                progress.completion_date = timezone.now()
-                
-                # Apply achievement bonus if any
-                if tech_tree.achievement_bonus:
-                    try:
-                        profile = PlayerProfile.objects.get(user=user)
-                        
-                        # Apply XP bonus
-                        if 'xp' in tech_tree.achievement_bonus:
-                            profile.experience_points += tech_tree.achievement_bonus['xp']
-                        
-                        # Apply virtue bonuses
-                        virtues = ['wisdom', 'courage', 'temperance', 'justice']
-                        for virtue in virtues:
-                            if virtue in tech_tree.achievement_bonus:
-                                current = getattr(profile.happiness_metrics, virtue)
-                                bonus = tech_tree.achievement_bonus[virtue]
-                                setattr(profile.happiness_metrics, virtue, min(100, current + bonus))
-                        
-                        profile.save()
-                    except PlayerProfile.DoesNotExist:
-                        pass
+            if completed and not was_completed:
+                TechTreeService._apply_achievement_bonus(user, tech_tree)
             
             progress.save()
         
         return progress
     
+    @staticmethod
+    def apply_mastery_changes(user, mastery_levels):
+        """
+        Incrementally update tech tree progress after art mastery levels change.
+        
+        Only trees that require one of the changed arts are touched. The stored
+        per-art entries and aggregate percentage are adjusted by the delta of
+        each changed art, and all affected rows are locked, then written with
+        one bulk_update.
+        
+        Args:
+            user: The User object or ID
+            mastery_levels: Dict mapping Art ID -> new mastery level
+            
+        Returns:
+            List[UserTechTreeProgress]: The progress rows that were updated
+        """
+        user_id = user.id if isinstance(user, User) else user
+        graph = get_tech_tree_graph()
+        
+        # Reverse index: changed arts -> trees that require them
+        affected_tree_ids = set()
+        for art_id in mastery_levels:
+            affected_tree_ids.update(graph.tree_ids_for_art(art_id))
+        if not affected_tree_ids:
+            return []
+        
+        # Lock the rows before reading them: another commit for this user may
+        # be applying deltas to the same trees, and the later bulk_update
+        # would otherwise overwrite its per-art entries and aggregate
+        with transaction.atomic():
+            rows = {
+                p.tech_tree_id: p
+                for p in UserTechTreeProgress.objects.filter(
+                    user_id=user_id,
+                    tech_tree_id__in=affected_tree_ids
+                ).select_for_update().order_by('pk')
+            }
+            missing = [tree_id for tree_id in affected_tree_ids if tree_id not in rows]
+            if missing:
+                UserTechTreeProgress.objects.bulk_create(
+                    [UserTechTreeProgress(user_id=user_id, tech_tree_id=tree_id) for tree_id in missing],
+                    ignore_conflicts=True
+                )
+                rows.update({
+                    p.tech_tree_id: p
+                    for p in UserTechTreeProgress.objects.filter(
+                        user_id=user_id,
+                        tech_tree_id__in=missing
+                    ).select_for_update().order_by('pk')
+                })
+            
+            # Rows that have never been computed have no per-art baseline to apply
+            # a delta to, so seed them from the user's other masteries in one query
+            unseeded = [tree_id for tree_id, row in rows.items() if 'arts' not in (row.progress or {})]
+            seed_levels = {}
+            if unseeded:
+                seed_art_ids = {art_id for tree_id in unseeded for art_id in graph.required_art_ids(tree_id)}
+                seed_levels = dict(
+                    ArtMastery.objects.filter(user_id=user_id, art_id__in=seed_art_ids)
+                    .order_by().values_list('art_id', 'mastery_level')
+                )
+                seed_levels.update(mastery_levels)
+            
+            now = timezone.now()
+            newly_completed = []
+            
+            for tree_id, row in rows.items():
+                required_arts = graph.required_art_ids(tree_id)
+                total_arts = len(required_arts)
+                stored = row.progress or {}
+                art_progress = stored.get('arts', {})
+                percent_complete = stored.get('percent_complete', 0)
+                changes = mastery_levels if 'arts' in stored else seed_levels
+                
+                for art_id in required_arts:
+                    if art_id not in changes:
+                        continue
+                    key = str(art_id)
+                    old_percent = art_progress.get(key, {}).get('percent_complete', 0)
+                    art_entry = TechTreeService._art_progress_entry(changes[art_id])
+                    art_progress[key] = art_entry
+                    percent_complete += (art_entry['percent_complete'] - old_percent) / total_arts
+                
+                completed = all(
+                    art_progress.get(str(art_id), {}).get('completed', False)
+                    for art_id in required_arts
+                )
+                if completed and row.progress_percentage < 100:
+                    newly_completed.append(tree_id)
+                
+                row.progress = {
+                    'percent_complete': percent_complete,
+                    'arts': art_progress,
+                    'last_updated': now.isoformat()
+                }
+                row.progress_percentage = 100 if completed else min(99, int(percent_complete))
+                row.updated_at = now
+            
+            updated = list(rows.values())
+            UserTechTreeProgress.objects.bulk_update(
+                updated,
+                ['progress', 'progress_percentage', 'updated_at']
+            )
+        
+        # Achievement bonuses are rare; load the completed trees in one query
+        for tech_tree in TechTree.objects.filter(id__in=newly_completed):
+            TechTreeService._apply_achievement_bonus(user_id, tech_tree)
+        
+        return updated
+    
+    @staticmethod
+    def _art_progress_entry(mastery_level):
+        """Build the stored per-art progress entry for a mastery level."""
+        # Calculate percentage mastery (0-100)
+        if mastery_level >= 5:  # Max mastery level
+            art_percent = 100
+        else:
+            art_percent = (mastery_level / 5) * 100
+        
+        return {
+            'mastery_level': mastery_level,
+            'percent_complete': art_percent,
+            'completed': mastery_level >= 5
+        }
+    
+    @staticmethod
+    def _apply_achievement_bonus(user, tech_tree):
+        """Apply a tech tree's achievement bonus (if any) to the user's profile."""
+        achievement_bonus = getattr(tech_tree, 'achievement_bonus', None)
+        if not achievement_bonus:
+            return
+        
+        user_id = user.id if isinstance(user, User) else user
+        try:
+            profile = PlayerProfile.objects.get(user_id=user_id)
+        except PlayerProfile.DoesNotExist:
+            return
+        
+        # Apply XP bonus
+        if 'xp' in achievement_bonus:
+            profile.experience_points += achievement_bonus['xp']
+        
+        # Apply virtue bonuses
+        virtues = ['wisdom', 'courage', 'temperance', 'justice']
+        for virtue in virtues:
+            if virtue in achievement_bonus:
+                current = getattr(profile.happiness, virtue)
+                bonus = achievement_bonus[virtue]
+                setattr(profile.happiness, virtue, min(100, current + bonus))
+        
+        profile.happiness.save()
+        profile.save()
+    
     @staticmethod
     def check_prerequisites(user, tech_tree):
         """
@@ -267,19 +399,21 @@ class TechTreeService:
             except TechTree.DoesNotExist:
                 raise ValueError(f"TechTree with ID {tech_tree} does not exist")
         
-        # Get all prerequisites
-        prerequisites = tech_tree.parent_nodes.all()
+        # Get direct prerequisites from the compiled graph
+        prerequisite_ids = get_tech_tree_graph().parent_ids(tech_tree.id)
         
-        if not prerequisites.exists():
+        if not prerequisite_ids:
             # No prerequisites, so they're automatically met
             return True, []
         
+        prerequisites = TechTree.objects.filter(id__in=prerequisite_ids)
+        
         # Get user progress for prerequisite trees
         user_progress = {
             p.tech_tree_id: p 
             for p in UserTechTreeProgress.objects.filter(
                 user=user,
-                tech_tree_id__in=prerequisites.values_list('id', flat=True)
+                tech_tree_id__in=prerequisite_ids
             )
         }
         
@@ -318,14 +452,22 @@ class TechTreeService:
             except User.DoesNotExist:
                 raise ValueError(f"User with ID {user} does not exist")
         
-        # Get all tech trees
-        all_trees = TechTree.objects.all()
+        # Get all tech trees and the user's progress in two queries
+        all_trees = list(TechTree.objects.all())
+        tree_names = {tree.id: tree.name for tree in all_trees}
         
-        # Get user progress for all trees
         user_progress = {
             p.tech_tree_id: p 
             for p in UserTechTreeProgress.objects.filter(user=user)
         }
+        completed_ids = {
+            tree_id for tree_id, progress in user_progress.items()
+            if progress.progress_percentage >= 100
+        }
+        
+        # Evaluate every tree against the compiled prerequisite graph at once
+        graph = get_tech_tree_graph()
+        statuses = graph.evaluate(completed_ids)
         
         available_trees = []
         
@@ -333,20 +475,26 @@ class TechTreeService:
             # Check if user has progress for this tree
             progress = user_progress.get(tree.id)
             
-            # Check prerequisites
-            prereqs_met, prereq_status = TechTreeService.check_prerequisites(user, tree)
+            prereq_status = [
+                {
+                    'id': prereq_id,
+                    'name': tree_names.get(prereq_id),
+                    'completed': prereq_id in completed_ids
+                }
+                for prereq_id in graph.parent_ids(tree.id)
+            ]
             
             # Build status info
             tree_info = {
                 'id': tree.id,
                 'name': tree.name,
                 'description': tree.description,
-                'available': prereqs_met,
-                'completed': progress and progress.progress_percentage >= 100 if progress else False,
+                'available': statuses.get(tree.id, TechTreeGraph.AVAILABLE) != TechTreeGraph.LOCKED,
+                'completed': tree.id in completed_ids,
                 'percent_complete': progress.progress_percentage if progress else 0,
                 'prerequisites': prereq_status,
-                'arts_count': tree.arts.count(),
-                'has_achievement_bonus': bool(tree.achievement_bonus)
+                'arts_count': len(tree.required_arts),
+                'has_achievement_bonus': bool(getattr(tree, 'achievement_bonus', None))
             }
             
             available_trees.append(tree_info)
@@ -358,6 +506,9 @@ class TechTreeService:
         """
         Get tech trees organized by levels for display in a tech tree visualization.
         
+        The level layout is shared by all users and cached per graph version;
+        only the user's progress is read and overlaid here.
+        
         Args:
             user: The User object or ID
             
@@ -370,85 +521,74 @@ class TechTreeService:
             except User.DoesNotExist:
                 raise ValueError(f"User with ID {user} does not exist")
         
-        # Get all tech trees
-        all_trees = TechTree.objects.all().prefetch_related('parent_nodes')
+        layout = get_tech_tree_layout()
         
         # Get user progress for all trees
         user_progress = {
-            p.tech_tree_id: p 
-            for p in UserTechTreeProgress.objects.filter(user=user)
+            tree_id: (is_unlocked, percentage)
+            for tree_id, is_unlocked, percentage in UserTechTreeProgress.objects.filter(
+                user=user
+            ).order_by().values_list('tech_tree_id', 'is_unlocked', 'progress_percentage')
         }
+        statuses = TechTreeService._evaluate_statuses({
+            user.id: {tree_id: percentage for tree_id, (_is_unlocked, percentage) in user_progress.items()}
+        })[user.id]
         
-        # Build a directed graph of tech trees based on prerequisites
-        tree_graph = {}
-        for tree in all_trees:
-            tree_graph[tree.id] = {
-                'id': tree.id,
-                'name': tree.name,
-                'description': tree.description,
-                'prerequisites': [p.id for p in tree.parent_nodes.all()],
-                'completed': user_progress.get(tree.id) is not None and user_progress[tree.id].is_unlocked,
-                'percent_complete': user_progress.get(tree.id) and user_progress[tree.id].progress_percentage or 0,
-                'children': []
-            }
-        
-        # Populate children lists based on prerequisites
-        for tree_id, tree_info in tree_graph.items():
-            for prereq_id in tree_info['prerequisites']:
-                if prereq_id in tree_graph:
-                    tree_graph[prereq_id]['children'].append(tree_id)
+        nodes = layout['nodes']
+        prerequisites = [[] for _node in nodes]
+        for parent, child in layout['edges']:
+            prerequisites[child].append(nodes[parent][0])
         
-        # Arrange trees into levels (BFS traversal)
         levels = []
-        visited = set()
-        
-        # First level: trees with no prerequisites
-        current_level = [
-            tree_id for tree_id, tree_info in tree_graph.items() 
-            if not tree_info['prerequisites']
-        ]
-        
-        level_counter = 1
-        
-        while current_level:
+        for level_number, level in enumerate(layout['levels'], start=1):
             level_trees = []
-            next_level = []
-            
-            for tree_id in current_level:
-                if tree_id in visited:
-                    continue
-                    
-                visited.add(tree_id)
-                tree_info = tree_graph[tree_id]
-                
-                # Check if prerequisites are met for availability
-                prereqs_met = all(prereq_id in visited for prereq_id in tree_info['prerequisites'])
-                
-                # Add this tree to the current level
+            for i in level:
+                tree_id, name, description = nodes[i]
+                tree_uuid = uuid.UUID(tree_id)
+                is_unlocked, percentage = user_progress.get(tree_uuid, (False, 0))
                 level_trees.append({
-                    'id': tree_info['id'],
-                    'name': tree_info['name'],
-                    'description': tree_info['description'],
-                    'completed': tree_info['completed'],
-                    'percent_complete': tree_info['percent_complete'],
-                    'prerequisites': tree_info['prerequisites'],
-                    'available': prereqs_met
-                })
-                
-                # Add children to the next level
-                next_level.extend(tree_info['children'])
-            
-            if level_trees:
-                levels.append({
-                    'level': level_counter,
-                    'nodes': level_trees
+                    'id': tree_id,
+                    'name': name,
+                    'description': description,
+                    'completed': is_unlocked,
+                    'percent_complete': percentage,
+                    'prerequisites': prerequisites[i],
+                    'available': statuses.get(tree_uuid) != TechTreeGraph.LOCKED
                 })
-                level_counter += 1
-            
-            current_level = next_level
+            levels.append({
+                'level': level_number,
+                'nodes': level_trees
+            })
         
         return levels
     
+    @staticmethod
+    def get_tech_tree_etag(user):
+        """
+        Get an entity tag for a user's tech tree view.
+        
+        The tag changes whenever the graph version or any of the user's
+        tech tree progress rows change.
+        
+        Args:
+            user: The User object or ID
+            
+        Returns:
+            Optional[str]: The entity tag, or None while the graph has uncommitted changes
+        """
+        user_id = user.id if isinstance(user, User) else user
+        graph = get_tech_tree_graph()
+        if graph.version is None:
+            return None
+        
+        fingerprint = UserTechTreeProgress.objects.filter(user_id=user_id).order_by().aggregate(
+            count=Count('id'),
+            last_updated=Max('updated_at')
+        )
+        last_updated = fingerprint['last_updated']
+        token = f"{graph.version}:{user_id}:{fingerprint['count']}:{last_updated.timestamp() if last_updated else 0}"
+        return hashlib.md5(token.encode()).hexdigest()
+    
     @staticmethod
     def get_tech_tree_stats(user):
         """
@@ -513,6 +653,96 @@ class TechTreeService:
         
         return recommendations[:count]
         
+    @staticmethod
+    def get_recommended_tech_trees_bulk(users, count=3):
+        """
+        Get recommended tech trees for many users at once, e.g. for a nightly job.
+        
+        Args:
+            users: Iterable of User objects or IDs
+            count: Number of recommendations to return per user
+            
+        Returns:
+            Dict[int, List[Dict]]: Recommended tech trees keyed by user ID
+        """
+        user_ids = TechTreeService._user_ids(users)
+        
+        percent_complete = {user_id: {} for user_id in user_ids}
+        for user_id, tree_id, percentage in UserTechTreeProgress.objects.filter(
+            user_id__in=user_ids
+        ).order_by().values_list('user_id', 'tech_tree_id', 'progress_percentage'):
+            percent_complete[user_id][tree_id] = percentage
+        
+        tree_names = dict(TechTree.objects.values_list('id', 'name'))
+        statuses = TechTreeService._evaluate_statuses(percent_complete)
+        
+        recommendations = {}
+        for user_id, user_statuses in statuses.items():
+            candidates = [
+                {
+                    'id': tree_id,
+                    'name': tree_names.get(tree_id),
+                    'percent_complete': percent_complete[user_id].get(tree_id, 0)
+                }
+                for tree_id, tree_status in user_statuses.items()
+                if tree_status == TechTreeGraph.AVAILABLE
+            ]
+            candidates.sort(key=lambda x: x['percent_complete'], reverse=True)
+            recommendations[user_id] = candidates[:count]
+        
+        return recommendations
+    
+    @staticmethod
+    def get_tech_tree_statuses(user):
+        """
+        Get the completed/available/locked status of every tech tree for a user.
+        
+        Args:
+            user: The User object or ID
+            
+        Returns:
+            Dict: TechTree ID -> 'completed', 'available' or 'locked'
+        """
+        user_id = TechTreeService._user_ids([user])[0]
+        return TechTreeService.get_tech_tree_statuses_bulk([user_id])[user_id]
+    
+    @staticmethod
+    def _user_ids(users):
+        """Get user IDs as the user_id column returns them, so results can be keyed by them."""
+        to_id = User._meta.pk.to_python
+        return [user.id if isinstance(user, User) else to_id(user) for user in users]
+    
+    @staticmethod
+    def get_tech_tree_statuses_bulk(users):
+        """
+        Get the status of every tech tree for many users in one progress query.
+        
+        Args:
+            users: Iterable of User objects or IDs
+            
+        Returns:
+            Dict[int, Dict]: Per-user mapping of TechTree ID -> status
+        """
+        user_ids = TechTreeService._user_ids(users)
+        
+        percent_complete = {user_id: {} for user_id in user_ids}
+        for user_id, tree_id, percentage in UserTechTreeProgress.objects.filter(
+            user_id__in=user_ids,
+            progress_percentage__gte=100
+        ).order_by().values_list('user_id', 'tech_tree_id', 'progress_percentage'):
+            percent_complete[user_id][tree_id] = percentage
+        
+        return TechTreeService._evaluate_statuses(percent_complete)
+    
+    @staticmethod
+    def _evaluate_statuses(percent_complete):
+        """Evaluate statuses from per-user {tree_id: progress_percentage} maps."""
+        completed_by_user = {
+            user_id: [tree_id for tree_id, percentage in trees.items() if percentage >= 100]
+            for user_id, trees in percent_complete.items()
+        }
+        return get_tech_tree_graph().evaluate_many(completed_by_user)
+        
     @staticmethod
     def is_tech_tree_unlocked(user, tech_tree):
         """
@@ -525,8 +755,15 @@ class TechTreeService:
         Returns:
             bool: True if the tech tree is unlocked, False otherwise
         """
-        # Check prerequisites
-        prereqs_met, _ = TechTreeService.check_prerequisites(user, tech_tree)
+        tech_tree_id = tech_tree.id if isinstance(tech_tree, TechTree) else tech_tree
+        try:
+            tech_tree_id = TechTree._meta.pk.to_python(tech_tree_id)
+        except ValidationError:
+            raise ValueError(f"TechTree with ID {tech_tree} does not exist") from None
+        
+        statuses = TechTreeService.get_tech_tree_statuses(user)
+        if tech_tree_id not in statuses:
+            raise ValueError(f"TechTree with ID {tech_tree} does not exist")
         
         # If prerequisites are met, the tech tree is unlocked
-        return prereqs_met 
\ No newline at end of file
+        return statuses[tech_tree_id] != TechTreeGraph.LOCKED
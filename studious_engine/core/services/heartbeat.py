@@ -0,0 +1,113 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, F, Value, When
+from django.utils import timezone
+
+from core.models import PlayerProfile
+from core.services.profile_cache import invalidate_profile_snapshots
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+HEARTBEAT_THROTTLE_CACHE_KEY = 'core:heartbeat:{user_id}'
+
+
+class HeartbeatWriter:
+    """
+    Writes PlayerProfile.last_active in bulk instead of once per activity.
+
+    A heartbeat is kept at most once per interval per user, across
+    processes, and buffered in the process. The buffer is written with a
+    single UPDATE once it holds batch_size users or its oldest heartbeat is
+    an interval old; a process stopping loses at most that interval.
+    """
+
+    def __init__(self, interval=None, batch_size=None):
+        self.interval = interval or getattr(settings, 'HEARTBEAT_INTERVAL', 300)
+        self.batch_size = batch_size or getattr(settings, 'HEARTBEAT_BATCH_SIZE', 500)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._oldest = None
+
+    def record(self, user_id, when=None):
+        """
+        Record that a user was active.
+
+        Args:
+            user_id: The User ID
+            when: When they were active, defaults to now
+
+        Returns:
+            bool: Whether the heartbeat was kept rather than throttled
+        """
+        if not cache.add(HEARTBEAT_THROTTLE_CACHE_KEY.format(user_id=user_id), 1, timeout=self.interval):
+            return False
+
+        with self._lock:
+            self._pending[user_id] = when or timezone.now()
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+        self.flush_if_due()
+        return True
+
+    def is_due(self):
+        """Whether the buffer is full or its oldest heartbeat is an interval old."""
+        with self._lock:
+            if self._oldest is None:
+                return False
+            return len(self._pending) >= self.batch_size or time.monotonic() - self._oldest >= self.interval
+
+    def flush_if_due(self):
+        """
+        Write the buffered heartbeats if it is time to.
+
+        Returns:
+            int: Number of profiles updated
+        """
+        return self.flush() if self.is_due() else 0
+
+    def flush(self):
+        """
+        Write the buffered heartbeats with one UPDATE.
+
+        Returns:
+            int: Number of profiles updated
+        """
+        with self._lock:
+            pending, self._pending, self._oldest = self._pending, {}, None
+        if not pending:
+            return 0
+
+        updated = PlayerProfile.objects.filter(user_id__in=pending).update(
+            last_active=Case(
+                *[When(user_id=user_id, then=Value(when)) for user_id, when in pending.items()],
+                default=F('last_active'),
+                output_field=DateTimeField(),
+            )
+        )
+        # update() sends no signals
+        invalidate_profile_snapshots(pending)
+        return updated
+
+
+heartbeat_writer = HeartbeatWriter()
+
+
+def record_heartbeat(user_id, when=None):
+    """
+    Record that a user was active, with the process's heartbeat writer.
+
+    Args:
+        user_id: The User ID
+        when: When they were active, defaults to now
+
+    Returns:
+        bool: Whether the heartbeat was kept rather than throttled
+    """
+    return heartbeat_writer.record(user_id, when)
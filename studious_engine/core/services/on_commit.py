@@ -0,0 +1,104 @@
+import weakref
+
+from django.db import transaction
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+# Connection -> {key: _QueuedCallback}. Only Django's on_commit list holds
+# the callbacks strongly, so one dropped by a (savepoint) rollback leaves
+# this registry as well, without looking inside the connection.
+_queued = weakref.WeakKeyDictionary()
+
+
+class _QueuedCallback:
+    """An on_commit callback registered under a key, with a per-transaction snapshot slot."""
+
+    def __init__(self, pending, key, callback):
+        self.pending = pending
+        self.key = key
+        self.callback = callback
+        self.snapshot = None
+
+    def __call__(self):
+        if self.pending.get(self.key) is self:
+            del self.pending[self.key]
+        self.callback()
+
+
+def _pending(using=None):
+    connection = transaction.get_connection(using)
+    pending = _queued.get(connection)
+    if pending is None:
+        pending = _queued[connection] = weakref.WeakValueDictionary()
+    return pending
+
+
+def get_queued(key, using=None):
+    """
+    Get the callback queued under a key in the current transaction.
+
+    Args:
+        key: Hashable key the callback was queued under
+        using: Database alias, the default one if not given
+
+    Returns:
+        The callback, or None if none is waiting for commit
+    """
+    queued = _pending(using).get(key)
+    return queued.callback if queued is not None else None
+
+
+def queue_on_commit(key, callback, robust=False, using=None):
+    """
+    Run a callback when the current transaction commits, once per key.
+
+    Queuing again under a key that is still waiting keeps the first
+    callback and only drops the transaction snapshot kept for it. Outside
+    a transaction the callback runs straight away, as with on_commit.
+
+    Args:
+        key: Hashable key identifying what the callback does
+        callback: Callable taking no arguments
+        robust: Whether an exception in the callback is logged rather than raised
+        using: Database alias, the default one if not given
+
+    Returns:
+        The callback that will run
+    """
+    pending = _pending(using)
+    queued = pending.get(key)
+    if queued is not None:
+        queued.snapshot = None
+        return queued.callback
+
+    queued = pending[key] = _QueuedCallback(pending, key, callback)
+    transaction.on_commit(queued, using=using, robust=robust)
+    return callback
+
+
+def get_transaction_snapshot(key, build, using=None):
+    """
+    Get a snapshot that sees this transaction's uncommitted changes.
+
+    While a callback is queued under key, build() runs once and its result
+    is reused for the rest of the transaction, until the key is queued
+    again.
+
+    Args:
+        key: Key the invalidating callback is queued under
+        build: Callable returning a fresh snapshot
+        using: Database alias, the default one if not given
+
+    Returns:
+        The snapshot, or None when nothing is queued under key
+    """
+    queued = _pending(using).get(key)
+    if queued is None:
+        return None
+    if queued.snapshot is None:
+        queued.snapshot = build()
+    return queued.snapshot
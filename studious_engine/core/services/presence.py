@@ -0,0 +1,327 @@
+import bisect
+import json
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.services.heartbeat import record_heartbeat
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:zone_geographic_patterns]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+PRESENCE_ALL_KEY = 'core:presence:all'
+PRESENCE_ZONE_KEY = 'core:presence:zone:{zone_id}'
+PRESENCE_CELL_KEY = 'core:presence:cell:{x}:{y}'
+PRESENCE_USER_KEY = 'core:presence:user:{user_id}'
+
+# Default look-back for "active" queries, in minutes
+PRESENCE_WINDOW_MINUTES = 15
+# Heartbeats older than this are dropped from the sets, in seconds
+PRESENCE_RETENTION = 60 * 60
+
+# Size of the grid cells positions are indexed by (about 2.2 km of latitude)
+PRESENCE_CELL_DEGREES = 0.02
+# Larger radii would scan too many cells; use zones for wider areas
+MAX_NEARBY_RADIUS_KM = 10
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def _cell(latitude, longitude):
+    return math.floor(latitude / PRESENCE_CELL_DEGREES), math.floor(longitude / PRESENCE_CELL_DEGREES)
+
+
+def _distance_km(latitude1, longitude1, latitude2, longitude2):
+    """Great-circle distance between two points by the haversine formula."""
+    phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(longitude2 - longitude1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class LocalPresenceStore:
+    """
+    In-process presence store for development, tests and single-process
+    deployments.
+
+    Each set keeps a member-to-score dict and a list of (score, member)
+    pairs sorted with bisect, so range reads cost O(log n + m).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sets = {}
+        self._states = {}
+
+    def _remove(self, key, member):
+        entry = self._sets.get(key)
+        if entry is None:
+            return
+        scores, ordered = entry
+        score = scores.pop(member, None)
+        if score is not None:
+            del ordered[bisect.bisect_left(ordered, (score, member))]
+            if not scores:
+                del self._sets[key]
+
+    def _expire_states(self, now):
+        # Every state lives PRESENCE_RETENTION from its last touch and is
+        # moved to the end when touched, so the expired ones lead the dict
+        expired = []
+        for state_key, (_state, expires_at) in self._states.items():
+            if expires_at > now:
+                break
+            expired.append(state_key)
+        for state_key in expired:
+            del self._states[state_key]
+
+    def touch(self, member, score, keys, stale_keys, state_key, state):
+        now = time.time()
+        with self._lock:
+            for key in stale_keys:
+                self._remove(key, member)
+            for key in keys:
+                self._remove(key, member)
+                scores, ordered = self._sets.setdefault(key, ({}, []))
+                scores[member] = score
+                bisect.insort(ordered, (score, member))
+                # Drop heartbeats past retention from the front
+                expired = bisect.bisect_left(ordered, (score - PRESENCE_RETENTION,))
+                for _old_score, old_member in ordered[:expired]:
+                    del scores[old_member]
+                del ordered[:expired]
+            self._states.pop(state_key, None)
+            self._states[state_key] = (state, now + PRESENCE_RETENTION)
+            self._expire_states(now)
+
+    def get_state(self, state_key):
+        return self.get_states([state_key])[0]
+
+    def get_states(self, state_keys):
+        now = time.time()
+        with self._lock:
+            entries = [self._states.get(state_key) for state_key in state_keys]
+        return [entry[0] if entry is not None and entry[1] > now else None for entry in entries]
+
+    def members_since(self, keys, since):
+        found = {}
+        with self._lock:
+            for key in keys:
+                _scores, ordered = self._sets.get(key, ({}, []))
+                for score, member in ordered[bisect.bisect_left(ordered, (since,)):]:
+                    found[member] = max(score, found.get(member, score))
+        return found
+
+    def score(self, key, member):
+        with self._lock:
+            return self._sets.get(key, ({}, []))[0].get(member)
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+            self._states.clear()
+
+
+class RedisPresenceStore:
+    """Presence store on Redis sorted sets, shared by all processes."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def touch(self, member, score, keys, stale_keys, state_key, state):
+        pipe = self.client.pipeline(transaction=False)
+        for key in stale_keys:
+            pipe.zrem(key, member)
+        for key in keys:
+            pipe.zadd(key, {member: score})
+            pipe.zremrangebyscore(key, '-inf', score - PRESENCE_RETENTION)
+            pipe.expire(key, PRESENCE_RETENTION)
+        pipe.set(state_key, json.dumps(state), ex=PRESENCE_RETENTION)
+        pipe.execute()
+
+    def get_state(self, state_key):
+        return self.get_states([state_key])[0]
+
+    def get_states(self, state_keys):
+        if not state_keys:
+            return []
+        return [json.loads(value) if value is not None else None for value in self.client.mget(state_keys)]
+
+    def members_since(self, keys, since):
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.zrangebyscore(key, since, '+inf', withscores=True)
+        found = {}
+        for members in pipe.execute():
+            for member, score in members:
+                member = int(member)
+                found[member] = max(score, found.get(member, score))
+        return found
+
+    def score(self, key, member):
+        return self.client.zscore(key, member)
+
+
+_store = None
+
+
+def get_presence_store():
+    """
+    Get the process's presence store: Redis when the default cache is on
+    django-redis, otherwise an in-process store.
+
+    Returns:
+        The presence store
+    """
+    global _store
+    if _store is None:
+        if 'django_redis' in settings.CACHES['default']['BACKEND']:
+            from django_redis import get_redis_connection
+            _store = RedisPresenceStore(get_redis_connection('default'))
+        else:
+            _store = LocalPresenceStore()
+    return _store
+
+
+def _state_keys(state):
+    keys = [PRESENCE_ALL_KEY]
+    if state.get('zone') is not None:
+        keys.append(PRESENCE_ZONE_KEY.format(zone_id=state['zone']))
+    if state.get('cell') is not None:
+        x, y = state['cell']
+        keys.append(PRESENCE_CELL_KEY.format(x=x, y=y))
+    return keys
+
+
+def _since(minutes):
+    window = PRESENCE_WINDOW_MINUTES if minutes is None else minutes
+    return (timezone.now() - timedelta(minutes=window)).timestamp()
+
+
+def _by_recency(found):
+    return [member for member, _score in sorted(found.items(), key=lambda item: (-item[1], item[0]))]
+
+
+def record_presence(user_id, latitude=None, longitude=None, zone_id=None, when=None):
+    """
+    Record a heartbeat for a user, optionally with where they are.
+
+    Heartbeats without a location keep the user in the zone and area of
+    their last located one. The user's last_active is written in batches
+    by the heartbeat writer.
+
+    Args:
+        user_id: The User ID
+        latitude: Optional latitude of the user
+        longitude: Optional longitude of the user
+        zone_id: Optional ID of the zone the user is in
+        when: When the user was active, defaults to now
+    """
+    when = when or timezone.now()
+    store = get_presence_store()
+    state_key = PRESENCE_USER_KEY.format(user_id=user_id)
+
+    previous = store.get_state(state_key) or {}
+    state = dict(previous)
+    if latitude is not None and longitude is not None:
+        state.update(lat=latitude, lng=longitude, cell=list(_cell(latitude, longitude)))
+    if zone_id is not None:
+        state['zone'] = zone_id
+
+    keys = _state_keys(state)
+    stale_keys = [key for key in _state_keys(previous) if key not in keys]
+    store.touch(user_id, when.timestamp(), keys, stale_keys, state_key, state)
+    record_heartbeat(user_id, when)
+
+
+def get_active_users(minutes=None):
+    """
+    Get the users active in the last minutes.
+
+    Args:
+        minutes: The look-back, defaults to PRESENCE_WINDOW_MINUTES
+
+    Returns:
+        List[int]: User IDs, most recently active first
+    """
+    return _by_recency(get_presence_store().members_since([PRESENCE_ALL_KEY], _since(minutes)))
+
+
+def get_active_users_in_zone(zone_id, minutes=None):
+    """
+    Get the users active in a zone in the last minutes.
+
+    Args:
+        zone_id: The Zone ID
+        minutes: The look-back, defaults to PRESENCE_WINDOW_MINUTES
+
+    Returns:
+        List[int]: User IDs, most recently active first
+    """
+    key = PRESENCE_ZONE_KEY.format(zone_id=zone_id)
+    return _by_recency(get_presence_store().members_since([key], _since(minutes)))
+
+
+def get_active_users_near(latitude, longitude, radius_km=1, minutes=None):
+    """
+    Get the users active within a distance of a point in the last minutes.
+
+    Only the grid cells overlapping the radius are read; users in them are
+    then filtered by their exact distance.
+
+    Args:
+        latitude: Latitude of the point
+        longitude: Longitude of the point
+        radius_km: The distance in kilometres, at most MAX_NEARBY_RADIUS_KM
+        minutes: The look-back, defaults to PRESENCE_WINDOW_MINUTES
+
+    Returns:
+        List[int]: User IDs, most recently active first
+    """
+    if not 0 < radius_km <= MAX_NEARBY_RADIUS_KM:
+        raise ValueError(f"Radius must be between 0 and {MAX_NEARBY_RADIUS_KM} km")
+
+    d_latitude = radius_km / KM_PER_DEGREE
+    d_longitude = min(180, radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01)))
+    min_x, min_y = _cell(latitude - d_latitude, longitude - d_longitude)
+    max_x, max_y = _cell(latitude + d_latitude, longitude + d_longitude)
+    keys = [
+        PRESENCE_CELL_KEY.format(x=x, y=y)
+        for x in range(min_x, max_x + 1)
+        for y in range(min_y, max_y + 1)
+    ]
+
+    store = get_presence_store()
+    found = store.members_since(keys, _since(minutes))
+    members = list(found)
+    states = store.get_states([PRESENCE_USER_KEY.format(user_id=member) for member in members])
+    nearby = {
+        member: found[member]
+        for member, state in zip(members, states)
+        if state is not None and _distance_km(latitude, longitude, state['lat'], state['lng']) <= radius_km
+    }
+    return _by_recency(nearby)
+
+
+def get_last_seen(user_id):
+    """
+    Get when a user was last active, from presence alone.
+
+    Args:
+        user_id: The User ID
+
+    Returns:
+        datetime: The last heartbeat within PRESENCE_RETENTION, or None
+    """
+    score = get_presence_store().score(PRESENCE_ALL_KEY, user_id)
+    return datetime.fromtimestamp(score, tz=dt_timezone.utc) if score is not None else None
@@ -0,0 +1,200 @@
+import zlib
+from functools import lru_cache
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from core.models import PlayerHappiness, PlayerProfile, UserPreferences
+from core.services.on_commit import get_queued, queue_on_commit
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+# The schema part changes with the snapshot's field lists, so entries
+# written by other code versions are never read back
+PROFILE_SNAPSHOT_CACHE_KEY = 'core:profile_snapshot:{schema}:{user_id}'
+PROFILE_SNAPSHOT_CACHE_TIMEOUT = 60 * 60
+
+# One-to-one rows stored alongside the profile, by their reverse accessor
+SNAPSHOT_RELATIONS = {
+    'happiness': PlayerHappiness,
+    'preferences': UserPreferences,
+}
+
+# Attribute set on the HttpRequest to hold the request's profile
+REQUEST_PROFILE_ATTR = '_profile_snapshot'
+
+
+def _attnames(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+@lru_cache(maxsize=None)
+def _schema_version():
+    """Checksum of the models and fields a snapshot holds."""
+    models = (PlayerProfile, *SNAPSHOT_RELATIONS.values())
+    description = ';'.join(f"{model._meta.label}:{','.join(_attnames(model))}" for model in models)
+    return format(zlib.crc32(description.encode()), '08x')
+
+
+def _cache_key(user_id):
+    return PROFILE_SNAPSHOT_CACHE_KEY.format(schema=_schema_version(), user_id=user_id)
+
+
+class _ProfileSnapshotInvalidation:
+    """Callback dropping one user's cached profile snapshot."""
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+    def __call__(self):
+        cache.delete(_cache_key(self.user_id))
+
+
+def _invalidation_pending(user_id):
+    """Whether the current transaction has changed the user's profile rows."""
+    return get_queued(_cache_key(user_id)) is not None
+
+
+def _load_snapshot(user_id):
+    """
+    Read a user's profile, happiness and preferences in one query.
+
+    Returns:
+        Tuple: The profile's field values followed by those of each of
+        SNAPSHOT_RELATIONS (None where the row is missing), or None if the
+        user has no profile
+    """
+    columns = _attnames(PlayerProfile)
+    for name, model in SNAPSHOT_RELATIONS.items():
+        columns += [f'{name}__{attname}' for attname in _attnames(model)]
+
+    row = PlayerProfile.objects.filter(user_id=user_id).values_list(*columns).first()
+    if row is None:
+        return None
+
+    start = len(_attnames(PlayerProfile))
+    snapshot = [row[:start]]
+    for model in SNAPSHOT_RELATIONS.values():
+        end = start + len(_attnames(model))
+        values = row[start:end]
+        # The primary key comes first; a LEFT JOIN with no row leaves it NULL
+        snapshot.append(values if values[0] is not None else None)
+        start = end
+    return tuple(snapshot)
+
+
+def _build_profile(snapshot, user=None):
+    """Rebuild the profile from a snapshot, with its one-to-one rows attached."""
+    db = PlayerProfile.objects.db
+    profile_values, *related_values = snapshot
+    profile = PlayerProfile.from_db(db, _attnames(PlayerProfile), profile_values)
+    if user is not None:
+        PlayerProfile.user.field.set_cached_value(profile, user)
+
+    for (name, model), values in zip(SNAPSHOT_RELATIONS.items(), related_values):
+        related = None
+        if values is not None:
+            related = model.from_db(db, _attnames(model), values)
+            model.player.field.set_cached_value(related, profile)
+        # A cached None makes the accessor raise DoesNotExist, as a query would
+        getattr(PlayerProfile, name).related.set_cached_value(profile, related)
+    return profile
+
+
+def get_profile_snapshot(user):
+    """
+    Get a user's profile with its happiness and preferences attached.
+
+    The three rows are read with one query and cached together until any
+    of them is saved or deleted. Within a transaction that has changed
+    them they are read but not cached, so a rollback cannot leave stale
+    values behind.
+
+    The profile is meant for reading; load it afresh to make changes.
+
+    Args:
+        user: The User object or ID
+
+    Returns:
+        PlayerProfile: The profile, or None if the user has none
+    """
+    user_id = user.pk if isinstance(user, User) else user
+    key = _cache_key(user_id)
+
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = _load_snapshot(user_id)
+        if snapshot is None:
+            return None
+        if not _invalidation_pending(user_id):
+            cache.set(key, snapshot, PROFILE_SNAPSHOT_CACHE_TIMEOUT)
+
+    return _build_profile(snapshot, user if isinstance(user, User) else None)
+
+
+def get_request_profile(request, create=False):
+    """
+    Get the profile of the request's user, loading it at most once per request.
+
+    Works with Django and REST framework requests alike; the profile is kept
+    on the underlying HttpRequest.
+
+    Args:
+        request: The current request
+        create: Whether to create the profile if the user has none
+
+    Returns:
+        PlayerProfile: The profile, or None for anonymous users and users
+        without one
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+
+    http_request = getattr(request, '_request', request)
+    cached = getattr(http_request, REQUEST_PROFILE_ATTR, None)
+    if cached is not None and cached[0] == user.pk and (cached[1] is not None or not create):
+        return cached[1]
+
+    profile = get_profile_snapshot(user)
+    if profile is None and create:
+        profile, _created = PlayerProfile.objects.get_or_create(user=user)
+    setattr(http_request, REQUEST_PROFILE_ATTR, (user.pk, profile))
+    return profile
+
+
+def invalidate_profile_snapshot(user_id):
+    """
+    Drop a user's cached profile snapshot, now and again once the current
+    transaction commits.
+
+    Args:
+        user_id: The User ID
+    """
+    invalidation = _ProfileSnapshotInvalidation(user_id)
+    invalidation()
+    queue_on_commit(_cache_key(user_id), invalidation)
+
+
+def invalidate_profile_snapshots(user_ids):
+    """
+    Drop the cached profile snapshots of many users, now and again once the
+    current transaction commits.
+
+    Args:
+        user_ids: The User IDs
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
+    if transaction.get_connection().in_atomic_block:
+        for user_id in user_ids:
+            queue_on_commit(_cache_key(user_id), _ProfileSnapshotInvalidation(user_id))
@@ -10,6 +10,7 @@ import json
 import random
 
 from core.models import PlayerProfile, PlayerHappiness, UserPreferences, UserLocation
+from core.services.presence import record_presence
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:virtue_metrics_calculation]
@@ -168,6 +169,8 @@ class UserService:
             
         location.last_updated = timezone.now()
         location.save()
+        
+        record_presence(player_profile.user_id, latitude, longitude, zone_id=location.current_zone_id)
         return location
     
     @staticmethod
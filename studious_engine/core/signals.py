@@ -1,9 +1,22 @@
 # studious_engine/core/signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
 
-from core.models import PlayerProfile, PlayerHappiness
+from django.utils import timezone
+
+from core.models import PlayerProfile, PlayerHappiness, UserPreferences, TechTree, Art, ArtMastery, ArtTaxonomy, ArtParts, ArtStage, PracticeSession
+from core.services.art.art_service import ArtService
+from core.services.art.art_structure import invalidate_art_structure
+from core.services.art.taxonomy_tree import invalidate_taxonomy_forest
+from core.services.art.tech_tree_graph import invalidate_tech_tree_graph
+from core.services.art.mastery_service import MasteryService
+from core.services.art.practice_service import PracticeService
+from core.services.art.tech_tree_service import TechTreeService
+from core.services.heartbeat import heartbeat_writer, record_heartbeat
+from core.services.profile_cache import invalidate_profile_snapshot
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:OPTIMIZATION_LAYER:START]
@@ -22,7 +35,147 @@ def create_player_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=User)
-def save_player_profile(sender, instance, **kwargs):
-    """Ensure the PlayerProfile is saved when the User is saved."""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+def save_player_profile(sender, instance, created, **kwargs):
+    """
+    Save changes made to the User's loaded PlayerProfile along with it.
+    
+    Only the changed fields are written, and nothing when the profile was
+    not loaded or has no changes, so saves such as last_login updates on
+    login leave the profile table alone.
+    """
+    if created or not User.profile.related.is_cached(instance):
+        return
+    profile = User.profile.related.get_cached_value(instance)
+    if profile is None or profile._state.adding:
+        return
+    dirty_fields = profile.get_dirty_fields()
+    if dirty_fields:
+        profile.save(update_fields=[*dirty_fields, 'updated_at'])
+
+
+@receiver(user_logged_in)
+def record_login_heartbeat(sender, user, **kwargs):
+    """Count logging in as activity for the user's last_active."""
+    record_heartbeat(user.pk)
+
+
+@receiver(request_finished)
+def flush_heartbeats_if_due(sender, **kwargs):
+    """Write buffered last_active heartbeats once they are due."""
+    heartbeat_writer.flush_if_due()
+
+
+@receiver(post_save, sender=PlayerProfile)
+@receiver(post_delete, sender=PlayerProfile)
+def invalidate_profile_snapshot_on_profile_change(sender, instance, **kwargs):
+    """Drop the user's cached profile snapshot when their profile changes."""
+    invalidate_profile_snapshot(instance.user_id)
+
+
+@receiver(post_save, sender=PlayerHappiness)
+@receiver(post_delete, sender=PlayerHappiness)
+@receiver(post_save, sender=UserPreferences)
+@receiver(post_delete, sender=UserPreferences)
+def invalidate_profile_snapshot_on_related_change(sender, instance, **kwargs):
+    """Drop the owner's cached profile snapshot when their happiness or preferences change."""
+    if sender.player.is_cached(instance):
+        user_id = instance.player.user_id
+    else:
+        user_id = PlayerProfile.objects.filter(pk=instance.player_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        invalidate_profile_snapshot(user_id)
+
+
+@receiver(post_save, sender=TechTree)
+@receiver(post_delete, sender=TechTree)
+def invalidate_tech_tree_graph_on_node_change(sender, **kwargs):
+    """Recompile the tech tree graph when a node is added, edited or removed."""
+    invalidate_tech_tree_graph()
+
+
+@receiver(m2m_changed, sender=TechTree.parent_nodes.through)
+def invalidate_tech_tree_graph_on_edge_change(sender, action, **kwargs):
+    """Recompile the tech tree graph when prerequisite edges change."""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_tech_tree_graph()
+
+
+@receiver(post_save, sender=ArtMastery)
+def update_tech_tree_progress_on_mastery_change(sender, instance, created, update_fields=None, **kwargs):
+    """Incrementally update the tech trees that require an art when its mastery level changes."""
+    if update_fields is not None and 'mastery_level' not in update_fields:
+        return
+    if not isinstance(instance.mastery_level, int):
+        # Unresolved expression (e.g. F()); the next load will pick it up
+        return
+    
+    previous = getattr(instance, '_stored_mastery_level', None)
+    instance._stored_mastery_level = instance.mastery_level
+    if previous == instance.mastery_level or (previous is None and not instance.mastery_level):
+        return
+    
+    TechTreeService.apply_mastery_changes(instance.user_id, {instance.art_id: instance.mastery_level})
+
+
+@receiver(post_save, sender=ArtMastery)
+@receiver(post_delete, sender=ArtMastery)
+@receiver(post_save, sender=PracticeSession)
+@receiver(post_delete, sender=PracticeSession)
+def invalidate_mastery_summary_on_change(sender, instance, **kwargs):
+    """Drop the user's cached mastery summary when their masteries or practice change."""
+    MasteryService.invalidate_mastery_summary(instance.user_id)
+
+
+def _rollup_key(user_id, art_id, started_at):
+    return user_id, art_id, timezone.localdate(started_at)
+
+
+@receiver(post_save, sender=PracticeSession)
+def update_daily_rollup_on_session_save(sender, instance, **kwargs):
+    """Keep the daily practice rollup for the session's day current."""
+    key = _rollup_key(instance.user_id, instance.art_id, instance.started_at)
+    PracticeService.refresh_daily_rollup(*key)
+    
+    stored = getattr(instance, '_stored_rollup_key', None)
+    instance._stored_rollup_key = (instance.user_id, instance.art_id, instance.started_at)
+    if stored is not None and _rollup_key(*stored) != key:
+        # The session moved to another user, art or day
+        PracticeService.refresh_daily_rollup(*_rollup_key(*stored))
+
+
+@receiver(post_delete, sender=PracticeSession)
+def update_daily_rollup_on_session_delete(sender, instance, **kwargs):
+    """Drop a deleted session from its daily practice rollup."""
+    PracticeService.refresh_daily_rollup(*_rollup_key(instance.user_id, instance.art_id, instance.started_at))
+
+
+@receiver(post_save, sender=Art)
+def index_art_virtues_on_save(sender, instance, created, raw=False, **kwargs):
+    """Keep the art's virtue index in step with its improved virtues."""
+    if raw:
+        return
+    if not created and getattr(instance, '_stored_improved_virtues', None) == instance.improved_virtues:
+        return
+    ArtService.index_art_virtues(instance)
+
+
+@receiver(post_save, sender=ArtParts)
+@receiver(post_delete, sender=ArtParts)
+@receiver(post_save, sender=ArtStage)
+@receiver(post_delete, sender=ArtStage)
+def invalidate_art_structure_on_change(sender, instance, **kwargs):
+    """Rebuild the art's cached part and stage structure when a part or stage changes."""
+    invalidate_art_structure(instance.art_id)
+
+
+@receiver(post_save, sender=ArtTaxonomy)
+def invalidate_taxonomy_forest_on_save(sender, instance, **kwargs):
+    """Rebuild the cached taxonomy forest when a taxonomy changes."""
+    invalidate_taxonomy_forest()
+
+
+@receiver(post_delete, sender=ArtTaxonomy)
+def detach_taxonomy_children_on_delete(sender, instance, **kwargs):
+    """Turn a deleted taxonomy's children into roots and rebuild the cached forest."""
+    ArtTaxonomy.remove_from_paths(instance.id)
+    invalidate_taxonomy_forest()
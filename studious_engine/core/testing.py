@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+
+from core.query_budget import QueryRecorder, get_view_budget
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class QueryBudgetTestMixin:
+    """
+    TestCase mixin asserting query budgets and catching N+1 patterns.
+
+    Unlike assertNumQueries, failures list the repeated query fingerprints,
+    which is usually enough to spot the missing select_related or prefetch.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, max_queries, allow_duplicates=True):
+        """
+        Assert a block runs at most max_queries queries.
+
+        Args:
+            max_queries: The budget
+            allow_duplicates: Whether the same query may run more than once
+        """
+        with QueryRecorder() as recorder:
+            yield recorder
+        duplicates = recorder.duplicates
+        self.assertLessEqual(
+            recorder.count, max_queries,
+            f"{recorder.count} queries run, over the budget of {max_queries}; repeated: {duplicates}"
+        )
+        if not allow_duplicates:
+            self.assertFalse(duplicates, f"Queries repeated (possible N+1): {duplicates}")
+
+    def assertWithinQueryBudget(self, response, max_queries=None):
+        """
+        Assert a test client response stayed within its endpoint's budget.
+
+        Needs QueryCountMiddleware enabled, as it is in the test settings.
+
+        Args:
+            response: The test client response
+            max_queries: Budget to check against instead of the declared one
+        """
+        stats = getattr(response, 'query_stats', None)
+        self.assertIsNotNone(stats, 'Response has no query stats; is QueryCountMiddleware enabled?')
+        if max_queries is None:
+            max_queries = get_view_budget(response.resolver_match, response.request['REQUEST_METHOD'])
+        self.assertIsNotNone(max_queries, f"No query budget declared for {stats['view_name']}")
+        self.assertLessEqual(
+            stats['count'], max_queries,
+            f"{stats['view_name']} ran {stats['count']} queries, over its budget of {max_queries}; "
+            f"repeated: {stats['duplicates']}"
+        )
@@ -335,7 +335,7 @@ class ArtMasteryAPITests(TestCase):
         
         # Check that the practice session was recorded
         self.mastery.refresh_from_db()
-        self.assertEqual(len(self.mastery.practice_history), 1)
+        self.assertEqual(self.mastery.total_practice_sessions, 1)
         
         # Check that XP was awarded
         self.profile.refresh_from_db()
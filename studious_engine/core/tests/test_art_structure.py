@@ -0,0 +1,158 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TransactionTestCase
+
+from core.models import Art, ArtMastery, UserArtStageProgress
+from core.services.art.art_service import ArtService
+from core.services.art.mastery_service import MasteryService
+from core.services.art import art_structure
+from core.services.art.art_structure import ArtStructure, get_art_structure
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class ArtStructureTests(SimpleTestCase):
+    """Tests for the in-memory art structure."""
+
+    def setUp(self):
+        """Build a structure with three parts and two stages, given out of order."""
+        self.parts = [uuid.uuid4() for _ in range(3)]
+        self.stages = [uuid.uuid4() for _ in range(2)]
+        self.structure = ArtStructure(
+            uuid.uuid4(),
+            [(self.parts[2], 2), (self.parts[0], 0), (self.parts[1], 1)],
+            [(self.stages[1], 1, 40), (self.stages[0], 0, 0)]
+        )
+
+    def test_parts_in_order(self):
+        """Test part counts and neighbours follow order_index."""
+        self.assertEqual(self.structure.part_count, 3)
+        self.assertEqual(self.structure.first_part_id, self.parts[0])
+        self.assertEqual(self.structure.next_part_id(self.parts[0]), self.parts[1])
+        self.assertIsNone(self.structure.next_part_id(self.parts[2]))
+        self.assertEqual(self.structure.previous_part_id(self.parts[1]), self.parts[0])
+        self.assertIsNone(self.structure.previous_part_id(self.parts[0]))
+
+    def test_stages_in_order(self):
+        """Test stage thresholds and neighbours follow order_index."""
+        self.assertEqual(self.structure.stage_thresholds, (0, 40))
+        self.assertEqual(self.structure.next_stage_id(self.stages[0]), self.stages[1])
+        self.assertIsNone(self.structure.next_stage_id(self.stages[1]))
+
+    def test_stage_position_for_level(self):
+        """Test levels bisect to the furthest stage reached."""
+        self.assertEqual(self.structure.stage_position_for_level(0), 0)
+        self.assertEqual(self.structure.stage_position_for_level(39.9), 0)
+        self.assertEqual(self.structure.stage_position_for_level(40), 1)
+        self.assertEqual(self.structure.stage_position_for_level(100), 1)
+        self.assertEqual(ArtStructure(uuid.uuid4(), [], []).stage_position_for_level(50), -1)
+
+    def test_blob_round_trip(self):
+        """Test the cached blob rebuilds an equal structure."""
+        rebuilt = ArtStructure.from_blob(self.structure.art_id, self.structure.to_blob())
+        self.assertEqual(rebuilt.part_ids, self.structure.part_ids)
+        self.assertEqual(rebuilt.stage_ids, self.structure.stage_ids)
+        self.assertEqual(rebuilt.stage_thresholds, self.structure.stage_thresholds)
+
+
+class ArtStructureCacheTests(TransactionTestCase):
+    """Tests for the cached art structure and its invalidation."""
+
+    def setUp(self):
+        """Set up an art with two parts and a stage."""
+        self.art = Art.objects.create(name='Pottery', description='Clay')
+        self.wedging = ArtService.add_art_part(self.art, 'Wedging', 'Prepare clay', 'PRACTICE', 'Wedge clay')
+        self.throwing = ArtService.add_art_part(self.art, 'Throwing', 'Use the wheel', 'PRACTICE', 'Throw a pot')
+        self.stage = ArtService.add_art_stage(self.art, 'Apprentice', 'Learning', 0)
+
+    def test_structure_is_cached(self):
+        """Test part lookups are answered from the cache once it is warm."""
+        get_art_structure(self.art)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_art_structure(self.art.id).part_count, 2)
+            self.assertTrue(self.throwing.is_last_part)
+            self.assertIsNone(self.throwing.get_next_part())
+            self.assertTrue(self.stage.is_last_stage)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.wedging.get_next_part(), self.throwing)
+
+    def test_part_write_rebuilds_structure(self):
+        """Test adding a part is reflected in the cached structure."""
+        self.assertEqual(self.throwing.order_index, 1)
+        get_art_structure(self.art)
+
+        glazing = ArtService.add_art_part(self.art, 'Glazing', 'Finish', 'CREATION', 'Glaze a pot')
+
+        self.assertEqual(glazing.order_index, 2)
+        self.assertEqual(get_art_structure(self.art).part_ids, (self.wedging.id, self.throwing.id, glazing.id))
+        self.assertEqual(self.throwing.get_next_part(), glazing)
+
+        glazing.delete()
+        self.assertIsNone(self.throwing.get_next_part())
+
+    def test_process_cache_is_bounded(self):
+        """Test the least recently used structures leave the process cache past its limit."""
+        other = Art.objects.create(name='Weaving', description='Loom')
+        limit = art_structure.STRUCTURE_LOCAL_CACHE_SIZE
+        art_structure.STRUCTURE_LOCAL_CACHE_SIZE = 1
+        try:
+            get_art_structure(self.art)
+            get_art_structure(other)
+        finally:
+            art_structure.STRUCTURE_LOCAL_CACHE_SIZE = limit
+
+        self.assertEqual(list(art_structure._structures), [other.id])
+        # The evicted structure still comes from the shared cache
+        with self.assertNumQueries(0):
+            self.assertEqual(get_art_structure(self.art).part_count, 2)
+
+
+class StageProgressionTests(TransactionTestCase):
+    """Tests for advancing through an art's stages by mastery level."""
+
+    def setUp(self):
+        """Set up an art with four stages and a user who has reached the first."""
+        self.user = get_user_model().objects.create_user(username='potter', password='testpass')
+        self.art = Art.objects.create(name='Pottery', description='Clay')
+        self.stages = [
+            ArtService.add_art_stage(self.art, name, name, threshold)
+            for name, threshold in [('Novice', 0), ('Apprentice', 20), ('Journeyman', 50), ('Master', 90)]
+        ]
+        self.mastery = ArtMastery.objects.create(user=self.user, art=self.art, mastery_level=0)
+        MasteryService.check_stage_progression(self.mastery)
+
+    def test_level_jump_creates_skipped_stages(self):
+        """Test a jump over several stages records each of them in one call."""
+        self.mastery.mastery_level = 70
+        with self.assertNumQueries(5):
+            current, transitions = MasteryService.advance_stages(self.mastery)
+
+        self.assertEqual(current.art_stage_id, self.stages[2].id)
+        self.assertEqual(current.completion_percentage, 50)
+        self.assertEqual(
+            [(t['from_stage_id'], t['to_stage_id']) for t in transitions],
+            [(self.stages[0].id, self.stages[1].id), (self.stages[1].id, self.stages[2].id)]
+        )
+
+        rows = {p.art_stage_id: p for p in UserArtStageProgress.objects.filter(user=self.user)}
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[self.stages[0].id].completion_percentage, 100)
+        self.assertEqual(rows[self.stages[1].id].completion_percentage, 100)
+        self.assertEqual([p.art_stage_id for p in rows.values() if p.is_current], [self.stages[2].id])
+
+    def test_lower_level_does_not_move_back(self):
+        """Test stages already reached are kept when the level drops."""
+        self.mastery.mastery_level = 95
+        MasteryService.advance_stages(self.mastery)
+
+        self.mastery.mastery_level = 10
+        current, transitions = MasteryService.advance_stages(self.mastery)
+
+        self.assertEqual(current.art_stage_id, self.stages[3].id)
+        self.assertEqual(transitions, [])
@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Art, PlayerProfile
+from core.services.art.catalog_service import CatalogService
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class ArtCatalogTests(TransactionTestCase):
+    """Tests for the access-filtered, keyset-paginated art catalog."""
+
+    def setUp(self):
+        """Set up a rank 2 port player and arts across layers and ranks."""
+        self.user = get_user_model().objects.create_user(username='sailor', password='testpass')
+        self.profile, _ = PlayerProfile.objects.get_or_create(user=self.user)
+        self.profile.rank = 2
+        self.profile.economic_layer = 'port'
+        self.profile.save()
+
+        self.visible = [
+            Art.objects.create(name=name, description=name, rank_required=rank, economic_layer_required='PORT')
+            for name, rank in [('Archery', 1), ('Boating', 2), ('Carving', 1), ('Dancing', 2), ('Etching', 1)]
+        ]
+        self.hidden_rank = Art.objects.create(name='Alchemy', description='Gold', rank_required=3)
+        self.hidden_layer = Art.objects.create(name='Banking', description='Coins', economic_layer_required='LAWS')
+
+    def test_visibility_filter(self):
+        """Test the filter follows the player's layer and rank and art edits."""
+        visible = Art.objects.filter(CatalogService.visibility_filter('port', 2))
+        self.assertEqual(set(visible), set(self.visible))
+        self.assertIn(self.hidden_layer, Art.objects.filter(CatalogService.visibility_filter('laws', 2)))
+
+        self.hidden_rank.rank_required = 2
+        self.hidden_rank.save()
+        self.assertIn(self.hidden_rank, visible.all())
+
+    def test_keyset_pages(self):
+        """Test pages follow each other by cursor without overlap."""
+        first = CatalogService.get_catalog_page(self.profile, limit=2)
+        self.assertEqual([art.name for art in first['results']], ['Archery', 'Boating'])
+
+        second = CatalogService.get_catalog_page(self.profile, cursor=first['next_cursor'], limit=2)
+        self.assertEqual([art.name for art in second['results']], ['Carving', 'Dancing'])
+
+        last = CatalogService.get_catalog_page(self.profile, cursor=second['next_cursor'], limit=2)
+        self.assertEqual([art.name for art in last['results']], ['Etching'])
+        self.assertIsNone(last['next_cursor'])
+
+    def test_catalog_endpoint(self):
+        """Test the catalog endpoint pages through visible arts and rejects bad cursors."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse('core:art-catalog')
+
+        response = client.get(url, {'limit': 3, 'difficulty': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([art['name'] for art in response.data['results']], ['Archery', 'Boating', 'Carving'])
+
+        response = client.get(url, {'limit': 3, 'cursor': response.data['next_cursor']})
+        self.assertEqual([art['name'] for art in response.data['results']], ['Dancing', 'Etching'])
+        self.assertIsNone(response.data['next_cursor'])
+
+        response = client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
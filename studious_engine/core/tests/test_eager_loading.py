@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import Art, ArtMastery, ArtParts, ArtTaxonomy, PlayerProfile, TechTree
+from core.query_budget import QueryRecorder
+from core.serializers.art.progress_serializers import ArtMasterySerializer
+from core.serializers.innovation_serializers import InnovationSerializer
+from experiences.models import Experience, ExperienceInstance
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+
+class EagerLoadingTests(TestCase):
+    """Tests that list endpoints run a constant number of queries."""
+
+    def setUp(self):
+        """Set up a player whose profile can see every art."""
+        self.user = User.objects.create_user(username='collector', password='testpass')
+        profile, _ = PlayerProfile.objects.get_or_create(user=self.user)
+        profile.rank = 4
+        profile.save()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.count = 0
+
+    def _add_arts(self, count):
+        """Add arts, each with its own taxonomy, parts and mastery."""
+        for _ in range(count):
+            self.count += 1
+            taxonomy = ArtTaxonomy.objects.create(name=f'Family {self.count}', level=1)
+            art = Art.objects.create(
+                name=f'Art {self.count:02d}',
+                description='Practice',
+                taxonomy=taxonomy,
+                improved_virtues={'wisdom': self.count},
+            )
+            part = ArtParts.objects.create(art=art, name='Basics', description='-', practice_description='-')
+            ArtMastery.objects.create(user=self.user, art=art, current_part=part, mastery_level=self.count)
+            TechTree.objects.create(name=f'Tree {self.count}', description='-', required_arts=[art.id])
+
+    def _queries(self, url, params=None):
+        with QueryRecorder() as recorder:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return recorder.count
+
+    def assertConstantQueries(self, url, params=None):
+        """Assert a request runs as many queries with five times the rows."""
+        self._add_arts(1)
+        few = self._queries(url, params)
+        self._add_arts(4)
+        self.assertEqual(self._queries(url, params), few)
+
+    def test_art_list(self):
+        self.assertConstantQueries(reverse('core:art-list'))
+
+    def test_art_catalog(self):
+        self.assertConstantQueries(reverse('core:art-catalog'))
+
+    def test_arts_by_virtue(self):
+        self.assertConstantQueries(reverse('core:art-by-virtue'), {'virtue': 'wisdom'})
+
+    def test_art_mastery_list(self):
+        self.assertConstantQueries(reverse('core:art-mastery-list'))
+
+    def test_tech_tree_list(self):
+        self.assertConstantQueries(reverse('core:tech-tree-list'))
+
+    def test_mastery_counts_are_annotated(self):
+        """Test list queries annotate counts the serializer otherwise queries per object."""
+        self._add_arts(3)
+        masteries = list(ArtMasterySerializer.setup_eager_loading(ArtMastery.objects.filter(user=self.user)))
+
+        with self.assertNumQueries(0):
+            data = ArtMasterySerializer(masteries, many=True).data
+        self.assertEqual([item['total_parts'] for item in data], [1, 1, 1])
+        self.assertEqual([item['practice_count'] for item in data], [0, 0, 0])
+
+        single = ArtMastery.objects.filter(user=self.user).first()
+        self.assertEqual(ArtMasterySerializer(single).data['total_parts'], 1)
+
+    def test_experience_instance_list(self):
+        """Test instances are listed with their experience and host in constant queries."""
+        url = reverse('api:experienceinstance-list')
+
+        def add_instances(count):
+            for index in range(count):
+                host = User.objects.create_user(username=f'host{ExperienceInstance.objects.count()}-{index}')
+                experience = Experience.objects.create(
+                    name='Walk', description='-', experience_type='quest', matrix_position='soul_out',
+                    art_type='usage', good_type='present', difficulty=1, duration_minutes=30,
+                    happiness_reward=1, experience_reward=1,
+                    definition='-', end='-', parts='-', matter='-', instrument='-'
+                )
+                ExperienceInstance.objects.create(
+                    experience=experience,
+                    host=PlayerProfile.objects.get_or_create(user=host)[0],
+                    start_time=timezone.now() + timedelta(days=1)
+                )
+
+        add_instances(1)
+        few = self._queries(url)
+        add_instances(4)
+        self.assertEqual(self._queries(url), few)
+
+    def test_nested_needs_are_collected(self):
+        """Test nested serializers contribute their own lookups, prefixed."""
+        select, prefetch, _annotations = InnovationSerializer.get_data_needs()
+        prefetch_to = [getattr(lookup, 'prefetch_to', lookup) for lookup in prefetch]
+
+        self.assertIn('sector', select)
+        self.assertIn('zones', prefetch_to)
+        self.assertIn('unlocked_tech', prefetch_to)
+        self.assertEqual(len(prefetch_to), len(set(prefetch_to)))
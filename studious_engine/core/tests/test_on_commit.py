@@ -0,0 +1,86 @@
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from core.services.on_commit import get_queued, get_transaction_snapshot, queue_on_commit
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class QueueOnCommitTests(TransactionTestCase):
+    """Tests for keyed on_commit callbacks and their transaction snapshots."""
+
+    def setUp(self):
+        self.calls = []
+
+    def callback(self):
+        self.calls.append('run')
+
+    def test_runs_once_on_commit(self):
+        """Test a key queued several times runs its callback once, after commit."""
+        with transaction.atomic():
+            queue_on_commit('key', self.callback)
+            queue_on_commit('key', self.callback)
+            self.assertEqual(get_queued('key'), self.callback)
+            self.assertEqual(self.calls, [])
+
+        self.assertEqual(self.calls, ['run'])
+        self.assertIsNone(get_queued('key'))
+
+    def test_runs_immediately_outside_transaction(self):
+        """Test queuing in autocommit mode runs the callback and leaves nothing queued."""
+        queue_on_commit('key', self.callback)
+
+        self.assertEqual(self.calls, ['run'])
+        self.assertIsNone(get_queued('key'))
+
+    def test_rollback_drops_callback(self):
+        """Test a rolled back transaction leaves nothing queued."""
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                queue_on_commit('key', self.callback)
+                raise RuntimeError
+
+        self.assertIsNone(get_queued('key'))
+        with transaction.atomic():
+            self.assertIsNone(get_queued('key'))
+        self.assertEqual(self.calls, [])
+
+    def test_savepoint_rollback_allows_requeue(self):
+        """Test a callback dropped with its savepoint is queued again afterwards."""
+        with transaction.atomic():
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    queue_on_commit('key', self.callback)
+                    raise RuntimeError
+            self.assertIsNone(get_queued('key'))
+
+            with transaction.atomic():
+                queue_on_commit('key', self.callback)
+            # A released savepoint keeps its callbacks
+            self.assertEqual(get_queued('key'), self.callback)
+
+        self.assertEqual(self.calls, ['run'])
+
+    def test_snapshot_reused_until_requeued(self):
+        """Test the snapshot is built once per transaction and rebuilt after a new change."""
+        builds = []
+
+        def build():
+            builds.append(len(builds))
+            return builds[-1]
+
+        self.assertIsNone(get_transaction_snapshot('key', build))
+        with transaction.atomic():
+            queue_on_commit('key', self.callback)
+            self.assertEqual(get_transaction_snapshot('key', build), 0)
+            self.assertEqual(get_transaction_snapshot('key', build), 0)
+
+            queue_on_commit('key', self.callback)
+            self.assertEqual(get_transaction_snapshot('key', build), 1)
+
+        self.assertIsNone(get_transaction_snapshot('key', build))
+        self.assertEqual(builds, [0, 1])
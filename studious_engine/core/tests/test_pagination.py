@@ -0,0 +1,104 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core.api.art import ArtMasteryViewSet
+from core.api.base import MarketItemViewSet
+from core.api.pagination import KeysetPagination
+from core.models import Art, ArtMastery, ArtTaxonomy, MarketItem
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class KeysetPaginationTests(TestCase):
+    """Tests for keyset pagination on the viewsets that opt into it."""
+
+    def setUp(self):
+        """Set up arts sharing names so pages split on ties."""
+        self.user = get_user_model().objects.create_user(username='reader', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.taxonomy = ArtTaxonomy.objects.create(name='Sciences')
+        self.url = reverse('core:art-taxonomy-arts', args=[self.taxonomy.id])
+        self.arts = [
+            Art.objects.create(name=name, description=name, taxonomy=self.taxonomy)
+            for name in ['Astronomy', 'Botany', 'Botany', 'Botany', 'Cartography']
+        ]
+        for level, art in zip([10, 40, 40, 70, 90], self.arts):
+            ArtMastery.objects.create(user=self.user, art=art, mastery_level=level)
+
+    def _walk(self, url, **params):
+        ids = []
+        cursor = None
+        while True:
+            response = self.client.get(url, dict(params, cursor=cursor) if cursor else params)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            ids.extend(item['id'] for item in response.data['results'])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_pages_cover_every_row_once(self):
+        """Test walking the cursors visits every art once, in (name, id) order."""
+        ids = self._walk(self.url, page_size=2)
+
+        expected = sorted(self.arts, key=lambda art: (art.name, art.id))
+        self.assertEqual(ids, [str(art.id) for art in expected])
+
+    def _walk_view(self, view, queryset):
+        rows = []
+        cursor = None
+        while True:
+            request = Request(APIRequestFactory().get('/', {'page_size': 2, 'cursor': cursor} if cursor else {'page_size': 2}))
+            paginator = KeysetPagination()
+            rows.extend(paginator.paginate_queryset(queryset, request, view))
+            cursor = paginator.get_next_cursor()
+            if cursor is None:
+                return rows
+
+    def test_descending_sort_key(self):
+        """Test a descending sort key pages from the highest value down."""
+        masteries = self._walk_view(ArtMasteryViewSet(), ArtMastery.objects.filter(user=self.user))
+
+        self.assertEqual([mastery.mastery_level for mastery in masteries], [90, 70, 40, 40, 10])
+
+    def test_sub_millisecond_datetimes(self):
+        """Test datetimes within one millisecond of each other are neither skipped nor repeated."""
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        items = []
+        for index in range(4):
+            item = MarketItem.objects.create(name=f'Item {index}', description='Item', category='physical')
+            MarketItem.objects.filter(pk=item.pk).update(created_at=start + datetime.timedelta(microseconds=100 * index))
+            items.append(item)
+
+        rows = self._walk_view(MarketItemViewSet(), MarketItem.objects.all())
+
+        self.assertEqual([item.pk for item in rows], [item.pk for item in reversed(items)])
+
+    def test_counts_on_request(self):
+        """Test exact and approximate totals are only included when asked for."""
+        response = self.client.get(self.url, {'page_size': 2, 'count': 'exact'})
+        self.assertEqual(response.data['count'], 5)
+
+        response = self.client.get(self.url, {'page_size': 2, 'count': 'approximate'})
+        self.assertIsInstance(response.data['count'], int)
+
+    def test_other_endpoints_unpaginated(self):
+        """Test endpoints that did not opt in still return a plain list."""
+        response = self.client.get(reverse('core:art-list'))
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 5)
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is a 404, not a server error."""
+        response = self.client.get(self.url, {'cursor': 'WyJ4IiwgIm5vdC1hLXV1aWQiXQ=='})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,120 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.models import PlayerProfile
+from core.services.heartbeat import heartbeat_writer
+from core.services.presence import (
+    LocalPresenceStore,
+    get_active_users,
+    get_active_users_in_zone,
+    get_active_users_near,
+    get_last_seen,
+    get_presence_store,
+    record_presence,
+)
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+# Two points about 0.8 km apart and one about 5 km away
+HARBOUR = (38.7223, -9.1393)
+MARKET = (38.7290, -9.1420)
+HILLTOP = (38.7600, -9.1000)
+
+
+class PresenceTests(TestCase):
+    """Tests for presence heartbeats and active-user queries."""
+
+    def setUp(self):
+        cache.clear()
+        get_presence_store().clear()
+        heartbeat_writer.flush()
+        self.users = [User.objects.create_user(username=f'rover{i}', password='testpass') for i in range(3)]
+        self.ids = [user.pk for user in self.users]
+
+    def test_active_users_in_zone(self):
+        """Test zone queries follow users as they move and skip stale heartbeats."""
+        now = timezone.now()
+        record_presence(self.ids[0], zone_id=1, when=now - timedelta(minutes=2))
+        record_presence(self.ids[1], zone_id=1, when=now)
+        record_presence(self.ids[2], zone_id=2, when=now - timedelta(minutes=30))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_active_users_in_zone(1), [self.ids[1], self.ids[0]])
+            self.assertEqual(get_active_users_in_zone(2), [])
+            self.assertEqual(get_active_users_in_zone(2, minutes=60), [self.ids[2]])
+
+        record_presence(self.ids[0], zone_id=2)
+        self.assertEqual(get_active_users_in_zone(1), [self.ids[1]])
+        self.assertEqual(get_active_users_in_zone(2), [self.ids[0]])
+
+    def test_heartbeats_without_location_keep_zone(self):
+        """Test a heartbeat without a location refreshes the user's last zone."""
+        record_presence(self.ids[0], *HARBOUR, zone_id=5, when=timezone.now() - timedelta(minutes=30))
+        record_presence(self.ids[0])
+
+        self.assertEqual(get_active_users_in_zone(5), [self.ids[0]])
+        self.assertEqual(get_active_users_near(*HARBOUR, radius_km=0.5), [self.ids[0]])
+        self.assertEqual(get_active_users(), [self.ids[0]])
+
+    def test_active_users_near(self):
+        """Test nearby queries filter by exact distance."""
+        record_presence(self.ids[0], *HARBOUR)
+        record_presence(self.ids[1], *MARKET)
+        record_presence(self.ids[2], *HILLTOP)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_active_users_near(*HARBOUR, radius_km=0.5), [self.ids[0]])
+            self.assertEqual(sorted(get_active_users_near(*HARBOUR, radius_km=2)), self.ids[:2])
+            self.assertEqual(sorted(get_active_users_near(*HARBOUR, radius_km=10)), self.ids)
+
+        record_presence(self.ids[0], *HILLTOP)
+        self.assertEqual(get_active_users_near(*HARBOUR, radius_km=0.5), [])
+
+        with self.assertRaises(ValueError):
+            get_active_users_near(*HARBOUR, radius_km=100)
+
+    def test_last_active_persisted_in_batches(self):
+        """Test heartbeats reach last_active once the heartbeat writer flushes."""
+        long_ago = timezone.now() - timedelta(days=1)
+        PlayerProfile.objects.update(last_active=long_ago)
+        when = timezone.now()
+        record_presence(self.ids[0], when=when)
+        self.assertEqual(get_last_seen(self.ids[0]).timestamp(), when.timestamp())
+
+        heartbeat_writer.flush()
+        self.assertEqual(PlayerProfile.objects.get(user_id=self.ids[0]).last_active, when)
+        self.assertEqual(PlayerProfile.objects.get(user_id=self.ids[1]).last_active, long_ago)
+
+    def test_requests_record_presence(self):
+        """Test authenticated requests record a heartbeat."""
+        self.client.force_login(self.users[0])
+        self.client.get('/about/')
+        self.assertEqual(get_active_users(), [self.ids[0]])
+        self.assertIsNone(get_last_seen(self.ids[1]))
+
+
+class LocalPresenceStoreTests(SimpleTestCase):
+    """Tests for the in-process presence store's memory use."""
+
+    def test_empty_sets_and_expired_states_are_dropped(self):
+        """Test a set left empty is removed and expired states go on the next touch."""
+        store = LocalPresenceStore()
+        store.touch(1, 100.0, ['zone:1'], [], 'state:1', {'zone_id': 1})
+        store.touch(1, 200.0, ['zone:2'], ['zone:1'], 'state:1', {'zone_id': 2})
+        self.assertEqual(list(store._sets), ['zone:2'])
+
+        store._states['state:1'] = ({'zone_id': 2}, time.time() - 1)
+        store.touch(2, 300.0, ['zone:2'], [], 'state:2', {'zone_id': 2})
+        self.assertEqual(list(store._states), ['state:2'])
+        self.assertIsNone(store.get_state('state:1'))
@@ -0,0 +1,130 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import RequestFactory, TransactionTestCase
+
+from core.models import PlayerHappiness, PlayerProfile, UserPreferences
+from core.services.art.practice_effects import PracticeEffectBatch
+from core.services.profile_cache import get_profile_snapshot, get_request_profile, invalidate_profile_snapshots
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class ProfileSnapshotTests(TransactionTestCase):
+    """Tests for the cached profile, happiness and preferences snapshot."""
+
+    def setUp(self):
+        """Set up a user whose profile has happiness and preferences."""
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='citizen', password='testpass')
+        self.profile = PlayerProfile.objects.get(user=self.user)
+        self.profile.rank = 2
+        self.profile.save()
+        PlayerHappiness.objects.filter(player=self.profile).update(wisdom=40)
+        UserPreferences.objects.create(player=self.profile, language_preference='fr')
+
+    def test_snapshot_cached_with_related_rows(self):
+        """Test the snapshot is read with one query, then served from the cache."""
+        with self.assertNumQueries(1):
+            profile = get_profile_snapshot(self.user)
+            self.assertEqual(profile.happiness.wisdom, 40)
+            self.assertEqual(profile.preferences.language_preference, 'fr')
+
+        with self.assertNumQueries(0):
+            profile = get_profile_snapshot(self.user.id)
+            self.assertEqual(profile.pk, self.profile.pk)
+            self.assertEqual(profile.rank, 2)
+            self.assertEqual(profile.happiness.wisdom, 40)
+            self.assertEqual(profile.preferences.player, profile)
+
+    def test_saves_invalidate_snapshot(self):
+        """Test saving the profile, happiness or preferences drops the snapshot."""
+        get_profile_snapshot(self.user)
+
+        happiness = PlayerHappiness.objects.get(player=self.profile)
+        happiness.wisdom = 60
+        happiness.save()
+        self.assertEqual(get_profile_snapshot(self.user).happiness.wisdom, 60)
+
+        preferences = UserPreferences.objects.get(player=self.profile)
+        preferences.delete()
+        with self.assertRaises(UserPreferences.DoesNotExist):
+            _ = get_profile_snapshot(self.user).preferences
+
+        self.profile.rank = 3
+        self.profile.save()
+        self.assertEqual(get_profile_snapshot(self.user).rank, 3)
+
+    def test_practice_xp_invalidates_snapshot(self):
+        """Test XP awarded with a queryset update drops the snapshot."""
+        get_profile_snapshot(self.user)
+
+        batch = PracticeEffectBatch()
+        batch.xp_by_user[self.user.id] = 25
+        batch.flush()
+        self.assertEqual(get_profile_snapshot(self.user).experience_points, 25)
+
+    def test_uncommitted_changes_not_cached(self):
+        """Test a snapshot read after uncommitted changes is not cached."""
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.profile.rank = 4
+                self.profile.save()
+                self.assertEqual(get_profile_snapshot(self.user).rank, 4)
+                raise RuntimeError('rollback')
+
+        self.assertEqual(get_profile_snapshot(self.user).rank, 2)
+
+    def test_bulk_invalidation_queued_once(self):
+        """Test repeated bulk invalidations in one transaction queue one callback per user."""
+        get_profile_snapshot(self.user)
+        with transaction.atomic():
+            invalidate_profile_snapshots([self.user.id])
+            invalidate_profile_snapshots([self.user.id])
+            self.assertEqual(len(connection.run_on_commit), 1)
+            PlayerProfile.objects.filter(pk=self.profile.pk).update(rank=5)
+            # The pending invalidation keeps the uncommitted read out of the cache
+            self.assertEqual(get_profile_snapshot(self.user).rank, 5)
+
+        self.assertEqual(get_profile_snapshot(self.user).rank, 5)
+
+    def test_missing_profile(self):
+        """Test users without a profile get None, or a new profile when asked."""
+        self.profile.delete()
+        self.assertIsNone(get_profile_snapshot(self.user))
+
+        request = RequestFactory().get('/')
+        request.user = self.user
+        self.assertIsNone(get_request_profile(request))
+        profile = get_request_profile(request, create=True)
+        self.assertEqual(profile.user_id, self.user.id)
+        self.assertTrue(PlayerProfile.objects.filter(user=self.user).exists())
+
+
+class RequestProfileTests(TransactionTestCase):
+    """Tests for the request-scoped profile accessor."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='visitor', password='testpass')
+
+    def test_loaded_once_per_request(self):
+        """Test the profile is loaded at most once per request."""
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        with self.assertNumQueries(1):
+            profile = get_request_profile(request)
+        with self.assertNumQueries(0):
+            self.assertIs(get_request_profile(request), profile)
+            self.assertEqual(profile.user, self.user)
+
+        # A new request reads the cached snapshot
+        other_request = RequestFactory().get('/')
+        other_request.user = self.user
+        with self.assertNumQueries(0):
+            self.assertEqual(get_request_profile(other_request).pk, profile.pk)
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Art, ArtTaxonomy
+from core.query_budget import (
+    UNRESOLVED_VIEW_NAME, QueryBudgetExceeded, fingerprint, get_endpoint_stats, reset_endpoint_stats
+)
+from core.testing import QueryBudgetTestMixin
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class QueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    """Tests for per-request query counting and budgets."""
+
+    def setUp(self):
+        """Set up a user and taxonomies."""
+        self.user = get_user_model().objects.create_user(username='counter', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.taxonomy = ArtTaxonomy.objects.create(name='Crafts', level=1)
+        reset_endpoint_stats()
+
+    def test_fingerprint_ignores_parameters(self):
+        """Test queries differing only in parameters share a fingerprint."""
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s) LIMIT 21'),
+            fingerprint('SELECT  *  FROM t WHERE id IN (%s) LIMIT 1')
+        )
+
+    def test_headers_and_stats(self):
+        """Test counts are sent as headers and gathered per URL name."""
+        response = self.client.get(reverse('core:art-taxonomy-list'))
+
+        self.assertEqual(response['X-Query-Count'], str(response.query_stats['count']))
+        self.assertEqual(response['X-Query-Duplicates'], '0')
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(get_endpoint_stats()['core:art-taxonomy-list']['requests'], 1)
+
+    def test_unresolved_paths_share_one_entry(self):
+        """Test requests matching no URL are counted under one key, not per path."""
+        self.client.get('/no-such-page/1/')
+        self.client.get('/no-such-page/2/')
+
+        stats = get_endpoint_stats()
+        self.assertEqual(stats[UNRESOLVED_VIEW_NAME]['requests'], 2)
+        self.assertNotIn('/no-such-page/1/', stats)
+
+    def test_stats_endpoint_is_local_only(self):
+        """Test the stats endpoint is only served to internal IPs in debug mode."""
+        self.client.get(reverse('core:art-taxonomy-list'))
+        url = reverse('core:query_stats')
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with override_settings(DEBUG=True, INTERNAL_IPS=['127.0.0.1']):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('core:art-taxonomy-list', response.json())
+
+    def test_budget_exceeded_fails(self):
+        """Test a request over its budget raises, naming the repeated query."""
+        for i in range(3):
+            Art.objects.create(name=f'Weaving {i}', description='Loom', taxonomy=self.taxonomy)
+
+        with override_settings(QUERY_BUDGETS={'core:art-list': 2}):
+            with self.assertRaisesMessage(QueryBudgetExceeded, 'core:art-list ran'):
+                self.client.get(reverse('core:art-list'))
+
+    def test_max_queries_reports_duplicates(self):
+        """Test the helper flags repeated queries."""
+        with self.assertRaisesMessage(AssertionError, 'possible N+1'):
+            with self.assertMaxQueries(5, allow_duplicates=False):
+                for _ in range(2):
+                    list(ArtTaxonomy.objects.filter(name='Crafts'))
@@ -1,13 +1,22 @@
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from core.models import (
+    Art,
+    ArtMastery,
+    ArtParts,
+    ArtTaxonomy,
+    ArtVirtue,
     PlayerProfile, 
     PlayerHappiness, 
     UserPreferences, 
     UserLocation
 )
+from core.services.art.art_service import ArtService
+from core.services.art.mastery_service import MasteryService
+from core.services.art.practice_service import PracticeService
+from core.services.art.taxonomy_tree import get_taxonomy_forest
 from core.services.user_service import UserService
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -229,4 +238,83 @@ class UserServiceTests(TestCase):
             self.assertIn('description', rec)
             self.assertIn('target_virtue', rec)
             self.assertIn('current_score', rec)
-            self.assertIn('estimated_gain', rec) 
\ No newline at end of file
+            self.assertIn('estimated_gain', rec) 
+
+
+class ArtVirtueIndexTests(TestCase):
+    """Tests for looking up arts through the virtue index."""
+    
+    def setUp(self):
+        """Set up arts improving overlapping virtues."""
+        self.rhetoric = Art.objects.create(name='Rhetoric', description='Speech', improved_virtues={'Wisdom': 15, 'courage': 5})
+        self.philosophy = Art.objects.create(name='Philosophy', description='Thought', improved_virtues={'wisdom': 25})
+        self.sculpture = Art.objects.create(name='Sculpture', description='Stone', improved_virtues={'beauty': 20})
+    
+    def test_arts_ranked_by_impact(self):
+        """Test arts come back ordered by impact, case-insensitively and limited."""
+        self.assertEqual(ArtService.get_arts_by_virtue('WISDOM'), [self.philosophy, self.rhetoric])
+        self.assertEqual(ArtService.get_arts_by_virtue('wisdom', limit=1), [self.philosophy])
+        self.assertEqual(ArtService.get_arts_by_virtue('justice'), [])
+    
+    def test_index_follows_edits(self):
+        """Test editing an art's virtues updates the index."""
+        self.rhetoric.improved_virtues = {'wisdom': 30, 'justice': 10}
+        self.rhetoric.save()
+        
+        self.assertEqual(ArtService.get_arts_by_virtue('wisdom'), [self.rhetoric, self.philosophy])
+        self.assertEqual(ArtService.get_arts_by_virtue('courage'), [])
+        self.assertEqual(
+            set(ArtVirtue.objects.filter(art=self.rhetoric).values_list('virtue', 'impact')),
+            {('wisdom', 30), ('justice', 10)}
+        )
+    
+    def test_unchanged_virtues_skip_reindex(self):
+        """Test saving an art without touching its virtues does not rewrite the index."""
+        art = Art.objects.get(pk=self.sculpture.pk)
+        art.name = 'Stone Carving'
+        with self.assertNumQueries(1):
+            art.save()
+
+
+class MasterySummaryTests(TransactionTestCase):
+    """Tests for the cached, aggregated mastery summary."""
+    
+    def setUp(self):
+        """Set up masteries across a two-level taxonomy."""
+        self.user = User.objects.create_user(username='scholar', password='testpass')
+        self.liberal = ArtTaxonomy.objects.create(name='Liberal Arts', level=1)
+        self.trivium = ArtTaxonomy.objects.create(name='Trivium', parent=self.liberal, level=2)
+        self.logic = Art.objects.create(name='Logic', description='Reason', taxonomy=self.trivium, improved_virtues={'wisdom': 20})
+        self.grammar = Art.objects.create(name='Grammar', description='Words', taxonomy=self.liberal, improved_virtues={'wisdom': 10})
+        self.part = ArtParts.objects.create(art=self.logic, name='Syllogisms', description='Forms', practice_description='Solve')
+        ArtMastery.objects.create(user=self.user, art=self.logic, mastery_level=100)
+        ArtMastery.objects.create(user=self.user, art=self.grammar, mastery_level=50)
+    
+    def test_summary_figures(self):
+        """Test counts, averages and breakdowns come from two queries."""
+        get_taxonomy_forest()
+        with self.assertNumQueries(2):
+            summary = MasteryService.get_mastery_summary(self.user)
+        
+        self.assertEqual(summary['total_arts'], 2)
+        self.assertEqual(summary['completed_arts'], 1)
+        self.assertEqual(summary['avg_mastery'], 75)
+        self.assertEqual(summary['highest_level'], {'name': 'Logic', 'level': 100})
+        self.assertEqual(summary['taxonomy_groups']['Trivium'], {'count': 1, 'avg_level': 100})
+        self.assertEqual(
+            summary['categories'],
+            [{'id': str(self.liberal.id), 'name': 'Liberal Arts', 'count': 2, 'average_mastery': 75}]
+        )
+        self.assertEqual(summary['virtue_groups']['wisdom']['count'], 2)
+        self.assertAlmostEqual(summary['virtue_groups']['wisdom']['weighted_impact'], 25)
+    
+    def test_summary_cached_until_practice(self):
+        """Test the summary is served from the cache until the user practices."""
+        MasteryService.get_mastery_summary(self.user)
+        with self.assertNumQueries(0):
+            MasteryService.get_mastery_summary(self.user)
+        
+        PracticeService.log_practice(self.user, self.logic, self.part, 30)
+        
+        summary = MasteryService.get_mastery_summary(self.user)
+        self.assertEqual(summary['most_practiced'], {'name': 'Logic', 'sessions': 1})
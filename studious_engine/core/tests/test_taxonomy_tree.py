@@ -0,0 +1,93 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from core.models import Art, ArtMastery, ArtTaxonomy
+from core.services.art.taxonomy_tree import get_taxonomy_forest
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class TaxonomyTreeTests(TransactionTestCase):
+    """Tests for materialised-path taxonomy subtrees and the cached forest."""
+
+    def setUp(self):
+        """Set up Arts > Music > Lyre and a separate Crafts tree."""
+        self.arts = ArtTaxonomy.objects.create(name='Arts', level=1)
+        self.music = ArtTaxonomy.objects.create(name='Music', parent=self.arts, level=2)
+        self.lyre = ArtTaxonomy.objects.create(name='Lyre', parent=self.music, level=3)
+        self.crafts = ArtTaxonomy.objects.create(name='Crafts', level=1)
+
+    def test_descendants_in_one_query(self):
+        """Test a whole subtree is found by path prefix."""
+        with self.assertNumQueries(1):
+            descendants = set(self.arts.get_descendants())
+        self.assertEqual(descendants, {self.arts, self.music, self.lyre})
+        self.assertEqual(set(self.music.get_descendants(include_self=False)), {self.lyre})
+
+    def test_full_path_display_from_cache(self):
+        """Test display paths are answered from the cached forest."""
+        get_taxonomy_forest()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.lyre.get_full_path_display(), 'Arts > Music > Lyre')
+
+    def test_reparent_rewrites_subtree(self):
+        """Test moving a node rewrites the paths of everything below it."""
+        self.music.parent = self.crafts
+        self.music.save()
+
+        self.lyre.refresh_from_db()
+        self.assertEqual(self.lyre.path, f'{self.crafts.id}/{self.music.id}/{self.lyre.id}')
+        self.assertEqual(set(self.crafts.get_descendants()), {self.crafts, self.music, self.lyre})
+        self.assertEqual(get_taxonomy_forest().full_path_display(self.lyre.id), 'Crafts > Music > Lyre')
+
+    def test_uncommitted_forest_reused_in_transaction(self):
+        """Test a transaction that changed the taxonomy builds its own forest once per change."""
+        with transaction.atomic():
+            self.lyre.name = 'Kithara'
+            self.lyre.save()
+            forest = get_taxonomy_forest()
+            self.assertEqual(forest.name(self.lyre.id), 'Kithara')
+            with self.assertNumQueries(0):
+                self.assertIs(get_taxonomy_forest(), forest)
+
+            self.lyre.name = 'Harp'
+            self.lyre.save()
+            self.assertEqual(get_taxonomy_forest().name(self.lyre.id), 'Harp')
+
+        self.assertEqual(get_taxonomy_forest().full_path_display(self.lyre.id), 'Arts > Music > Harp')
+
+    def test_cannot_move_under_own_subtree(self):
+        """Test a node cannot become its own descendant."""
+        self.arts.parent = self.lyre
+        with self.assertRaises(ValueError):
+            self.arts.save()
+
+    def test_delete_detaches_children(self):
+        """Test deleting a node makes its children roots."""
+        self.music.delete()
+
+        self.lyre.refresh_from_db()
+        self.assertIsNone(self.lyre.parent_id)
+        self.assertEqual(self.lyre.path, str(self.lyre.id))
+        self.assertIn(self.lyre.id, get_taxonomy_forest().root_ids)
+
+    def test_dashboard_radar_chart(self):
+        """Test category averages include masteries anywhere in the subtree."""
+        user = get_user_model().objects.create_user(username='bard', password='testpass')
+        lyre_playing = Art.objects.create(name='Lyre Playing', description='Strings', taxonomy=self.lyre)
+        singing = Art.objects.create(name='Singing', description='Voice', taxonomy=self.arts)
+        ArtMastery.objects.create(user=user, art=lyre_playing, mastery_level=40)
+        ArtMastery.objects.create(user=user, art=singing, mastery_level=20)
+
+        self.client.force_login(user)
+        response = self.client.get(reverse('core:art_mastery_dashboard'))
+
+        self.assertEqual(response.status_code, 200)
+        categories = {c['name']: c['average_mastery'] for c in response.context['mastery_categories']}
+        self.assertEqual(categories, {'Arts': 30, 'Crafts': 0})
@@ -0,0 +1,257 @@
+import uuid
+
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import transaction
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import TechTree, UserTechTreeProgress
+from core.services.art.tech_tree_graph import (
+    TechTreeGraph,
+    get_tech_tree_graph,
+)
+from core.services.art.tech_tree_layout import get_tech_tree_layout
+from core.services.art.tech_tree_service import TechTreeService
+from core.views.art import TechTreeView
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+
+class TechTreeGraphTests(SimpleTestCase):
+    """Tests for the in-memory compiled tech tree graph."""
+
+    def setUp(self):
+        """Build a diamond: root -> (left, right) -> leaf."""
+        self.root, self.left, self.right, self.leaf = (uuid.uuid4() for _ in range(4))
+        edges = [
+            (self.left, self.root),
+            (self.right, self.root),
+            (self.leaf, self.left),
+            (self.leaf, self.right),
+        ]
+        self.graph = TechTreeGraph([self.root, self.left, self.right, self.leaf], edges)
+
+    def test_closures(self):
+        """Test ancestor and descendant closures of a diamond."""
+        self.assertCountEqual(self.graph.ancestor_ids(self.leaf), [self.root, self.left, self.right])
+        self.assertCountEqual(self.graph.descendant_ids(self.root), [self.left, self.right, self.leaf])
+        self.assertEqual(self.graph.ancestor_ids(self.root), [])
+        self.assertTrue(self.graph.is_ancestor(self.root, self.leaf))
+        self.assertFalse(self.graph.is_ancestor(self.leaf, self.root))
+
+    def test_roots_and_leaves(self):
+        """Test root and leaf detection."""
+        self.assertTrue(self.graph.is_root(self.root))
+        self.assertFalse(self.graph.is_root(self.leaf))
+        self.assertTrue(self.graph.is_leaf(self.leaf))
+        self.assertFalse(self.graph.is_leaf(self.left))
+
+    def test_topological_order(self):
+        """Test that parents always come before their children."""
+        position = {self.graph.node_ids[i]: n for n, i in enumerate(self.graph.topological_order)}
+        self.assertLess(position[self.root], position[self.left])
+        self.assertLess(position[self.left], position[self.leaf])
+        self.assertLess(position[self.right], position[self.leaf])
+
+    def test_evaluate(self):
+        """Test statuses are derived from direct prerequisite completion."""
+        statuses = self.graph.evaluate({self.root, self.left})
+        self.assertEqual(statuses[self.root], TechTreeGraph.COMPLETED)
+        self.assertEqual(statuses[self.left], TechTreeGraph.COMPLETED)
+        self.assertEqual(statuses[self.right], TechTreeGraph.AVAILABLE)
+        self.assertEqual(statuses[self.leaf], TechTreeGraph.LOCKED)
+
+        statuses = self.graph.evaluate_many({1: [], 2: [self.root, self.left, self.right]})
+        self.assertEqual(statuses[1][self.left], TechTreeGraph.LOCKED)
+        self.assertEqual(statuses[2][self.leaf], TechTreeGraph.AVAILABLE)
+
+    def test_cycle_does_not_hang(self):
+        """Test that a cycle is walked instead of looping forever."""
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        graph = TechTreeGraph([a, b, c], [(a, b), (b, a), (c, a)])
+        self.assertCountEqual(graph.ancestor_ids(c), [a, b])
+        self.assertCountEqual(graph.ancestor_ids(a), [a, b])
+
+
+class TechTreeGraphModelTests(TransactionTestCase):
+    """Tests for TechTree methods answered from the compiled graph."""
+
+    def setUp(self):
+        """Set up a small chain of tech trees."""
+        self.basics = TechTree.objects.create(name='Basics', description='Start here')
+        self.middle = TechTree.objects.create(name='Middle', description='Next step', level=2)
+        self.advanced = TechTree.objects.create(name='Advanced', description='Last step', level=3)
+        self.middle.parent_nodes.add(self.basics)
+        self.advanced.parent_nodes.add(self.middle)
+
+    def test_get_all_prerequisites(self):
+        """Test recursive prerequisites come from the graph."""
+        self.assertCountEqual(self.advanced.get_all_prerequisites(), [self.basics, self.middle])
+        self.assertCountEqual(self.basics.get_all_unlocks(), [self.middle, self.advanced])
+
+    def test_graph_is_cached_between_calls(self):
+        """Test the compiled graph is reused until the version changes."""
+        graph = get_tech_tree_graph()
+        with self.assertNumQueries(0):
+            self.assertIs(get_tech_tree_graph(), graph)
+            self.assertTrue(self.basics.is_root_node)
+            self.assertTrue(self.advanced.is_leaf_node)
+
+    def test_edge_change_invalidates_graph(self):
+        """Test adding an edge recompiles the graph."""
+        graph = get_tech_tree_graph()
+        self.advanced.parent_nodes.add(self.basics)
+
+        self.assertIsNot(get_tech_tree_graph(), graph)
+        self.assertCountEqual(get_tech_tree_graph().parent_ids(self.advanced.id), [self.middle.id, self.basics.id])
+
+    def test_uncommitted_graph_reused_in_transaction(self):
+        """Test a transaction that changed the graph compiles its own snapshot once per change."""
+        cached = get_tech_tree_graph()
+        with transaction.atomic():
+            self.advanced.parent_nodes.add(self.basics)
+            graph = get_tech_tree_graph()
+            self.assertIsNot(graph, cached)
+            with self.assertNumQueries(0):
+                self.assertIs(get_tech_tree_graph(), graph)
+
+            self.advanced.parent_nodes.remove(self.basics)
+            self.assertEqual(get_tech_tree_graph().parent_ids(self.advanced.id), [self.middle.id])
+
+    def test_statuses_bulk(self):
+        """Test evaluating statuses for several users in a single progress query."""
+        first = User.objects.create_user(username='first', password='testpass123')
+        second = User.objects.create_user(username='second', password='testpass123')
+        UserTechTreeProgress.objects.create(user=second, tech_tree=self.basics, progress_percentage=100)
+        get_tech_tree_graph()
+
+        with self.assertNumQueries(1):
+            statuses = TechTreeService.get_tech_tree_statuses_bulk([first, second])
+
+        self.assertEqual(statuses[first.id][self.basics.id], TechTreeGraph.AVAILABLE)
+        self.assertEqual(statuses[first.id][self.middle.id], TechTreeGraph.LOCKED)
+        self.assertEqual(statuses[second.id][self.basics.id], TechTreeGraph.COMPLETED)
+        self.assertEqual(statuses[second.id][self.middle.id], TechTreeGraph.AVAILABLE)
+        self.assertTrue(TechTreeService.is_tech_tree_unlocked(second, self.middle))
+        self.assertFalse(TechTreeService.is_tech_tree_unlocked(first, self.middle))
+
+    def test_bulk_accepts_string_user_ids(self):
+        """Test user IDs given as strings key the results like the integer IDs."""
+        user = User.objects.create_user(username='first', password='testpass123')
+
+        statuses = TechTreeService.get_tech_tree_statuses_bulk([str(user.id)])
+        self.assertEqual(statuses[user.id][self.basics.id], TechTreeGraph.AVAILABLE)
+        recommendations = TechTreeService.get_recommended_tech_trees_bulk([str(user.id)])
+        self.assertEqual([tree['id'] for tree in recommendations[user.id]], [self.basics.id])
+
+    def test_unlocked_unknown_tree(self):
+        """Test checking a tree that is not in the graph raises ValueError."""
+        user = User.objects.create_user(username='first', password='testpass123')
+
+        with self.assertRaises(ValueError):
+            TechTreeService.is_tech_tree_unlocked(user, uuid.uuid4())
+        with self.assertRaises(ValueError):
+            TechTreeService.is_tech_tree_unlocked(user, 'not-a-uuid')
+
+
+class TechTreeLayoutTests(TransactionTestCase):
+    """Tests for the cached tech tree layout and its per-user overlay."""
+
+    def setUp(self):
+        """Set up a root with two children and a user who completed the root."""
+        self.user = User.objects.create_user(username='viewer', password='testpass123')
+        self.basics = TechTree.objects.create(name='Basics', description='Start here')
+        self.drawing = TechTree.objects.create(name='Drawing', description='Lines', level=2)
+        self.music = TechTree.objects.create(name='Music', description='Sound', level=2)
+        self.drawing.parent_nodes.add(self.basics)
+        self.music.parent_nodes.add(self.basics)
+        UserTechTreeProgress.objects.create(
+            user=self.user, tech_tree=self.basics, progress_percentage=100, is_unlocked=True
+        )
+
+    def test_layout_is_cached_per_graph_version(self):
+        """Test the layout is built once and rebuilt after a graph change."""
+        layout = get_tech_tree_layout()
+        names = [[layout['nodes'][i][1] for i in level] for level in layout['levels']]
+        self.assertEqual(names, [['Basics'], ['Drawing', 'Music']])
+        self.assertEqual(layout['positions'], [[0, 0], [1, 0], [1, 1]])
+        self.assertCountEqual(layout['edges'], [[0, 1], [0, 2]])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_tech_tree_layout(), layout)
+
+        painting = TechTree.objects.create(name='Painting', description='Colour', level=3)
+        painting.parent_nodes.add(self.drawing)
+        layout = get_tech_tree_layout()
+        names = [[layout['nodes'][i][1] for i in level] for level in layout['levels']]
+        self.assertEqual(names, [['Basics'], ['Drawing', 'Music'], ['Painting']])
+
+    def test_levels_overlay_user_status(self):
+        """Test the per-user overlay costs a single progress query."""
+        get_tech_tree_layout()
+
+        with self.assertNumQueries(1):
+            levels = TechTreeService.get_tech_tree_by_levels(self.user)
+
+        basics = levels[0]['nodes'][0]
+        drawing = levels[1]['nodes'][0]
+        self.assertTrue(basics['completed'])
+        self.assertEqual(basics['percent_complete'], 100)
+        self.assertFalse(drawing['completed'])
+        self.assertTrue(drawing['available'])
+        self.assertEqual(drawing['prerequisites'], [str(self.basics.id)])
+
+    def test_levels_conditional_get(self):
+        """Test the levels endpoint answers 304 until the user's progress changes."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse('core:tech-tree-levels')
+
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        UserTechTreeProgress.objects.create(user=self.user, tech_tree=self.drawing, progress_percentage=40)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_tech_tree_page_conditional_get(self):
+        """Test the tech tree page answers 304 for an unchanged tree."""
+        self.client.force_login(self.user)
+        url = reverse('core:tech_tree')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_tech_tree_page_not_conditional_with_messages(self):
+        """Test the tech tree page is rendered, not 304, while a message is waiting."""
+        self.client.force_login(self.user)
+        etag = self.client.get(reverse('core:tech_tree'))['ETag']
+
+        request = RequestFactory().get(reverse('core:tech_tree'), HTTP_IF_NONE_MATCH=etag)
+        request.user = self.user
+        SessionMiddleware(lambda request: None).process_request(request)
+        MessageMiddleware(lambda request: None).process_request(request)
+        self.assertEqual(TechTreeView.as_view()(request).status_code, 304)
+
+        messages.info(request, 'Progress saved')
+        response = TechTreeView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
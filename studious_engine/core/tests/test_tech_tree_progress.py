@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Art, ArtMastery, TechTree, UserTechTreeProgress
+from core.services.art.tech_tree_service import TechTreeService
+
+# [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:experience_progression]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the core_user_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+User = get_user_model()
+
+
+class IncrementalTechTreeProgressTests(TestCase):
+    """Tests for mastery-driven incremental tech tree progress."""
+
+    def setUp(self):
+        """Set up a tree requiring two arts and an unrelated tree."""
+        self.user = User.objects.create_user(username='learner', password='testpass123')
+        self.drawing = Art.objects.create(name='Drawing', description='Lines and shapes')
+        self.painting = Art.objects.create(name='Painting', description='Colour and light')
+        self.singing = Art.objects.create(name='Singing', description='Voice')
+        self.visual_arts = TechTree.objects.create(
+            name='Visual Arts',
+            description='Drawing and painting',
+            required_arts=[self.drawing.id, self.painting.id]
+        )
+        self.music = TechTree.objects.create(
+            name='Music',
+            description='Singing',
+            required_arts=[self.singing.id]
+        )
+
+    def test_mastery_change_updates_only_affected_trees(self):
+        """Test a level change touches the trees requiring that art and nothing else."""
+        ArtMastery.objects.create(user=self.user, art=self.drawing, mastery_level=5)
+
+        progress = UserTechTreeProgress.objects.get(user=self.user, tech_tree=self.visual_arts)
+        self.assertEqual(progress.progress['percent_complete'], 50)
+        self.assertTrue(progress.progress['arts'][str(self.drawing.id)]['completed'])
+        self.assertEqual(progress.progress_percentage, 50)
+        self.assertFalse(
+            UserTechTreeProgress.objects.filter(user=self.user, tech_tree=self.music).exists()
+        )
+
+    def test_deltas_accumulate_to_completion(self):
+        """Test successive changes apply deltas until the tree is complete."""
+        drawing = ArtMastery.objects.create(user=self.user, art=self.drawing, mastery_level=5)
+        painting = ArtMastery.objects.create(user=self.user, art=self.painting, mastery_level=1)
+
+        progress = UserTechTreeProgress.objects.get(user=self.user, tech_tree=self.visual_arts)
+        self.assertAlmostEqual(progress.progress['percent_complete'], 60)
+
+        painting.mastery_level = 5
+        painting.save()
+        drawing.notes = 'No level change'
+        drawing.save()
+
+        progress.refresh_from_db()
+        self.assertAlmostEqual(progress.progress['percent_complete'], 100)
+        self.assertEqual(progress.progress_percentage, 100)
+
+    def test_matches_full_rebuild(self):
+        """Test the incremental result equals a full update_progress rebuild."""
+        ArtMastery.objects.create(user=self.user, art=self.drawing, mastery_level=2)
+        ArtMastery.objects.create(user=self.user, art=self.painting, mastery_level=3)
+        incremental = UserTechTreeProgress.objects.get(user=self.user, tech_tree=self.visual_arts)
+
+        rebuilt = TechTreeService.update_progress(self.user, self.visual_arts)
+
+        self.assertAlmostEqual(incremental.progress['percent_complete'], rebuilt.progress['percent_complete'])
+        self.assertEqual(incremental.progress['arts'], rebuilt.progress['arts'])
+        self.assertEqual(incremental.progress_percentage, rebuilt.progress_percentage)
+
+    def test_rows_locked_before_deltas(self):
+        """Test the progress rows are read with FOR UPDATE so concurrent deltas cannot overwrite each other."""
+        ArtMastery.objects.create(user=self.user, art=self.drawing, mastery_level=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            TechTreeService.apply_mastery_changes(self.user, {self.painting.id: 3})
+
+        reads = [query['sql'] for query in queries if 'FROM "core_usertechtreeprogress"' in query['sql']]
+        self.assertTrue(reads)
+        self.assertTrue(all(sql.endswith('FOR UPDATE') for sql in reads))
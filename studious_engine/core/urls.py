@@ -6,7 +6,7 @@ from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 
 from . import views
-from .views.core import toggle_wishlist, view_wishlist, update_player_location, LegacyMapView
+from .views.core import toggle_wishlist, view_wishlist, update_player_location, query_stats, LegacyMapView
 from .api.router import core_router
 from .views.art import (
 
@@ -52,6 +52,7 @@ urlpatterns = [
     path('virtues/', views.VirtuesView.as_view(), name='virtues'),
     path('wishlist/', view_wishlist, name='wishlist'),
     path('wishlist/toggle/', toggle_wishlist, name='toggle_wishlist'),
+    path('debug/query-stats/', query_stats, name='query_stats'),
     
     # Art System URLs
     path('arts/', login_required(ArtPokedexView.as_view()), name='arts_pokedex'),
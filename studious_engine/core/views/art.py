@@ -6,7 +6,12 @@ from django.http import Http404
 from django.core.paginator import Paginator
 from django.utils import timezone
 from datetime import datetime, timedelta
-from django.db.models import Count, Avg, F, Q, Sum
+from django.db.models import Avg, F, Q, Sum
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+import json
 
 from core.models import (
     Art, ArtParts, ArtStage, ArtTaxonomy, 
@@ -14,6 +19,7 @@ from core.models import (
     UserTechTreeProgress, PlayerProfile, PracticeSession
 )
 from core.services.art import ArtService, MasteryService, TechTreeService, PracticeService
+from core.services.profile_cache import get_request_profile
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:virtue_metrics_calculation]
@@ -32,7 +38,7 @@ class ArtPokedexView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
-        profile = PlayerProfile.objects.get(user=user)
+        profile = get_request_profile(self.request, create=True)
         
         # Get all available arts
         all_arts = ArtService.get_available_arts(
@@ -238,16 +244,39 @@ class LogPracticeView(LoginRequiredMixin, View):
         return redirect('core:art_detail', art_id=art_id)
 
 
+def tech_tree_etag(request, *args, **kwargs):
+    """
+    Entity tag for the tech tree page: the user's tech tree state plus their
+    experience points, which determine the level shown on the page.
+
+    No tag is given while messages are waiting, so the page that shows
+    them is rendered rather than answered with 304 Not Modified.
+    """
+    if len(messages.get_messages(request)):
+        return None
+    etag = TechTreeService.get_tech_tree_etag(request.user)
+    if etag is None:
+        return None
+    profile = get_request_profile(request)
+    experience_points = profile.experience_points if profile is not None else None
+    return f'{etag}-{experience_points}'
+
+
 class TechTreeView(LoginRequiredMixin, TemplateView):
     """
     View for displaying the tech tree
     """
     template_name = 'core/arts/tech_tree.html'
 
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=tech_tree_etag))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
-        profile = PlayerProfile.objects.get(user=user)
+        profile = get_request_profile(self.request, create=True)
         
         # Get tech tree levels and nodes
         tech_tree_levels = TechTreeService.get_tech_tree_by_levels(user=user)
@@ -255,14 +284,6 @@ class TechTreeView(LoginRequiredMixin, TemplateView):
         # Get tech tree stats
         tech_tree_stats = TechTreeService.get_tech_tree_stats(user=user)
         
-        # Debug output to console
-        import json
-        from django.core.serializers.json import DjangoJSONEncoder
-        print("Tech Tree Levels JSON:")
-        print(json.dumps(tech_tree_levels, cls=DjangoJSONEncoder, indent=2))
-        print("Tech Tree Stats JSON:")
-        print(json.dumps(tech_tree_stats, cls=DjangoJSONEncoder, indent=2))
-        
         # Convert data to JSON for the template
         tech_tree_levels_json = json.dumps(tech_tree_levels, cls=DjangoJSONEncoder)
         tech_tree_stats_json = json.dumps(tech_tree_stats, cls=DjangoJSONEncoder)
@@ -431,7 +452,7 @@ class ArtMasteryDashboardView(LoginRequiredMixin, TemplateView):
     
     def get_taxonomy_descendants(self, taxonomy, include_self=True):
         """
-        Helper method to get all descendants of a taxonomy node recursively.
+        Helper method to get all descendants of a taxonomy node.
         
         Args:
             taxonomy: The ArtTaxonomy object
@@ -440,11 +461,7 @@ class ArtMasteryDashboardView(LoginRequiredMixin, TemplateView):
         Returns:
             A list of ArtTaxonomy objects
         """
-        result = [taxonomy] if include_self else []
-        children = ArtTaxonomy.objects.filter(parent=taxonomy)
-        for child in children:
-            result.extend(self.get_taxonomy_descendants(child))
-        return result
+        return list(taxonomy.get_descendants(include_self=include_self))
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -466,46 +483,14 @@ class ArtMasteryDashboardView(LoginRequiredMixin, TemplateView):
             completed=False
         ).order_by('started_at')
         
-        # Get practice history
-        practice_history = PracticeSession.objects.filter(
-            user=user,
-            completed=True
-        ).values('started_at__date').annotate(count=Count('id'))
-        
-        # Format practice days for JS consumption
-        practice_days = {}
-        for practice in practice_history:
-            date_str = practice['started_at__date'].strftime('%Y-%m-%d')
-            practice_days[date_str] = practice['count']
+        # Completed practice per day for the calendar, from the daily rollups
+        practice_days = PracticeService.get_practice_days(user, completed_only=True)
         
         # Get mastery categories for radar chart
-        taxonomies = ArtTaxonomy.objects.filter(level=1)  # Top-level categories
-        mastery_categories = []
-        
-        for taxonomy in taxonomies:
-            # Get all taxonomies in this category tree using our helper method
-            taxonomy_descendants = self.get_taxonomy_descendants(taxonomy)
-            
-            # Get all arts in this category that the user has mastery in
-            arts_in_category = Art.objects.filter(
-                taxonomy__in=taxonomy_descendants,
-                masteries__user=user
-            )
-            
-            # Calculate average mastery
-            masteries = ArtMastery.objects.filter(
-                user=user,
-                art__in=arts_in_category
-            )
-            
-            avg_mastery = 0
-            if masteries.exists():
-                avg_mastery = sum(m.mastery_level for m in masteries) / masteries.count()
-            
-            mastery_categories.append({
-                'name': taxonomy.name,
-                'average_mastery': avg_mastery
-            })
+        mastery_categories = [
+            {'name': category['name'], 'average_mastery': category['average_mastery']}
+            for category in context['mastery_summary']['categories']
+        ]
         
         # Get recent practice activities
         recent_activities = []
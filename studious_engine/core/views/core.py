@@ -4,7 +4,8 @@ from django.urls import reverse_lazy
 from django.utils import timezone
 from django.views.generic import TemplateView, UpdateView, DetailView, ListView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse, HttpResponseRedirect, HttpResponseBadRequest
+from django.conf import settings
+from django.http import Http404, JsonResponse, HttpResponseRedirect, HttpResponseBadRequest
 from django.views.decorators.http import require_POST
 from django.contrib import messages
 from django.db.models import Count, Avg, Q, F, Sum
@@ -12,6 +13,9 @@ import json
 
 # Import the real PlayerProfile model and UserService
 from core.models import PlayerProfile, PlayerHappiness, UserPreferences, UserLocation, MarketItem, Wishlist
+from core.query_budget import get_endpoint_stats, reset_endpoint_stats
+from core.services.presence import record_presence
+from core.services.profile_cache import get_request_profile
 from core.services.user_service import UserService
 
 # [REF:00a1b2c3-d4e5-f6a7-b8c9-d0e1f2a3b4c5:CORE_USER_SYSTEM]
@@ -40,7 +44,7 @@ class GameDashboardView(LoginRequiredMixin, TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        player_profile = PlayerProfile.objects.get(user=self.request.user)
+        player_profile = get_request_profile(self.request, create=True)
         
         # Get the happiness metrics
         try:
@@ -153,7 +157,7 @@ class MapView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            player, created = PlayerProfile.objects.get_or_create(user=self.request.user)
+            player = get_request_profile(self.request, create=True)
             
             # In a real implementation, this would use the player's location
             # to find nearby zones, experiences, and other players
@@ -180,7 +184,7 @@ class LegacyMapView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            player, created = PlayerProfile.objects.get_or_create(user=self.request.user)
+            player = get_request_profile(self.request, create=True)
             
             context.update({
                 'player': player,
@@ -203,7 +207,7 @@ class NearbyView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            player, created = PlayerProfile.objects.get_or_create(user=self.request.user)
+            player = get_request_profile(self.request, create=True)
             
             context.update({
                 'player': player,
@@ -231,6 +235,7 @@ def update_player_location(request):
                 player.longitude = float(longitude)
                 player.last_location_update = timezone.now()
                 player.save()
+                record_presence(request.user.pk, player.latitude, player.longitude)
                 
                 # Here you would also check for nearby game elements
                 # and return them in the response
@@ -259,7 +264,7 @@ class StoreView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            player, created = PlayerProfile.objects.get_or_create(user=self.request.user)
+            player = get_request_profile(self.request, create=True)
             
             # Get all market items
             all_items = MarketItem.objects.all()
@@ -554,7 +559,7 @@ class ZoneView(LoginRequiredMixin, TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        player_profile = PlayerProfile.objects.get(user=self.request.user)
+        player_profile = get_request_profile(self.request, create=True)
         
         # This is a placeholder until full Zone models are implemented
         # In a real implementation, we would get the current zone from the player's location
@@ -592,7 +597,7 @@ class VirtuesView(LoginRequiredMixin, TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        player_profile = PlayerProfile.objects.get(user=self.request.user)
+        player_profile = get_request_profile(self.request, create=True)
         
         # Mock data for happiness and subcategories
         happiness_score = 78
@@ -763,6 +768,16 @@ class MarketItemDetailView(LoginRequiredMixin, DetailView):
         return context
 
 
+def query_stats(request):
+    """Local-only JSON view of the per-endpoint query stats gathered by this process."""
+    if not settings.DEBUG or request.META.get('REMOTE_ADDR') not in settings.INTERNAL_IPS:
+        raise Http404
+    stats = get_endpoint_stats()
+    if request.GET.get('reset'):
+        reset_endpoint_stats()
+    return JsonResponse(stats)
+
+
 class PublicStoreView(TemplateView):
     """Public version of the Store page for non-logged-in users."""
     template_name = 'core/store.html'
@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class EconomicConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'economic'
+    verbose_name = 'Economic System'
+
+    def ready(self):
+        import economic.signals  # noqa F401
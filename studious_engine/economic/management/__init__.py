@@ -0,0 +1,5 @@
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from economic.models import Ledger
+from economic.services.audit import LEDGER_CHECKPOINT_INTERVAL, AuditService
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:economic_transaction_patterns]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+class Command(BaseCommand):
+    help = 'Verifies transaction ledger hash chains from their last checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ledger', action='append', help='Only verify the ledger with this name (repeatable)')
+        parser.add_argument('--full', action='store_true', help='Verify from the start, re-checking checkpoints')
+        parser.add_argument('--no-checkpoint', action='store_true', help='Do not record new checkpoints')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows to fetch from the cursor at a time')
+        parser.add_argument('--checkpoint-interval', type=int, default=LEDGER_CHECKPOINT_INTERVAL,
+                            help='Transactions covered by each new checkpoint')
+
+    def handle(self, *args, **options):
+        ledgers = Ledger.objects.order_by('name')
+        if options['ledger']:
+            ledgers = ledgers.filter(name__in=options['ledger'])
+            missing = set(options['ledger']) - set(ledgers.values_list('name', flat=True))
+            if missing:
+                raise CommandError(f"Ledgers {', '.join(sorted(missing))} do not exist")
+
+        failed = []
+        for ledger in ledgers:
+            result = AuditService.verify_ledger(
+                ledger,
+                full=options['full'],
+                checkpoint=not options['no_checkpoint'],
+                batch_size=options['batch_size'],
+                checkpoint_interval=options['checkpoint_interval'],
+            )
+            if result['error_count']:
+                failed.append(ledger.name)
+                self.stdout.write(self.style.ERROR(
+                    f"{ledger.name}: {result['error_count']} problems in {result['verified']} transactions "
+                    f"from {result['start']}"
+                ))
+                for error in result['errors']:
+                    self.stdout.write(f'  {error}')
+            else:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{ledger.name}: verified {result['verified']} transactions from {result['start']}, "
+                    f"wrote {result['checkpoints']} checkpoints"
+                ))
+
+        if failed:
+            raise CommandError(f"Verification failed for {', '.join(failed)}")
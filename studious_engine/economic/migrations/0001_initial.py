@@ -0,0 +1,223 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:37
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0013_playerprofile_last_active_heartbeat'),
+        ('zones', '0003_remove_zonehappiness_friendships_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WealthClass',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('level', models.IntegerField(choices=[(1, 'Subsistence'), (2, 'Working Class'), (3, 'Middle Class'), (4, 'Upper Middle Class'), (5, 'Affluent'), (6, 'Wealthy'), (7, 'Elite')])),
+                ('wealth_threshold', models.IntegerField(help_text='Minimum wealth required to be in this class', validators=[django.core.validators.MinValueValidator(0)])),
+                ('asset_requirements', models.JSONField(blank=True, default=dict, help_text='Resources required to qualify for this class')),
+                ('resource_access', models.JSONField(blank=True, default=list, help_text='List of resource codes accessible to this class')),
+                ('zone_access', models.JSONField(blank=True, default=list, help_text='List of zone IDs accessible to this class')),
+                ('influence_multiplier', models.FloatField(default=1.0, validators=[django.core.validators.MinValueValidator(0.1)])),
+                ('tax_rate', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('icon', models.CharField(blank=True, max_length=255)),
+                ('color_code', models.CharField(default='#FFFFFF', max_length=7)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Wealth Classes',
+                'ordering': ['level'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Project',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('project_type', models.CharField(choices=[('resource_generation', 'Resource Generation'), ('infrastructure', 'Infrastructure'), ('research', 'Research and Development'), ('education', 'Education'), ('conservation', 'Conservation'), ('community', 'Community Development'), ('market', 'Market Development')], max_length=20)),
+                ('goals', models.JSONField(blank=True, default=list)),
+                ('status', models.CharField(choices=[('proposed', 'Proposed'), ('planning', 'Planning Phase'), ('fundraising', 'Fundraising'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], default='proposed', max_length=15)),
+                ('progress', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('resource_requirements', models.JSONField(blank=True, default=dict, help_text='Dictionary of resource_code: quantity pairs needed')),
+                ('current_resources', models.JSONField(blank=True, default=dict, help_text='Dictionary of resource_code: quantity pairs committed')),
+                ('resource_outputs', models.JSONField(blank=True, default=dict, help_text='Dictionary of resource_code: quantity pairs produced')),
+                ('min_participants', models.IntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ('max_participants', models.IntegerField(default=10, validators=[django.core.validators.MinValueValidator(1)])),
+                ('total_budget', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('current_funding', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('roi_estimate', models.FloatField(default=1.0, help_text='Estimated return on investment multiplier', validators=[django.core.validators.MinValueValidator(0.0)])),
+                ('proposed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('target_completion', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('initiator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='initiated_projects', to='core.playerprofile')),
+                ('zone', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='projects', to='zones.zone')),
+            ],
+            options={
+                'verbose_name_plural': 'Projects',
+                'ordering': ['-proposed_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectParticipation',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('role', models.CharField(choices=[('investor', 'Investor'), ('worker', 'Worker'), ('manager', 'Manager'), ('consultant', 'Consultant'), ('stakeholder', 'Stakeholder')], default='worker', max_length=15)),
+                ('is_active', models.BooleanField(default=True)),
+                ('joined_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('left_at', models.DateTimeField(blank=True, null=True)),
+                ('resource_contributions', models.JSONField(blank=True, default=dict)),
+                ('funding_contribution', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('work_contribution', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('resource_rewards', models.JSONField(blank=True, default=dict)),
+                ('currency_reward', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('ownership_percentage', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(100.0)])),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_participations', to='core.playerprofile')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_participations', to='economic.project')),
+            ],
+            options={
+                'verbose_name_plural': 'Project Participations',
+                'unique_together': {('project', 'player')},
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='participants',
+            field=models.ManyToManyField(blank=True, related_name='projects', through='economic.ProjectParticipation', to='core.playerprofile'),
+        ),
+        migrations.CreateModel(
+            name='Resource',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('code', models.SlugField(help_text='Unique code for this resource', unique=True)),
+                ('description', models.TextField()),
+                ('resource_type', models.CharField(choices=[('material', 'Material Resource'), ('currency', 'Currency'), ('knowledge', 'Knowledge Asset'), ('social', 'Social Capital'), ('service', 'Service'), ('energy', 'Energy'), ('time', 'Time')], max_length=20)),
+                ('rarity', models.IntegerField(choices=[(1, 'Common'), (2, 'Uncommon'), (3, 'Rare'), (4, 'Epic'), (5, 'Legendary')], default=1)),
+                ('origin_type', models.CharField(choices=[('natural', 'Natural'), ('manufactured', 'Manufactured'), ('intellectual', 'Intellectual'), ('digital', 'Digital'), ('social', 'Social')], max_length=15)),
+                ('tags', models.JSONField(blank=True, default=list)),
+                ('base_value', models.IntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ('current_market_value', models.IntegerField(default=1, validators=[django.core.validators.MinValueValidator(0)])),
+                ('is_tradable', models.BooleanField(default=True)),
+                ('is_depleting', models.BooleanField(default=False, help_text='Whether this resource depletes with use')),
+                ('is_renewable', models.BooleanField(default=False, help_text='Whether this resource regenerates over time')),
+                ('regeneration_rate', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0)])),
+                ('icon', models.CharField(blank=True, help_text='Path or reference to resource icon', max_length=255)),
+                ('image', models.CharField(blank=True, help_text='Path or reference to resource image', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('dependent_resources', models.ManyToManyField(blank=True, related_name='required_for', to='economic.resource')),
+                ('related_sector', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='related_resources', to='zones.sector')),
+            ],
+            options={
+                'verbose_name_plural': 'Resources',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CommonResource',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('current_amount', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('max_capacity', models.IntegerField(validators=[django.core.validators.MinValueValidator(1)])),
+                ('location_description', models.CharField(blank=True, max_length=255)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('access_level', models.IntegerField(choices=[(1, 'Open Access'), (2, 'Common-Pool'), (3, 'Member Access'), (4, 'Restricted'), (5, 'Highly Restricted')], default=2)),
+                ('governance_type', models.CharField(choices=[('democratic', 'Democratic'), ('hierarchical', 'Hierarchical'), ('meritocratic', 'Meritocratic'), ('rotational', 'Rotational'), ('autonomous', 'Autonomous')], max_length=15)),
+                ('administrators', models.JSONField(blank=True, default=list, help_text='List of entity IDs that administer this resource')),
+                ('sustainable_extraction_rate', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0)])),
+                ('current_extraction_rate', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0)])),
+                ('is_renewable', models.BooleanField(default=True)),
+                ('regeneration_rate', models.FloatField(default=0.0, validators=[django.core.validators.MinValueValidator(0.0)])),
+                ('health_level', models.IntegerField(default=100, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('crisis_threshold', models.IntegerField(default=25, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('zone', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='common_resources', to='zones.zone')),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='common_resources', to='economic.resource')),
+            ],
+            options={
+                'verbose_name_plural': 'Common Resources',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResourceInventory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('object_id', models.UUIDField()),
+                ('resources', models.JSONField(default=dict, help_text='Dictionary of resource_code: quantity pairs')),
+                ('max_capacity', models.IntegerField(default=100, validators=[django.core.validators.MinValueValidator(1)])),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('last_transaction_id', models.UUIDField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name_plural': 'Resource Inventories',
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='EconomicTransaction',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('transaction_type', models.CharField(choices=[('transfer', 'Resource Transfer'), ('purchase', 'Purchase'), ('sale', 'Sale'), ('production', 'Resource Production'), ('consumption', 'Resource Consumption'), ('taxation', 'Taxation'), ('reward', 'Reward'), ('penalty', 'Penalty'), ('investment', 'Investment'), ('dividend', 'Dividend')], max_length=15)),
+                ('resources', models.JSONField(help_text='Dictionary of resource_code: quantity pairs')),
+                ('value', models.IntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed'), ('cancelled', 'Cancelled'), ('disputed', 'Disputed')], default='pending', max_length=15)),
+                ('source_object_id', models.UUIDField()),
+                ('destination_object_id', models.UUIDField()),
+                ('context_object_id', models.UUIDField(blank=True, null=True)),
+                ('context_description', models.CharField(blank=True, max_length=255)),
+                ('facilitated_by_object_id', models.UUIDField(blank=True, null=True)),
+                ('tax_amount', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('tax_recipient_object_id', models.UUIDField(blank=True, null=True)),
+                ('initiated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('transaction_hash', models.CharField(blank=True, help_text='Hash for transaction verification', max_length=64)),
+                ('notes', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('context_content_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='context_transactions', to='contenttypes.contenttype')),
+                ('destination_content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='destination_transactions', to='contenttypes.contenttype')),
+                ('facilitated_by_content_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='facilitated_transactions', to='contenttypes.contenttype')),
+                ('related_transaction', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='child_transactions', to='economic.economictransaction')),
+                ('source_content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='source_transactions', to='contenttypes.contenttype')),
+                ('tax_recipient_content_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tax_recipient_transactions', to='contenttypes.contenttype')),
+                ('destination_inventory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='incoming_transactions', to='economic.resourceinventory')),
+                ('source_inventory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='outgoing_transactions', to='economic.resourceinventory')),
+            ],
+            options={
+                'verbose_name_plural': 'Economic Transactions',
+                'ordering': ['-initiated_at'],
+                'indexes': [models.Index(fields=['source_content_type', 'source_object_id'], name='economic_ec_source__71b9f3_idx'), models.Index(fields=['destination_content_type', 'destination_object_id'], name='economic_ec_destina_273671_idx'), models.Index(fields=['transaction_type'], name='economic_ec_transac_0bc587_idx'), models.Index(fields=['status'], name='economic_ec_status_95cf56_idx'), models.Index(fields=['initiated_at'], name='economic_ec_initiat_404285_idx')],
+            },
+        ),
+    ]
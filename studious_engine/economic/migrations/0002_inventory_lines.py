@@ -0,0 +1,72 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def move_resources_to_lines(apps, schema_editor):
+    """Copy ResourceInventory.resources entries into InventoryLine rows and totals."""
+    ResourceInventory = apps.get_model('economic', 'ResourceInventory')
+    InventoryLine = apps.get_model('economic', 'InventoryLine')
+
+    lines = []
+    for inventory in ResourceInventory.objects.only('id', 'resources').iterator(chunk_size=BATCH_SIZE):
+        held = {code: int(quantity) for code, quantity in (inventory.resources or {}).items() if int(quantity) > 0}
+        lines.extend(
+            InventoryLine(inventory_id=inventory.id, resource_code=code, quantity=quantity)
+            for code, quantity in held.items()
+        )
+        ResourceInventory.objects.filter(pk=inventory.pk).update(total_quantity=sum(held.values()))
+        if len(lines) >= BATCH_SIZE:
+            InventoryLine.objects.bulk_create(lines)
+            lines = []
+    InventoryLine.objects.bulk_create(lines)
+
+
+def move_lines_to_resources(apps, schema_editor):
+    """Fold InventoryLine rows back into ResourceInventory.resources."""
+    ResourceInventory = apps.get_model('economic', 'ResourceInventory')
+    InventoryLine = apps.get_model('economic', 'InventoryLine')
+
+    resources = {}
+    for inventory_id, code, quantity in InventoryLine.objects.values_list(
+        'inventory_id', 'resource_code', 'quantity'
+    ).iterator(chunk_size=BATCH_SIZE):
+        resources.setdefault(inventory_id, {})[code] = quantity
+    for inventory_id, held in resources.items():
+        ResourceInventory.objects.filter(pk=inventory_id).update(resources=held)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceinventory',
+            name='total_quantity',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='InventoryLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource_code', models.SlugField(db_index=False)),
+                ('quantity', models.PositiveIntegerField()),
+                ('inventory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='economic.resourceinventory')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['resource_code', 'quantity'], name='economic_in_resourc_3ca275_idx')],
+                'unique_together': {('inventory', 'resource_code')},
+            },
+        ),
+        migrations.RunPython(move_resources_to_lines, move_lines_to_resources),
+        migrations.RemoveField(
+            model_name='resourceinventory',
+            name='resources',
+        ),
+    ]
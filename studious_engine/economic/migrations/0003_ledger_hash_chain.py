@@ -0,0 +1,68 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('economic', '0002_inventory_lines'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ledger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.SlugField(unique=True)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('last_hash', models.CharField(blank=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LedgerCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_sequence', models.PositiveBigIntegerField()),
+                ('last_sequence', models.PositiveBigIntegerField()),
+                ('last_hash', models.CharField(help_text='Hash of the transaction at last_sequence', max_length=64)),
+                ('merkle_root', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['ledger', 'last_sequence'],
+            },
+        ),
+        migrations.AddField(
+            model_name='economictransaction',
+            name='ledger',
+            field=models.SlugField(db_index=False, default='main', help_text='Name of the ledger this transaction is chained into'),
+        ),
+        migrations.AddField(
+            model_name='economictransaction',
+            name='ledger_sequence',
+            field=models.PositiveBigIntegerField(blank=True, help_text="Position in the ledger's hash chain", null=True),
+        ),
+        migrations.AddField(
+            model_name='economictransaction',
+            name='prev_hash',
+            field=models.CharField(blank=True, help_text='Hash of the previous transaction in the ledger', max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='economictransaction',
+            constraint=models.UniqueConstraint(fields=('ledger', 'ledger_sequence'), name='economic_ledger_sequence_unique'),
+        ),
+        migrations.AddField(
+            model_name='ledgercheckpoint',
+            name='ledger',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='checkpoints', to='economic.ledger'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='ledgercheckpoint',
+            unique_together={('ledger', 'last_sequence')},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.12 on 2026-10-17 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic', '0003_ledger_hash_chain'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='economictransaction',
+            name='ledger',
+            field=models.SlugField(blank=True, db_index=False, default='', help_text="Name of the ledger this transaction is chained into; blank for its source inventory's ledger"),
+        ),
+    ]
@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
+import hashlib
+import json
 import uuid
+from datetime import timezone as dt_timezone
 from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericForeignKey
 
@@ -108,6 +111,9 @@ class Resource(models.Model):
 class ResourceInventory(models.Model):
     """
     Tracks resource ownership for players, zones, or other entities.
+    
+    Quantities are stored one row per resource in InventoryLine, with their
+    sum kept in total_quantity so capacity checks need no aggregation.
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     
@@ -115,8 +121,8 @@ class ResourceInventory(models.Model):
     content_type = models.ForeignKey('contenttypes.ContentType', on_delete=models.CASCADE)
     object_id = models.UUIDField()
     
-    # Resources
-    resources = models.JSONField(default=dict, help_text="Dictionary of resource_code: quantity pairs")
+    # Running total of the quantities in this inventory's lines
+    total_quantity = models.PositiveIntegerField(default=0)
     
     # Maximum capacity
     max_capacity = models.IntegerField(default=100, validators=[MinValueValidator(1)])
@@ -129,6 +135,10 @@ class ResourceInventory(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
     
+    # Loaded resource_code: quantity pairs, and the lines they were loaded from
+    _resources = None
+    _stored_resources = None
+    
     class Meta:
         verbose_name_plural = "Resource Inventories"
         unique_together = ['content_type', 'object_id']
@@ -136,10 +146,75 @@ class ResourceInventory(models.Model):
     def __str__(self):
         return f"Inventory for {self.content_type.model} ({self.object_id})"
     
+    @property
+    def resources(self):
+        """
+        Dictionary of resource_code: quantity pairs, loaded from the
+        inventory's lines on first use (or from prefetched lines).
+        
+        Assigning or editing it in place is written back to the lines by save().
+        """
+        if self._resources is None:
+            self._load_resources()
+        return self._resources
+    
+    @resources.setter
+    def resources(self, value):
+        if self._resources is None and self._state.adding:
+            self._stored_resources = {}
+        elif self._stored_resources is None:
+            # Load what is stored so save() knows which lines to replace
+            self._load_resources()
+        self._resources = {code: quantity for code, quantity in dict(value).items() if quantity}
+        self.total_quantity = sum(self._resources.values())
+    
+    def _load_resources(self):
+        """Load the resources from the inventory's lines, or prefetched lines."""
+        lines = self.lines.all() if self.pk and not self._state.adding else []
+        self._resources = {line.resource_code: line.quantity for line in lines}
+        self._stored_resources = dict(self._resources)
+    
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._resources = self._stored_resources = None
+    
+    def save(self, *args, **kwargs):
+        changed = self._resources is not None and self._resources != self._stored_resources
+        if changed:
+            self.total_quantity = sum(self._resources.values())
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'total_quantity'}
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if changed:
+                self._save_lines()
+    
+    def _save_lines(self):
+        """Write the loaded resources to the inventory's lines."""
+        stored = self._stored_resources or {}
+        removed = [code for code in stored if code not in self._resources]
+        if removed:
+            self.lines.filter(resource_code__in=removed).delete()
+        kept = [
+            InventoryLine(inventory=self, resource_code=code, quantity=quantity)
+            for code, quantity in self._resources.items()
+            if stored.get(code) != quantity
+        ]
+        if kept:
+            InventoryLine.objects.bulk_create(
+                kept,
+                update_conflicts=True,
+                unique_fields=['inventory', 'resource_code'],
+                update_fields=['quantity'],
+            )
+        self._stored_resources = dict(self._resources)
+    
     @property
     def total_resources(self):
         """Return the total number of resources in the inventory."""
-        return sum(self.resources.values())
+        return self.total_quantity
     
     @property
     def capacity_used_percentage(self):
@@ -150,50 +225,65 @@ class ResourceInventory(models.Model):
     
     def has_resource(self, resource_code, quantity=1):
         """Check if the inventory has sufficient quantity of a resource."""
-        return self.resources.get(resource_code, 0) >= quantity
+        if self._resources is None:
+            return self.lines.filter(resource_code=resource_code, quantity__gte=quantity).exists()
+        return self._resources.get(resource_code, 0) >= quantity
     
     def add_resource(self, resource_code, quantity):
         """Add a resource to the inventory."""
         if quantity <= 0:
             return False
-            
-        current_total = self.total_resources
-        if current_total + quantity > self.max_capacity:
-            return False
-            
-        current_amount = self.resources.get(resource_code, 0)
-        self.resources[resource_code] = current_amount + quantity
-        self.save()
-        return True
+        return self._apply_change(resource_code, quantity)
     
     def remove_resource(self, resource_code, quantity):
         """Remove a resource from the inventory."""
         if quantity <= 0:
             return False
-            
-        current_amount = self.resources.get(resource_code, 0)
-        if current_amount < quantity:
+        return self._apply_change(resource_code, -quantity)
+    
+    def transfer_resource(self, destination_inventory, resource_code, quantity):
+        """Transfer a resource to another inventory, recording the transaction."""
+        from economic.services.ledger import LedgerError, LedgerService
+        
+        if quantity <= 0:
             return False
-            
-        self.resources[resource_code] = current_amount - quantity
+        try:
+            LedgerService.transfer(self, destination_inventory, {resource_code: quantity})
+        except LedgerError:
+            return False
+        return True
+    
+    def _apply_change(self, resource_code, delta):
+        """Apply a quantity change under a row lock, keeping this instance in step."""
+        from economic.services.ledger import LedgerError, LedgerService
         
-        # Clean up empty entries
-        if self.resources[resource_code] == 0:
-            del self.resources[resource_code]
-            
-        self.save()
+        try:
+            with transaction.atomic():
+                locked = LedgerService.apply_changes({self.pk: {resource_code: delta}})[self.pk]
+        except LedgerError:
+            return False
+        LedgerService.sync_inventory(self, locked, {resource_code: delta})
         return True
+
+
+class InventoryLine(models.Model):
+    """
+    The quantity of one resource held in an inventory.
     
-    def transfer_resource(self, destination_inventory, resource_code, quantity):
-        """Transfer a resource to another inventory."""
-        if self.remove_resource(resource_code, quantity):
-            if destination_inventory.add_resource(resource_code, quantity):
-                return True
-            else:
-                # Rollback if destination couldn't accept
-                self.add_resource(resource_code, quantity)
-                return False
-        return False
+    Lines with no quantity left are deleted, so every row is a holding.
+    """
+    inventory = models.ForeignKey(ResourceInventory, on_delete=models.CASCADE, related_name="lines")
+    resource_code = models.SlugField(max_length=50, db_index=False)
+    quantity = models.PositiveIntegerField()
+    
+    class Meta:
+        unique_together = ['inventory', 'resource_code']
+        indexes = [
+            models.Index(fields=['resource_code', 'quantity']),
+        ]
+    
+    def __str__(self):
+        return f"{self.quantity} {self.resource_code} in {self.inventory_id}"
 
 
 class EconomicTransaction(models.Model):
@@ -279,6 +369,15 @@ class EconomicTransaction(models.Model):
     
     # System tracking
     transaction_hash = models.CharField(max_length=64, blank=True, help_text="Hash for transaction verification")
+    
+    # Hash chain, assigned when the transaction is completed by the ledger
+    ledger = models.SlugField(max_length=50, blank=True, default='', db_index=False,
+                              help_text="Name of the ledger this transaction is chained into; "
+                                        "blank for its source inventory's ledger")
+    ledger_sequence = models.PositiveBigIntegerField(null=True, blank=True,
+                                                    help_text="Position in the ledger's hash chain")
+    prev_hash = models.CharField(max_length=64, blank=True,
+                                 help_text="Hash of the previous transaction in the ledger")
     related_transaction = models.ForeignKey('self', on_delete=models.SET_NULL, 
                                          null=True, blank=True, related_name="child_transactions")
     
@@ -299,50 +398,115 @@ class EconomicTransaction(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['initiated_at']),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=['ledger', 'ledger_sequence'], name='economic_ledger_sequence_unique'),
+        ]
+    
+    # Fields covered by the transaction hash, in addition to prev_hash
+    HASHED_FIELDS = (
+        'id', 'ledger', 'ledger_sequence', 'transaction_type', 'resources', 'value', 'status', 'tax_amount',
+        'source_content_type_id', 'source_object_id', 'destination_content_type_id', 'destination_object_id',
+        'source_inventory_id', 'destination_inventory_id', 'completed_at',
+    )
     
     def __str__(self):
         return f"Transaction {self.id}: {self.get_transaction_type_display()} ({self.get_status_display()})"
     
-    def mark_processing(self):
+    def mark_processing(self, save=True):
         """Mark the transaction as processing."""
         if self.status == 'pending':
             self.status = 'processing'
             self.processed_at = timezone.now()
-            self.save()
+            if save:
+                self.save(update_fields=['status', 'processed_at', 'updated_at'])
             return True
         return False
     
-    def mark_completed(self):
+    def mark_completed(self, save=True):
         """Mark the transaction as completed."""
         if self.status in ['pending', 'processing']:
             self.status = 'completed'
             self.completed_at = timezone.now()
-            self.save()
+            if save:
+                self.save(update_fields=['status', 'completed_at', 'updated_at'])
             return True
         return False
     
-    def mark_failed(self, reason=None):
+    def mark_failed(self, reason=None, save=True):
         """Mark the transaction as failed."""
         if self.status in ['pending', 'processing']:
             self.status = 'failed'
             if reason:
                 self.notes += f"\nFailure reason: {reason}"
-            self.save()
+            if save:
+                self.save(update_fields=['status', 'notes', 'updated_at'])
             return True
         return False
     
-    def generate_hash(self):
-        """Generate a transaction hash for verification."""
-        import hashlib
-        
-        # Create a string with transaction details
-        data = f"{self.id}{self.transaction_type}{self.value}{self.source_object_id}{self.destination_object_id}{self.initiated_at}"
-        data += str(self.resources)
+    def canonical_payload(self):
+        """
+        Encode the hashed fields as sorted, compact JSON.
         
-        # Generate hash
-        hash_obj = hashlib.sha256(data.encode())
-        self.transaction_hash = hash_obj.hexdigest()
-        self.save()
+        The encoding only depends on the field values, never on dict
+        ordering, so the same transaction always hashes the same.
+        """
+        payload = {name: getattr(self, name) for name in self.HASHED_FIELDS}
+        payload['prev_hash'] = self.prev_hash
+        if payload['completed_at'] is not None:
+            payload['completed_at'] = payload['completed_at'].astimezone(dt_timezone.utc).isoformat()
+        return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str).encode()
+    
+    def compute_hash(self):
+        """Return the SHA-256 hash of the canonical payload."""
+        return hashlib.sha256(self.canonical_payload()).hexdigest()
+    
+    def generate_hash(self, save=True):
+        """Generate a transaction hash for verification."""
+        self.transaction_hash = self.compute_hash()
+        if save:
+            self.save(update_fields=['transaction_hash', 'updated_at'])
+
+
+class Ledger(models.Model):
+    """
+    The head of a hash chain of completed transactions.
+    
+    Each completed transaction records the hash of the one before it in
+    its ledger; the head row is locked while transactions are appended.
+    Unless a transaction names a ledger, it is chained into the ledger of
+    the inventory it takes resources from, so transfers between unrelated
+    inventories never wait on the same head.
+    """
+    name = models.SlugField(max_length=50, unique=True)
+    last_sequence = models.PositiveBigIntegerField(default=0)
+    last_hash = models.CharField(max_length=64, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Ledger {self.name} at {self.last_sequence}"
+
+
+class LedgerCheckpoint(models.Model):
+    """
+    A verified stretch of a ledger, summarised by the Merkle root of its
+    transaction hashes so later audits can start after it.
+    """
+    ledger = models.ForeignKey(Ledger, on_delete=models.CASCADE, related_name="checkpoints")
+    first_sequence = models.PositiveBigIntegerField()
+    last_sequence = models.PositiveBigIntegerField()
+    last_hash = models.CharField(max_length=64, help_text="Hash of the transaction at last_sequence")
+    merkle_root = models.CharField(max_length=64)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['ledger', 'last_sequence']
+        unique_together = ['ledger', 'last_sequence']
+    
+    def __str__(self):
+        return f"Checkpoint of {self.ledger.name} at {self.last_sequence}"
 
 
 class WealthClass(models.Model):
@@ -402,35 +566,13 @@ class WealthClass(models.Model):
         """
         Determine the wealth class for a given wealth value and assets.
         Returns the highest matching WealthClass instance.
+        
+        Uses the cached classifier; see economic.services.wealth for
+        classifying many values at once.
         """
-        if assets is None:
-            assets = {}
-            
-        # Get all active wealth classes, ordered by level descending (highest first)
-        wealth_classes = cls.objects.filter(is_active=True).order_by('-level')
+        from economic.services.wealth import get_wealth_classifier
         
-        for wealth_class in wealth_classes:
-            # Check if wealth value meets threshold
-            if wealth_value < wealth_class.wealth_threshold:
-                continue
-                
-            # Check asset requirements if any
-            if wealth_class.asset_requirements:
-                meets_asset_requirements = True
-                
-                for resource_code, required_amount in wealth_class.asset_requirements.items():
-                    if assets.get(resource_code, 0) < required_amount:
-                        meets_asset_requirements = False
-                        break
-                        
-                if not meets_asset_requirements:
-                    continue
-                    
-            # If we reach here, all requirements are met
-            return wealth_class
-            
-        # If no matching class, return the lowest level class
-        return cls.objects.filter(is_active=True).order_by('level').first()
+        return get_wealth_classifier().classify(wealth_value, assets)
 
 
 class CommonResource(models.Model):
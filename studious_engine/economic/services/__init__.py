@@ -0,0 +1,23 @@
+# Economic services package
+from .audit import AuditService, merkle_root
+from .ledger import CapacityExceeded, InsufficientResources, LedgerError, LedgerService
+from .settlement import SettlementService
+from .wealth import WealthClassifier, get_wealth_classifier
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+__all__ = [
+    'LedgerService',
+    'LedgerError',
+    'InsufficientResources',
+    'CapacityExceeded',
+    'SettlementService',
+    'AuditService',
+    'merkle_root',
+    'WealthClassifier',
+    'get_wealth_classifier',
+]
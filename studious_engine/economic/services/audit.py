@@ -0,0 +1,182 @@
+import hashlib
+
+from economic.models import EconomicTransaction, Ledger, LedgerCheckpoint
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:economic_transaction_patterns]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+# Transactions covered by each checkpoint written during verification
+LEDGER_CHECKPOINT_INTERVAL = 10000
+
+# Stop reporting (but keep counting) problems past this many per ledger
+MAX_REPORTED_ERRORS = 20
+
+
+class MerkleAccumulator:
+    """
+    Builds a Merkle root from a stream of hex hashes in O(log n) memory.
+
+    Complete subtrees are kept on a stack and merged as soon as two of the
+    same height meet; at the end the remaining subtrees are folded from
+    the right, so an odd subtree is promoted rather than duplicated.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self.count = 0
+
+    @staticmethod
+    def _combine(left, right):
+        return hashlib.sha256(bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+    def add(self, leaf_hash):
+        height = 0
+        node = leaf_hash
+        while self._stack and self._stack[-1][0] == height:
+            node = self._combine(self._stack.pop()[1], node)
+            height += 1
+        self._stack.append((height, node))
+        self.count += 1
+
+    def root(self):
+        if not self._stack:
+            return ''
+        node = self._stack[-1][1]
+        for _height, left in reversed(self._stack[:-1]):
+            node = self._combine(left, node)
+        return node
+
+
+def merkle_root(hashes):
+    """
+    Get the Merkle root of a sequence of hex hashes.
+
+    Args:
+        hashes: Iterable of hex SHA-256 hashes, in ledger order
+
+    Returns:
+        str: The hex root, or '' when there are none
+    """
+    accumulator = MerkleAccumulator()
+    for leaf_hash in hashes:
+        accumulator.add(leaf_hash)
+    return accumulator.root()
+
+
+class AuditService:
+    """Verifies ledger hash chains and records Merkle checkpoints."""
+
+    @staticmethod
+    def verify_ledger(ledger, full=False, checkpoint=True, batch_size=2000,
+                      checkpoint_interval=LEDGER_CHECKPOINT_INTERVAL):
+        """
+        Verify a ledger's hash chain.
+
+        Verification starts after the last checkpoint unless full is set, in
+        which case the whole chain is re-hashed and each checkpoint's Merkle
+        root is checked as well. Rows are streamed with a server-side
+        cursor, so memory use does not grow with the ledger.
+
+        Args:
+            ledger: The Ledger, or its name
+            full: Whether to verify from the start of the chain
+            checkpoint: Whether to record checkpoints for what verifies
+            batch_size: Rows fetched from the cursor at a time
+            checkpoint_interval: Transactions covered by each new checkpoint
+
+        Returns:
+            Dict: 'ledger' - the name, 'start' - the first sequence checked,
+                'verified' - transactions checked, 'errors' - reported
+                problems, 'error_count' - all problems,
+                'checkpoints' - checkpoints written
+        """
+        if not isinstance(ledger, Ledger):
+            try:
+                ledger = Ledger.objects.get(name=ledger)
+            except Ledger.DoesNotExist:
+                raise ValueError(f"Ledger {ledger} does not exist") from None
+
+        checkpoints = list(ledger.checkpoints.order_by('last_sequence')) if full else []
+        last_checkpoint = None if full else ledger.checkpoints.order_by('-last_sequence').first()
+
+        sequence = last_checkpoint.last_sequence if last_checkpoint else 0
+        previous_hash = last_checkpoint.last_hash if last_checkpoint else ''
+        errors = []
+        error_count = 0
+
+        def report(message):
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(message)
+
+        rows = EconomicTransaction.objects.filter(
+            ledger=ledger.name, ledger_sequence__gt=sequence, ledger_sequence__lte=ledger.last_sequence
+        ).only(
+            *EconomicTransaction.HASHED_FIELDS, 'prev_hash', 'transaction_hash'
+        ).order_by('ledger_sequence').iterator(chunk_size=batch_size)
+
+        start = sequence + 1
+        segment = MerkleAccumulator()
+        segment_start = start
+        pending_checkpoints = []
+        verified = 0
+
+        for row in rows:
+            sequence += 1
+            if row.ledger_sequence != sequence:
+                report(f"Sequence {sequence} is missing (next is {row.ledger_sequence})")
+                sequence = row.ledger_sequence
+            if row.prev_hash != previous_hash:
+                report(f"Transaction {row.pk} at {sequence} does not follow the previous hash")
+            if row.compute_hash() != row.transaction_hash:
+                report(f"Transaction {row.pk} at {sequence} does not match its hash")
+            # Carry on from the stored hash so one bad row is reported once
+            previous_hash = row.transaction_hash
+            segment.add(row.transaction_hash)
+            verified += 1
+
+            if checkpoints and checkpoints[0].last_sequence == sequence:
+                recorded = checkpoints.pop(0)
+                if recorded.first_sequence != segment_start or recorded.merkle_root != segment.root():
+                    report(f"Checkpoint at {sequence} does not match the transactions it covers")
+                segment, segment_start = MerkleAccumulator(), sequence + 1
+            elif not checkpoints and segment.count >= checkpoint_interval:
+                pending_checkpoints.append((segment_start, sequence, previous_hash, segment.root()))
+                segment, segment_start = MerkleAccumulator(), sequence + 1
+
+        if sequence != ledger.last_sequence or previous_hash != ledger.last_hash:
+            report(f"Chain ends at {sequence} but the ledger head is at {ledger.last_sequence}")
+        for recorded in checkpoints:
+            report(f"Checkpoint at {recorded.last_sequence} is past the end of the chain")
+        if segment.count and not checkpoints:
+            pending_checkpoints.append((segment_start, sequence, previous_hash, segment.root()))
+
+        written = []
+        if checkpoint and not error_count:
+            written = LedgerCheckpoint.objects.bulk_create(
+                [
+                    LedgerCheckpoint(
+                        ledger=ledger,
+                        first_sequence=first_sequence,
+                        last_sequence=last_sequence,
+                        last_hash=last_hash,
+                        merkle_root=root,
+                    )
+                    for first_sequence, last_sequence, last_hash, root in pending_checkpoints
+                ],
+                ignore_conflicts=True,
+            )
+
+        return {
+            'ledger': ledger.name,
+            'start': start,
+            'verified': verified,
+            'errors': errors,
+            'error_count': error_count,
+            'checkpoints': len(written),
+        }
@@ -0,0 +1,373 @@
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from economic.models import EconomicTransaction, InventoryLine, Ledger, ResourceInventory
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:economic_transaction_patterns]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class LedgerError(ValueError):
+    """A ledger change that cannot be applied."""
+
+
+class InsufficientResources(LedgerError):
+    """An inventory holds less of a resource than is being taken from it."""
+
+
+class CapacityExceeded(LedgerError):
+    """An inventory would hold more than its max_capacity."""
+
+
+class LedgerService:
+    """
+    Applies resource changes to inventories atomically.
+
+    Inventories are locked with SELECT ... FOR UPDATE in primary key order,
+    so concurrent changes touching the same inventories queue up instead of
+    deadlocking. Quantities live in InventoryLine rows and capacity is
+    checked against each inventory's running total_quantity.
+    """
+
+    @staticmethod
+    def lock_inventories(inventory_ids, missing_ok=False):
+        """
+        Lock inventories for the rest of the current transaction.
+
+        Args:
+            inventory_ids: The ResourceInventory IDs
+            missing_ok: Whether to leave out missing inventories rather than raise
+
+        Returns:
+            Dict: ResourceInventory objects by ID
+        """
+        inventories = {
+            inventory.pk: inventory
+            for inventory in ResourceInventory.objects.select_for_update().filter(
+                pk__in=set(inventory_ids)
+            ).order_by('pk')
+        }
+        missing = set(inventory_ids) - set(inventories)
+        if missing and not missing_ok:
+            raise ValueError(f"Resource inventories {sorted(map(str, missing))} do not exist")
+        return inventories
+
+    @staticmethod
+    def load_quantities(changes):
+        """
+        Load the held quantities of the resources a set of changes touches.
+
+        Args:
+            changes: Dict of inventory ID to a dict of resource_code: quantity delta
+
+        Returns:
+            Dict: Inventory ID to a dict of resource_code: held quantity
+        """
+        held = {inventory_id: {} for inventory_id in changes}
+        resource_codes = {code for inventory_changes in changes.values() for code in inventory_changes}
+        lines = InventoryLine.objects.filter(
+            inventory_id__in=list(changes), resource_code__in=resource_codes
+        ).values_list('inventory_id', 'resource_code', 'quantity')
+        for inventory_id, resource_code, quantity in lines:
+            held[inventory_id][resource_code] = quantity
+        return held
+
+    @staticmethod
+    def compute_balances(inventory, changes, held):
+        """
+        Work out an inventory's quantities and total after a set of changes.
+
+        Args:
+            inventory: The locked ResourceInventory
+            changes: Dict of resource_code: quantity delta
+            held: Dict of resource_code: held quantity for the changed resources
+
+        Returns:
+            Tuple: Dict of the new resource_code: quantity pairs for the changed
+                resources (0 once emptied), and the new total quantity
+        """
+        quantities = {}
+        for resource_code, delta in changes.items():
+            quantity = held.get(resource_code, 0) + delta
+            if quantity < 0:
+                raise InsufficientResources(
+                    f"Inventory {inventory.pk} holds {held.get(resource_code, 0)} {resource_code}, "
+                    f"{-delta} needed"
+                )
+            quantities[resource_code] = quantity
+
+        added = sum(changes.values())
+        total = inventory.total_quantity + added
+        if added > 0 and total > inventory.max_capacity:
+            raise CapacityExceeded(
+                f"Inventory {inventory.pk} would hold {total} of {inventory.max_capacity}"
+            )
+        return quantities, total
+
+    @staticmethod
+    def write_lines(balances):
+        """
+        Write new quantities to inventory lines, deleting emptied ones.
+
+        Args:
+            balances: Dict of inventory ID to a dict of resource_code: quantity
+        """
+        kept = []
+        emptied = Q()
+        for inventory_id, quantities in balances.items():
+            for resource_code, quantity in quantities.items():
+                if quantity:
+                    kept.append(InventoryLine(
+                        inventory_id=inventory_id, resource_code=resource_code, quantity=quantity
+                    ))
+                else:
+                    emptied |= Q(inventory_id=inventory_id, resource_code=resource_code)
+
+        if kept:
+            InventoryLine.objects.bulk_create(
+                kept,
+                update_conflicts=True,
+                unique_fields=['inventory', 'resource_code'],
+                update_fields=['quantity'],
+            )
+        if emptied:
+            InventoryLine.objects.filter(emptied).delete()
+
+    @staticmethod
+    def apply_changes(changes, transaction_id=None):
+        """
+        Apply resource changes to several inventories, all or nothing.
+
+        Must be called inside a transaction; the inventories stay locked
+        until it ends.
+
+        Args:
+            changes: Dict of inventory ID to a dict of resource_code: quantity delta
+            transaction_id: Optional EconomicTransaction ID to record as each
+                inventory's last transaction
+
+        Returns:
+            Dict: The updated ResourceInventory objects by ID
+        """
+        inventories = LedgerService.lock_inventories(changes)
+        held = LedgerService.load_quantities(changes)
+        balances = {}
+        totals = {}
+        for inventory_id, inventory_changes in changes.items():
+            balances[inventory_id], totals[inventory_id] = LedgerService.compute_balances(
+                inventories[inventory_id], inventory_changes, held[inventory_id]
+            )
+
+        LedgerService.write_lines(balances)
+
+        now = timezone.now()
+        for inventory_id, total in totals.items():
+            fields = {'total_quantity': total, 'last_updated': now}
+            if transaction_id is not None:
+                fields['last_transaction_id'] = transaction_id
+            ResourceInventory.objects.filter(pk=inventory_id).update(**fields)
+
+            inventory = inventories[inventory_id]
+            for name, value in fields.items():
+                setattr(inventory, name, value)
+        return inventories
+
+    @staticmethod
+    def lock_ledgers(names):
+        """
+        Lock ledger heads for the rest of the current transaction, creating
+        any that do not exist yet.
+
+        Args:
+            names: The ledger names
+
+        Returns:
+            Dict: Ledger objects by name
+        """
+        names = sorted(set(names))
+        ledgers = {
+            ledger.name: ledger
+            for ledger in Ledger.objects.select_for_update().filter(name__in=names).order_by('name')
+        }
+        missing = [name for name in names if name not in ledgers]
+        if missing:
+            Ledger.objects.bulk_create([Ledger(name=name) for name in missing], ignore_conflicts=True)
+            ledgers.update(
+                (ledger.name, ledger)
+                for ledger in Ledger.objects.select_for_update().filter(name__in=missing).order_by('name')
+            )
+        return ledgers
+
+    @staticmethod
+    def inventory_ledger(inventory_id):
+        """
+        Get the name of an inventory's own ledger.
+
+        Args:
+            inventory_id: The ResourceInventory ID
+
+        Returns:
+            str: The ledger name
+        """
+        return f'inventory-{inventory_id}'
+
+    @staticmethod
+    def chain_transactions(transactions):
+        """
+        Append completed transactions to their ledgers' hash chains.
+
+        Sets each transaction's ledger_sequence, prev_hash and
+        transaction_hash in the order given and moves the ledger heads on;
+        the caller saves the transactions. Must be called inside a
+        transaction, after the inventories are locked.
+
+        A transaction without a ledger name goes into the ledger of its
+        source inventory (its destination's when it has no source). That
+        inventory is already locked, so the head adds no contention of its
+        own.
+
+        Args:
+            transactions: Completed EconomicTransaction objects
+        """
+        if not transactions:
+            return
+        for economic_transaction in transactions:
+            if not economic_transaction.ledger:
+                economic_transaction.ledger = LedgerService.inventory_ledger(
+                    economic_transaction.source_inventory_id or economic_transaction.destination_inventory_id
+                )
+        ledgers = LedgerService.lock_ledgers(
+            economic_transaction.ledger for economic_transaction in transactions
+        )
+        for economic_transaction in transactions:
+            ledger = ledgers[economic_transaction.ledger]
+            economic_transaction.ledger_sequence = ledger.last_sequence + 1
+            economic_transaction.prev_hash = ledger.last_hash
+            economic_transaction.generate_hash(save=False)
+            ledger.last_sequence = economic_transaction.ledger_sequence
+            ledger.last_hash = economic_transaction.transaction_hash
+
+        now = timezone.now()
+        for ledger in ledgers.values():
+            ledger.updated_at = now
+        Ledger.objects.bulk_update(list(ledgers.values()), ['last_sequence', 'last_hash', 'updated_at'])
+
+    @staticmethod
+    def sync_inventory(inventory, locked, changes):
+        """
+        Bring an inventory instance in line with a change applied to it.
+
+        Args:
+            inventory: The caller's ResourceInventory
+            locked: The ResourceInventory returned by apply_changes
+            changes: Dict of resource_code: quantity delta that was applied
+        """
+        inventory.total_quantity = locked.total_quantity
+        inventory.last_updated = locked.last_updated
+        inventory.last_transaction_id = locked.last_transaction_id
+        for loaded in (inventory._resources, inventory._stored_resources):
+            if loaded is None:
+                continue
+            for resource_code, delta in changes.items():
+                quantity = loaded.get(resource_code, 0) + delta
+                if quantity:
+                    loaded[resource_code] = quantity
+                else:
+                    loaded.pop(resource_code, None)
+
+    @staticmethod
+    def holders_of(resource_code, min_quantity=1):
+        """
+        Get the inventories holding at least a quantity of a resource.
+
+        Args:
+            resource_code: The resource code
+            min_quantity: The smallest quantity to count as holding it
+
+        Returns:
+            QuerySet: InventoryLine objects, largest holdings first
+        """
+        return InventoryLine.objects.filter(
+            resource_code=resource_code, quantity__gte=min_quantity
+        ).order_by('-quantity', 'inventory_id')
+
+    @staticmethod
+    def top_holders(resource_code, limit=10):
+        """
+        Get the largest holders of a resource.
+
+        Args:
+            resource_code: The resource code
+            limit: How many holders to return
+
+        Returns:
+            List[Tuple]: (inventory ID, quantity) pairs, largest first
+        """
+        return list(
+            LedgerService.holders_of(resource_code).values_list('inventory_id', 'quantity')[:limit]
+        )
+
+    @staticmethod
+    def transfer(source, destination, resources, transaction_type='transfer', value=0, **details):
+        """
+        Move resources between two inventories and record the transaction.
+
+        Both inventories are changed and the completed EconomicTransaction is
+        written in one database transaction; nothing is written if either
+        change is invalid.
+
+        Args:
+            source: The ResourceInventory giving the resources
+            destination: The ResourceInventory receiving them
+            resources: Dict of resource_code: quantity pairs to move
+            transaction_type: One of EconomicTransaction.TRANSACTION_TYPE_CHOICES
+            value: The value of the transaction
+            **details: Other EconomicTransaction fields, e.g. context_description
+
+        Returns:
+            EconomicTransaction: The completed transaction
+        """
+        if source.pk == destination.pk:
+            raise ValueError("Cannot transfer resources within one inventory")
+        if not resources or any(quantity <= 0 for quantity in resources.values()):
+            raise ValueError("Transfer quantities must be positive")
+
+        now = timezone.now()
+        economic_transaction = EconomicTransaction(
+            transaction_type=transaction_type,
+            resources=resources,
+            value=value,
+            status='completed',
+            source_content_type_id=source.content_type_id,
+            source_object_id=source.object_id,
+            destination_content_type_id=destination.content_type_id,
+            destination_object_id=destination.object_id,
+            source_inventory_id=source.pk,
+            destination_inventory_id=destination.pk,
+            initiated_at=now,
+            processed_at=now,
+            completed_at=now,
+            **details
+        )
+
+        with transaction.atomic():
+            inventories = LedgerService.apply_changes(
+                {
+                    source.pk: {code: -quantity for code, quantity in resources.items()},
+                    destination.pk: dict(resources),
+                },
+                transaction_id=economic_transaction.pk,
+            )
+            LedgerService.chain_transactions([economic_transaction])
+            economic_transaction.save(force_insert=True)
+
+        LedgerService.sync_inventory(
+            source, inventories[source.pk], {code: -quantity for code, quantity in resources.items()}
+        )
+        LedgerService.sync_inventory(destination, inventories[destination.pk], resources)
+        return economic_transaction
@@ -0,0 +1,178 @@
+from django.db import transaction
+from django.utils import timezone
+
+from economic.models import EconomicTransaction, ResourceInventory
+from economic.services.ledger import LedgerError, LedgerService
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:CHECK_PATTERN:economic_transaction_patterns]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+SETTLEABLE_STATUSES = ('pending', 'processing')
+
+# Rows per UPDATE when writing settled transactions and inventories
+SETTLEMENT_BATCH_SIZE = 1000
+
+
+class SettlementService:
+    """
+    Settles many pending transactions at once.
+
+    The transactions and every inventory they touch are locked, each
+    transaction is checked in order against running in-memory balances,
+    and the resulting lines, totals and statuses are written with a
+    handful of bulk statements in a single database transaction.
+    """
+
+    @staticmethod
+    def transaction_changes(economic_transaction):
+        """
+        Get the resource changes a transaction makes to its inventories.
+
+        Args:
+            economic_transaction: The EconomicTransaction
+
+        Returns:
+            Dict: Inventory ID to a dict of resource_code: quantity delta
+        """
+        source_id = economic_transaction.source_inventory_id
+        destination_id = economic_transaction.destination_inventory_id
+        resources = economic_transaction.resources or {}
+
+        if source_id is None and destination_id is None:
+            raise LedgerError("Transaction has no source or destination inventory")
+        if source_id == destination_id:
+            raise LedgerError("Cannot transfer resources within one inventory")
+        if not resources or any(quantity <= 0 for quantity in resources.values()):
+            raise LedgerError("Transaction quantities must be positive")
+
+        changes = {}
+        if source_id is not None:
+            changes[source_id] = {code: -quantity for code, quantity in resources.items()}
+        if destination_id is not None:
+            changes[destination_id] = dict(resources)
+        return changes
+
+    @staticmethod
+    def settle(transactions):
+        """
+        Settle pending transactions, completing those the inventories can
+        cover and failing the rest.
+
+        Transactions are applied in the order given, so an earlier one can
+        fund a later one. Transactions that are no longer pending or
+        processing are reported as failed and left untouched.
+
+        Args:
+            transactions: EconomicTransaction objects or IDs
+
+        Returns:
+            Dict: 'completed' - list of completed transaction IDs,
+                'failed' - dict of transaction ID to failure reason
+        """
+        to_id = EconomicTransaction._meta.pk.to_python
+        ids = list(dict.fromkeys(to_id(getattr(item, 'pk', item)) for item in transactions))
+        completed = []
+        failed = {}
+
+        with transaction.atomic():
+            locked = {
+                economic_transaction.pk: economic_transaction
+                for economic_transaction in EconomicTransaction.objects.select_for_update().filter(
+                    pk__in=ids, status__in=SETTLEABLE_STATUSES
+                ).order_by('pk')
+            }
+
+            pending = []
+            touched = {}
+            for transaction_id in ids:
+                economic_transaction = locked.pop(transaction_id, None)
+                if economic_transaction is None:
+                    failed.setdefault(transaction_id, "Transaction is not pending")
+                    continue
+                try:
+                    changes = SettlementService.transaction_changes(economic_transaction)
+                except LedgerError as e:
+                    changes = None
+                    failed[transaction_id] = str(e)
+                pending.append((economic_transaction, changes))
+                for inventory_id, inventory_changes in (changes or {}).items():
+                    touched.setdefault(inventory_id, {}).update(dict.fromkeys(inventory_changes, 0))
+
+            # Missing inventories fail their transactions below
+            inventories = LedgerService.lock_inventories(touched, missing_ok=True)
+            held = LedgerService.load_quantities(touched)
+
+            # held and each inventory's total_quantity run forward as
+            # transactions are applied; balances collects what to write
+            balances = {inventory_id: {} for inventory_id in inventories}
+            last_transaction = {}
+
+            now = timezone.now()
+            for economic_transaction, changes in pending:
+                transaction_id = economic_transaction.pk
+                if changes is not None:
+                    try:
+                        updates = SettlementService._check(changes, inventories, held)
+                    except LedgerError as e:
+                        failed[transaction_id] = str(e)
+                    else:
+                        for inventory_id, (quantities, total) in updates.items():
+                            balances[inventory_id].update(quantities)
+                            held[inventory_id].update(quantities)
+                            inventories[inventory_id].total_quantity = total
+                            last_transaction[inventory_id] = transaction_id
+
+                if transaction_id in failed:
+                    economic_transaction.mark_failed(failed[transaction_id], save=False)
+                else:
+                    economic_transaction.processed_at = economic_transaction.processed_at or now
+                    economic_transaction.mark_completed(save=False)
+                    completed.append(economic_transaction)
+                economic_transaction.updated_at = now
+
+            LedgerService.write_lines({
+                inventory_id: quantities for inventory_id, quantities in balances.items() if quantities
+            })
+
+            changed = []
+            for inventory_id in last_transaction:
+                inventory = inventories[inventory_id]
+                inventory.last_updated = now
+                inventory.last_transaction_id = last_transaction[inventory_id]
+                changed.append(inventory)
+            ResourceInventory.objects.bulk_update(
+                changed,
+                ['total_quantity', 'last_updated', 'last_transaction_id'],
+                batch_size=SETTLEMENT_BATCH_SIZE,
+            )
+
+            LedgerService.chain_transactions(completed)
+            EconomicTransaction.objects.bulk_update(
+                [economic_transaction for economic_transaction, _changes in pending],
+                [
+                    'status', 'processed_at', 'completed_at', 'notes', 'updated_at',
+                    'ledger', 'ledger_sequence', 'prev_hash', 'transaction_hash',
+                ],
+                batch_size=SETTLEMENT_BATCH_SIZE,
+            )
+
+        return {
+            'completed': [economic_transaction.pk for economic_transaction in completed],
+            'failed': failed,
+        }
+
+    @staticmethod
+    def _check(changes, inventories, held):
+        """Validate one transaction's changes against the running balances."""
+        updates = {}
+        for inventory_id, inventory_changes in changes.items():
+            if inventory_id not in inventories:
+                raise LedgerError(f"Resource inventory {inventory_id} does not exist")
+            updates[inventory_id] = LedgerService.compute_balances(
+                inventories[inventory_id], inventory_changes, held[inventory_id]
+            )
+        return updates
@@ -0,0 +1,170 @@
+import bisect
+import threading
+import uuid
+from itertools import repeat
+
+from django.core.cache import cache
+
+from core.services.on_commit import get_transaction_snapshot, queue_on_commit
+from economic.models import WealthClass
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+WEALTH_CLASSES_VERSION_CACHE_KEY = 'economic:wealth_classes:version'
+
+_classifier_lock = threading.Lock()
+_compiled_classifier = None
+
+
+class WealthClassifier:
+    """
+    Compiled snapshot of the active wealth classes.
+
+    Classes are sorted by wealth_threshold so the classes a wealth value
+    reaches are found by bisection. For each such prefix the classes are
+    kept in level order, highest first, with their asset requirements as
+    tuples to check, up to the first class without requirements, which is
+    the answer whenever none of those before it match.
+
+    The WealthClass objects are shared by every caller and must not be
+    modified.
+    """
+
+    def __init__(self, wealth_classes, version=None):
+        """
+        Compile a classifier.
+
+        Args:
+            wealth_classes: Active WealthClass objects, highest level first
+            version: The class table version this snapshot was compiled for
+        """
+        self.classes = tuple(wealth_classes)
+        self.version = version
+        # Lowest level class, for wealth that qualifies for nothing
+        self.fallback = self.classes[-1] if self.classes else None
+
+        by_threshold = sorted(range(len(self.classes)), key=lambda i: (self.classes[i].wealth_threshold, i))
+        self._thresholds = [self.classes[i].wealth_threshold for i in by_threshold]
+        requirements = [tuple(sorted(wealth_class.asset_requirements.items())) for wealth_class in self.classes]
+
+        # Indexed by how many thresholds a wealth value reaches
+        self._checks = []
+        self._defaults = []
+        for reached in range(len(self.classes) + 1):
+            checks = []
+            default = self.fallback
+            for i in sorted(by_threshold[:reached]):
+                if not requirements[i]:
+                    default = self.classes[i]
+                    break
+                checks.append((self.classes[i], requirements[i]))
+            self._checks.append(tuple(checks))
+            self._defaults.append(default)
+
+    @classmethod
+    def load(cls, version=None):
+        """
+        Compile a classifier from the database in one query.
+
+        Args:
+            version: The class table version to tag the snapshot with
+
+        Returns:
+            WealthClassifier: The compiled classifier
+        """
+        return cls(WealthClass.objects.filter(is_active=True).order_by('-level'), version=version)
+
+    def _resolve(self, reached, assets):
+        for wealth_class, requirements in self._checks[reached]:
+            if all(assets.get(resource_code, 0) >= amount for resource_code, amount in requirements):
+                return wealth_class
+        return self._defaults[reached]
+
+    def classify(self, wealth_value, assets=None):
+        """
+        Get the highest level class a wealth value and assets qualify for.
+
+        Args:
+            wealth_value: The wealth value
+            assets: Optional dict of resource_code: quantity held
+
+        Returns:
+            WealthClass: The matching class, the lowest level class when none
+                match, or None when there are no active classes
+        """
+        return self._resolve(bisect.bisect_right(self._thresholds, wealth_value), assets or {})
+
+    def classify_many(self, wealth_values, assets=None):
+        """
+        Classify many wealth values at once.
+
+        Args:
+            wealth_values: Sequence of wealth values
+            assets: Optional sequence of asset dicts, one per wealth value
+
+        Returns:
+            List[WealthClass]: The class for each wealth value, in order
+        """
+        thresholds = self._thresholds
+        resolve = self._resolve
+        return [
+            resolve(bisect.bisect_right(thresholds, wealth_value), holdings or {})
+            for wealth_value, holdings in zip(wealth_values, repeat(None) if assets is None else assets)
+        ]
+
+
+def get_wealth_classes_version():
+    """
+    Get the current wealth class table version from the shared cache.
+
+    Returns:
+        str: The version token, created on first use
+    """
+    version = cache.get(WEALTH_CLASSES_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(WEALTH_CLASSES_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(WEALTH_CLASSES_VERSION_CACHE_KEY)
+    return version
+
+
+def _bump_version():
+    global _compiled_classifier
+    cache.set(WEALTH_CLASSES_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    _compiled_classifier = None
+
+
+def invalidate_wealth_classifier():
+    """
+    Bump the class table version so every process recompiles on next access.
+
+    The bump is deferred to commit; until then this connection uses an
+    uncached classifier that sees its own writes.
+    """
+    queue_on_commit(WEALTH_CLASSES_VERSION_CACHE_KEY, _bump_version)
+
+
+def get_wealth_classifier():
+    """
+    Get the compiled wealth classifier, recompiling it if the version changed.
+
+    Returns:
+        WealthClassifier: The process-wide compiled classifier
+    """
+    global _compiled_classifier
+    classifier = get_transaction_snapshot(WEALTH_CLASSES_VERSION_CACHE_KEY, WealthClassifier.load)
+    if classifier is not None:
+        return classifier
+
+    version = get_wealth_classes_version()
+    classifier = _compiled_classifier
+    if classifier is None or classifier.version != version:
+        with _classifier_lock:
+            classifier = _compiled_classifier
+            if classifier is None or classifier.version != version:
+                classifier = WealthClassifier.load(version=version)
+                _compiled_classifier = classifier
+    return classifier
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from economic.models import WealthClass
+from economic.services.wealth import invalidate_wealth_classifier
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+@receiver(post_save, sender=WealthClass)
+@receiver(post_delete, sender=WealthClass)
+def invalidate_wealth_classifier_on_class_change(sender, **kwargs):
+    """Recompile the wealth classifier when a class is added, edited or removed."""
+    invalidate_wealth_classifier()
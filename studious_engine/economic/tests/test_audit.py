@@ -0,0 +1,126 @@
+import hashlib
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from economic.models import EconomicTransaction, Ledger, LedgerCheckpoint
+from economic.services import AuditService, LedgerService, SettlementService, merkle_root
+from economic.tests.test_ledger import make_inventory
+from economic.tests.test_settlement import make_transaction
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+def _pair(left, right):
+    return hashlib.sha256(bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+class TransactionHashTests(TestCase):
+    """Tests for canonical transaction hashes and the per-ledger chain."""
+
+    def setUp(self):
+        self.source = make_inventory({'wood': 50, 'stone': 50})
+        self.destination = make_inventory()
+
+    def test_hash_is_canonical(self):
+        """Test the hash does not depend on resource ordering and survives a round trip."""
+        record = LedgerService.transfer(self.source, self.destination, {'wood': 2, 'stone': 3})
+        stored = EconomicTransaction.objects.get(pk=record.pk)
+        self.assertEqual(stored.compute_hash(), record.transaction_hash)
+
+        stored.resources = {'stone': 3, 'wood': 2}
+        self.assertEqual(stored.compute_hash(), record.transaction_hash)
+        stored.resources = {'stone': 2, 'wood': 3}
+        self.assertNotEqual(stored.compute_hash(), record.transaction_hash)
+
+    def test_transactions_chained_per_ledger(self):
+        """Test transfers and settlements extend their own ledger's chain."""
+        first = LedgerService.transfer(self.source, self.destination, {'wood': 1})
+        other = LedgerService.transfer(self.source, self.destination, {'wood': 1}, ledger='rewards')
+        pending = make_transaction(self.source, self.destination, {'stone': 4})
+        SettlementService.settle([pending])
+
+        ledger = LedgerService.inventory_ledger(self.source.pk)
+        chain = list(
+            EconomicTransaction.objects.filter(ledger=ledger).order_by('ledger_sequence')
+            .values_list('ledger_sequence', 'prev_hash', 'transaction_hash')
+        )
+        self.assertEqual([sequence for sequence, _prev, _hash in chain], [1, 2])
+        self.assertEqual(chain[0][1], '')
+        self.assertEqual(chain[1][1], first.transaction_hash)
+        self.assertEqual(Ledger.objects.get(name=ledger).last_hash, chain[1][2])
+        self.assertEqual(EconomicTransaction.objects.get(pk=other.pk).ledger_sequence, 1)
+
+    def test_merkle_root(self):
+        """Test odd subtrees are promoted rather than duplicated."""
+        a, b, c = (hashlib.sha256(letter.encode()).hexdigest() for letter in 'abc')
+        self.assertEqual(merkle_root([]), '')
+        self.assertEqual(merkle_root([a]), a)
+        self.assertEqual(merkle_root([a, b]), _pair(a, b))
+        self.assertEqual(merkle_root([a, b, c]), _pair(_pair(a, b), c))
+
+
+class VerifyLedgerTests(TestCase):
+    """Tests for incremental ledger verification and checkpoints."""
+
+    def setUp(self):
+        self.source = make_inventory({'coin': 100})
+        self.destination = make_inventory()
+        self.ledger = LedgerService.inventory_ledger(self.source.pk)
+
+    def transfer(self, count):
+        return [LedgerService.transfer(self.source, self.destination, {'coin': 1}) for _ in range(count)]
+
+    def test_verifies_from_last_checkpoint(self):
+        """Test each run checkpoints what it verified and the next starts after it."""
+        records = self.transfer(5)
+        result = AuditService.verify_ledger(self.ledger, checkpoint_interval=2)
+        self.assertEqual((result['verified'], result['error_count'], result['checkpoints']), (5, 0, 3))
+
+        checkpoints = list(LedgerCheckpoint.objects.values_list('first_sequence', 'last_sequence', 'merkle_root'))
+        self.assertEqual(checkpoints[0], (1, 2, merkle_root(r.transaction_hash for r in records[:2])))
+        self.assertEqual(checkpoints[2][:2], (5, 5))
+
+        self.transfer(2)
+        result = AuditService.verify_ledger(self.ledger)
+        self.assertEqual((result['start'], result['verified'], result['error_count']), (6, 2, 0))
+
+        with self.assertNumQueries(3):
+            result = AuditService.verify_ledger(self.ledger, checkpoint=False)
+        self.assertEqual(result['verified'], 0)
+
+    def test_detects_tampering(self):
+        """Test edited rows and checkpoints are reported and block new checkpoints."""
+        records = self.transfer(4)
+        AuditService.verify_ledger(self.ledger, checkpoint_interval=2)
+
+        EconomicTransaction.objects.filter(pk=records[2].pk).update(resources={'coin': 50})
+        result = AuditService.verify_ledger(self.ledger)
+        self.assertEqual(result['error_count'], 0)
+        result = AuditService.verify_ledger(self.ledger, full=True)
+        self.assertEqual(result['errors'], [f"Transaction {records[2].pk} at 3 does not match its hash"])
+
+        EconomicTransaction.objects.filter(pk=records[2].pk).update(resources={'coin': 1})
+        LedgerCheckpoint.objects.filter(last_sequence=2).update(merkle_root='0' * 64)
+        result = AuditService.verify_ledger(self.ledger, full=True)
+        self.assertEqual(result['errors'], ["Checkpoint at 2 does not match the transactions it covers"])
+        self.assertEqual(result['checkpoints'], 0)
+
+    def test_command(self):
+        """Test the command reports each ledger and fails on a broken chain."""
+        records = self.transfer(3)
+        out = StringIO()
+        call_command('verify_ledger', stdout=out)
+        self.assertIn(f'{self.ledger}: verified 3 transactions from 1, wrote 1 checkpoints', out.getvalue())
+
+        EconomicTransaction.objects.filter(pk=records[1].pk).delete()
+        with self.assertRaises(CommandError):
+            call_command('verify_ledger', '--full', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('verify_ledger', '--ledger', 'missing', stdout=StringIO())
@@ -0,0 +1,78 @@
+from django.test import TestCase
+
+from economic.models import InventoryLine, ResourceInventory
+from economic.services import LedgerService
+from economic.tests.test_ledger import make_inventory
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+class InventoryLineTests(TestCase):
+    """Tests for per-resource inventory lines and the running total."""
+
+    def setUp(self):
+        self.inventory = make_inventory({'wood': 10, 'stone': 4, 'clay': 0}, max_capacity=100)
+
+    def lines(self, inventory):
+        return dict(InventoryLine.objects.filter(inventory=inventory).values_list('resource_code', 'quantity'))
+
+    def test_created_with_resources(self):
+        """Test resources passed on creation become lines and the total."""
+        self.assertEqual(self.lines(self.inventory), {'wood': 10, 'stone': 4})
+        inventory = ResourceInventory.objects.get(pk=self.inventory.pk)
+        self.assertEqual(inventory.total_quantity, 14)
+        self.assertEqual(inventory.resources, {'wood': 10, 'stone': 4})
+
+    def test_resources_saved_back_to_lines(self):
+        """Test assigning or editing resources in place is written on save."""
+        inventory = ResourceInventory.objects.get(pk=self.inventory.pk)
+        inventory.resources['stone'] = 6
+        inventory.save()
+        self.assertEqual(self.lines(inventory), {'wood': 10, 'stone': 6})
+
+        inventory.resources = {'wood': 3, 'iron': 2}
+        inventory.save(update_fields=['max_capacity'])
+        self.assertEqual(self.lines(inventory), {'wood': 3, 'iron': 2})
+        inventory.refresh_from_db()
+        self.assertEqual(inventory.total_quantity, 5)
+        self.assertEqual(inventory.resources, {'wood': 3, 'iron': 2})
+
+    def test_capacity_checked_against_total(self):
+        """Test capacity checks read the running total rather than every line."""
+        inventory = ResourceInventory.objects.get(pk=self.inventory.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(inventory.total_resources, 14)
+            self.assertAlmostEqual(inventory.capacity_used_percentage, 14)
+
+        self.assertTrue(inventory.add_resource('wood', 86))
+        self.assertFalse(inventory.add_resource('iron', 1))
+        self.assertTrue(inventory.remove_resource('stone', 4))
+        self.assertEqual(inventory.total_quantity, 96)
+        self.assertEqual(ResourceInventory.objects.get(pk=inventory.pk).total_quantity, 96)
+        self.assertEqual(inventory.resources, {'wood': 96})
+
+    def test_prefetched_lines(self):
+        """Test resources come from prefetched lines without further queries."""
+        make_inventory({'wood': 2})
+        with self.assertNumQueries(2):
+            inventories = list(ResourceInventory.objects.prefetch_related('lines'))
+            self.assertEqual(sum(inventory.resources.get('wood', 0) for inventory in inventories), 12)
+            self.assertTrue(all(inventory.has_resource('wood') for inventory in inventories))
+
+    def test_holders(self):
+        """Test the holders of a resource are found from the lines, largest first."""
+        second = make_inventory({'wood': 25})
+        make_inventory({'wood': 1, 'stone': 9})
+
+        self.assertEqual(
+            LedgerService.top_holders('wood', limit=2),
+            [(second.pk, 25), (self.inventory.pk, 10)],
+        )
+        self.assertEqual(
+            [line.inventory_id for line in LedgerService.holders_of('stone', min_quantity=5)],
+            [ResourceInventory.objects.get(lines__resource_code='stone', lines__quantity=9).pk],
+        )
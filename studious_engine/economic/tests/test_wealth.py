@@ -0,0 +1,90 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from economic.models import WealthClass
+from economic.services import WealthClassifier, get_wealth_classifier
+
+# [REF:45a8e9b3-c1d2-e3f4-a5b6-c7d8e9f0a1b2:ECONOMIC_SYSTEM]
+# [CLAUDE:OPTIMIZATION_LAYER:START]
+# This file is part of the economic_system component
+# See .claude/README.md for more information
+# [CLAUDE:OPTIMIZATION_LAYER:END]
+
+
+def reference_class(wealth_value, assets):
+    """The original level-by-level scan, for comparison."""
+    for wealth_class in WealthClass.objects.filter(is_active=True).order_by('-level'):
+        if wealth_value < wealth_class.wealth_threshold:
+            continue
+        if all(assets.get(code, 0) >= amount for code, amount in wealth_class.asset_requirements.items()):
+            return wealth_class
+    return WealthClass.objects.filter(is_active=True).order_by('level').first()
+
+
+class WealthClassifierTests(TransactionTestCase):
+    """Tests for the compiled, cached wealth classifier."""
+
+    def setUp(self):
+        cache.clear()
+        for level, threshold, requirements in [
+            (1, 0, {}),
+            (2, 100, {}),
+            (3, 500, {'land': 1}),
+            (4, 400, {}),
+            (5, 2000, {'land': 2, 'gold': 10}),
+            (6, 5000, {'gold': 50}),
+        ]:
+            WealthClass.objects.create(
+                name=f'Class {level}', description='', level=level,
+                wealth_threshold=threshold, asset_requirements=requirements,
+            )
+        WealthClass.objects.create(name='Retired', description='', level=7, wealth_threshold=0, is_active=False)
+
+    def test_matches_level_scan(self):
+        """Test classification agrees with scanning classes from the highest level down."""
+        holdings = [None, {}, {'land': 1}, {'land': 2, 'gold': 10}, {'gold': 60}, {'land': 5, 'gold': 100}]
+        wealth_values = [0, 99, 100, 399, 400, 500, 1999, 2000, 4999, 5000, 10 ** 6]
+
+        classifier = get_wealth_classifier()
+        for assets in holdings:
+            expected = [reference_class(wealth, assets or {}) for wealth in wealth_values]
+            self.assertEqual([classifier.classify(wealth, assets) for wealth in wealth_values], expected)
+            self.assertEqual(classifier.classify_many(wealth_values, [assets] * len(wealth_values)), expected)
+
+        self.assertEqual(classifier.classify(-5).level, 1)
+        self.assertEqual([c.level for c in classifier.classify_many([50, 450, 9000])], [1, 4, 4])
+
+    def test_cached_until_classes_change(self):
+        """Test the table is loaded once and reloaded after a class changes."""
+        classifier = get_wealth_classifier()
+        with self.assertNumQueries(0):
+            self.assertIs(get_wealth_classifier(), classifier)
+            self.assertEqual(WealthClass.determine_class(450).level, 4)
+
+        WealthClass.objects.get(level=4).delete()
+        self.assertIsNot(get_wealth_classifier(), classifier)
+        self.assertEqual(WealthClass.determine_class(450).level, 2)
+
+    def test_uncommitted_changes_seen_by_own_connection(self):
+        """Test a transaction classifies against its own uncommitted class changes."""
+        classifier = get_wealth_classifier()
+        with transaction.atomic():
+            sixth = WealthClass.objects.get(level=6)
+            sixth.is_active = False
+            sixth.save()
+
+            self.assertEqual(WealthClass.determine_class(9000, {'gold': 60}).level, 4)
+            uncommitted = get_wealth_classifier()
+            with self.assertNumQueries(0):
+                self.assertIs(get_wealth_classifier(), uncommitted)
+            self.assertEqual(uncommitted.classify(9000, {'gold': 60}).level, 4)
+            self.assertEqual(classifier.classify(9000, {'gold': 60}).level, 6)
+
+        self.assertEqual(WealthClass.determine_class(9000, {'gold': 60}).level, 4)
+
+    def test_no_classes(self):
+        """Test an empty class table classifies everything as None."""
+        classifier = WealthClassifier([])
+        self.assertIsNone(classifier.classify(100))
+        self.assertEqual(classifier.classify_many([1, 2]), [None, None])
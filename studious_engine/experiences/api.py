@@ -17,6 +17,8 @@ from .serializers import (
     ExperienceInstanceListSerializer, ExperienceInstanceDetailSerializer,
     ExperienceParticipationListSerializer, ExperienceParticipationDetailSerializer
 )
+from core.api.mixins import EagerLoadingViewSetMixin
+from core.api.pagination import KeysetPagination
 from core.models import PlayerProfile as Player
 
 # [REF:22c3d4e5-f6a7-b8c9-d0e1-f2a3b4c5d6e7:EXPERIENCE_SYSTEM]
@@ -28,7 +30,7 @@ from core.models import PlayerProfile as Player
 # [CLAUDE:OPTIMIZATION_LAYER:END]
 
 
-class PowerViewSet(viewsets.ModelViewSet):
+class PowerViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for Power objects"""
     queryset = Power.objects.all()
     permission_classes = [permissions.IsAuthenticated]
@@ -65,7 +67,7 @@ class PowerViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class PlayerPowerViewSet(viewsets.ModelViewSet):
+class PlayerPowerViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for PlayerPower objects"""
     queryset = PlayerPower.objects.all()
     permission_classes = [permissions.IsAuthenticated]
@@ -100,10 +102,12 @@ class PlayerPowerViewSet(viewsets.ModelViewSet):
             serializer.save()
 
 
-class ExperienceViewSet(viewsets.ModelViewSet):
+class ExperienceViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for Experience objects"""
     queryset = Experience.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = '-created_at'
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -141,7 +145,7 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class PlayerExperienceViewSet(viewsets.ModelViewSet):
+class PlayerExperienceViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for PlayerExperience objects"""
     queryset = PlayerExperience.objects.all()
     permission_classes = [permissions.IsAuthenticated]
@@ -176,7 +180,7 @@ class PlayerExperienceViewSet(viewsets.ModelViewSet):
             serializer.save(started_at=timezone.now())
 
 
-class ExperienceInstanceViewSet(viewsets.ModelViewSet):
+class ExperienceInstanceViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for ExperienceInstance objects"""
     queryset = ExperienceInstance.objects.all()
     permission_classes = [permissions.IsAuthenticated]
@@ -329,10 +333,12 @@ class ExperienceInstanceViewSet(viewsets.ModelViewSet):
         })
 
 
-class ExperienceParticipationViewSet(viewsets.ModelViewSet):
+class ExperienceParticipationViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """API endpoint for ExperienceParticipation objects"""
     queryset = ExperienceParticipation.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = '-joined_at'
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.12 on 2026-10-17 21:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiences', '0003_experienceinstance_experienceparticipation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-created_at', 'id'], name='experience_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experienceparticipation',
+            index=models.Index(fields=['player', '-joined_at', 'id'], name='participation_player_idx'),
+        ),
+    ]
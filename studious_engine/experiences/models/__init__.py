@@ -141,6 +141,11 @@ class Experience(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='experience_created_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.name} ({self.get_experience_type_display()})"
 
@@ -345,6 +350,9 @@ class ExperienceParticipation(models.Model):
         verbose_name_plural = "Experience Participations"
         unique_together = [['instance', 'player']]
         ordering = ['-joined_at']
+        indexes = [
+            models.Index(fields=['player', '-joined_at', 'id'], name='participation_player_idx'),
+        ]
     
     def __str__(self):
         return f"{self.player.user.username}'s participation in {self.instance}"
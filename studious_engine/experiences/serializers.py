@@ -5,6 +5,7 @@ from .models import (
 )
 from core.models import PlayerProfile as Player
 from core.serializers import PlayerProfileSerializer as PlayerSerializer
+from core.serializers.eager_loading import EagerLoadingMixin
 
 # [REF:22c3d4e5-f6a7-b8c9-d0e1-f2a3b4c5d6e7:EXPERIENCE_SYSTEM]
 # [CLAUDE:CHECK_PATTERN:matrix_flow]
@@ -22,7 +23,7 @@ class PowerListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'power_type', 'rarity', 'complexity', 'sector', 'is_public']
 
 
-class PowerDetailSerializer(serializers.ModelSerializer):
+class PowerDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     prerequisites = PowerListSerializer(many=True, read_only=True)
     
     class Meta:
@@ -33,7 +34,7 @@ class PowerDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class PlayerPowerSerializer(serializers.ModelSerializer):
+class PlayerPowerSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     power = PowerListSerializer(read_only=True)
     power_id = serializers.PrimaryKeyRelatedField(
         queryset=Power.objects.all(), 
@@ -59,7 +60,7 @@ class ExperienceListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExperienceDetailSerializer(serializers.ModelSerializer):
+class ExperienceDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     required_powers = PowerListSerializer(many=True, read_only=True)
     prerequisite_experiences = ExperienceListSerializer(many=True, read_only=True)
     
@@ -76,7 +77,7 @@ class ExperienceDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class PlayerExperienceSerializer(serializers.ModelSerializer):
+class PlayerExperienceSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     experience = ExperienceListSerializer(read_only=True)
     experience_id = serializers.PrimaryKeyRelatedField(
         queryset=Experience.objects.all(),
@@ -94,7 +95,7 @@ class PlayerExperienceSerializer(serializers.ModelSerializer):
         read_only_fields = ['started_at', 'completed_at']
 
 
-class ExperienceInstanceListSerializer(serializers.ModelSerializer):
+class ExperienceInstanceListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     experience_name = serializers.CharField(source='experience.name', read_only=True)
     host_name = serializers.CharField(source='host.user.username', read_only=True)
     
@@ -107,7 +108,7 @@ class ExperienceInstanceListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExperienceInstanceDetailSerializer(serializers.ModelSerializer):
+class ExperienceInstanceDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     experience = ExperienceListSerializer(read_only=True)
     experience_id = serializers.PrimaryKeyRelatedField(
         queryset=Experience.objects.all(),
@@ -136,7 +137,7 @@ class ExperienceInstanceDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['current_participants', 'created_at', 'updated_at']
 
 
-class ExperienceParticipationListSerializer(serializers.ModelSerializer):
+class ExperienceParticipationListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     player_name = serializers.CharField(source='player.user.username', read_only=True)
     instance_name = serializers.CharField(source='instance.name', read_only=True)
     
@@ -148,7 +149,7 @@ class ExperienceParticipationListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExperienceParticipationDetailSerializer(serializers.ModelSerializer):
+class ExperienceParticipationDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     instance = ExperienceInstanceListSerializer(read_only=True)
     instance_id = serializers.PrimaryKeyRelatedField(
         queryset=ExperienceInstance.objects.all(),